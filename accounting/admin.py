@@ -6,8 +6,10 @@ from .models import (
     Charge,
     ChargeAttachment,
     GeneralLedgerAccount,
+    GeneralLedgerBalance,
     GeneralLedgerTransaction,
     Invoice,
+    InvoicePaymentEvent,
     Payment,
     PaymentAttachment,
 )
@@ -40,6 +42,19 @@ class GeneralLedgerAccountAdmin(admin.ModelAdmin):
     list_filter = ["account_holder_content_type", "account_type", "sub_account_type"]
 
 
+@admin.register(GeneralLedgerBalance)
+class GeneralLedgerBalanceAdmin(admin.ModelAdmin):
+    list_display = ["gl_account", "period", "debit_amount", "credit_amount", "updated_at"]
+    list_filter = ["period"]
+
+
+@admin.register(InvoicePaymentEvent)
+class InvoicePaymentEventAdmin(admin.ModelAdmin):
+    list_display = ["idempotency_key", "invoice", "amount", "status", "created_at", "settled_at"]
+    search_fields = ["idempotency_key", "payment_intent_id"]
+    list_filter = ["status"]
+
+
 @admin.register(GeneralLedgerTransaction)
 class GeneralLedgerTransactionAdmin(admin.ModelAdmin):
     list_display = ["id", "transaction_type", "amount", "created_at"]
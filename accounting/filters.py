@@ -1,6 +1,10 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Q
 from django_filters import rest_framework as filters
 
-from .models import Charge, Invoice
+from property.models import Property, Unit
+
+from .models import Charge, GeneralLedgerBalance, Invoice
 
 
 class InvoiceFilter(filters.FilterSet):
@@ -26,3 +30,41 @@ class ChargeFilter(filters.FilterSet):
             "invoice": ["exact"],
             "created_at": ["lte", "gte"],
         }
+
+
+class GeneralLedgerBalanceFilter(filters.FilterSet):
+    start_date = filters.DateFilter(method="filter_start_date")
+    end_date = filters.DateFilter(method="filter_end_date")
+    unit = filters.NumberFilter(method="filter_unit")
+    parent_property = filters.NumberFilter(method="filter_parent_property")
+
+    class Meta:
+        model = GeneralLedgerBalance
+        fields = {
+            "gl_account": ["exact"],
+            "gl_account__account_type": ["exact"],
+        }
+
+    def filter_start_date(self, queryset, name, value):
+        return queryset.filter(period__gte=value.replace(day=1))
+
+    def filter_end_date(self, queryset, name, value):
+        return queryset.filter(period__lte=value.replace(day=1))
+
+    def filter_unit(self, queryset, name, value):
+        return queryset.filter(
+            gl_account__account_holder_content_type=ContentType.objects.get_for_model(Unit),
+            gl_account__account_holder_object_id=value,
+        )
+
+    def filter_parent_property(self, queryset, name, value):
+        return queryset.filter(
+            Q(
+                gl_account__account_holder_content_type=ContentType.objects.get_for_model(Unit),
+                gl_account__account_holder_object_id__in=Unit.objects.filter(parent_property=value).values("pk"),
+            )
+            | Q(
+                gl_account__account_holder_content_type=ContentType.objects.get_for_model(Property),
+                gl_account__account_holder_object_id=value,
+            )
+        )
@@ -1,23 +1,41 @@
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 
-from accounting.utils import create_invoice_for_unit_lease
+from accounting.utils import create_invoices_for_units
+from core.utils import chunked
 from lease.models import Lease
-from property.models import Unit
+from system_preferences.models import BusinessInformation
 
 
 class Command(BaseCommand):
     help = "Create invoices for all units"
 
-    def handle(self, *args, **kwargs):
-        leases = Lease.objects.annotate_next_invoice_date().filter(
-            status=Lease.LeaseStatus.ACTIVE,
-            next_invoice_date__date=timezone.now().date(),
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of units invoiced per batch.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Compute the invoices without writing them to the database.",
         )
-        units = Unit.objects.filter(id__in=leases.values_list("unit_id", flat=True))
-        for unit in units:
-            create_invoice_for_unit_lease(unit)
 
-        count = units.count()
+    def handle(self, *args, **kwargs):
+        chunk_size = kwargs["chunk_size"]
+        dry_run = kwargs["dry_run"]
+
+        leases = Lease.objects.due_for_invoice(timezone.now().date())
+        unit_ids = sorted(set(leases.values_list("unit_id", flat=True)))
+        business_info = BusinessInformation.objects.first()
+
+        count = 0
+        for chunk in chunked(unit_ids, chunk_size):
+            count += len(create_invoices_for_units(chunk, business_info=business_info, dry_run=dry_run))
 
-        self.stdout.write(self.style.SUCCESS(f"Successfully created invoices for {count} units"))
+        if dry_run:
+            self.stdout.write(self.style.WARNING(f"Dry run: {count} invoices would be created"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Successfully created invoices for {count} units"))
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from accounting.utils import rebuild_general_ledger_balances
+
+
+class Command(BaseCommand):
+    help = "Rebuild the monthly general ledger balances from the transactions"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of balances inserted per query.",
+        )
+
+    def handle(self, *args, **kwargs):
+        count = rebuild_general_ledger_balances(batch_size=kwargs["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Successfully rebuilt {count} general ledger balances"))
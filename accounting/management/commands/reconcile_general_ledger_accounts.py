@@ -0,0 +1,28 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from accounting.utils import GENERAL_LEDGER_ACCOUNT_TEMPLATES, provision_general_ledger_accounts
+from core.utils import chunked
+
+
+class Command(BaseCommand):
+    help = "Create the missing general ledger accounts of units, projects and inventory items"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of account holders reconciled per batch.",
+        )
+
+    def handle(self, *args, **kwargs):
+        created_count = 0
+        for model_label in GENERAL_LEDGER_ACCOUNT_TEMPLATES:
+            model = apps.get_model(model_label)
+            holder_ids = model.objects.order_by("pk").values_list("pk", flat=True)
+            for chunk in chunked(holder_ids, kwargs["chunk_size"]):
+                holders = model.objects.filter(pk__in=chunk).only("pk", "subscription")
+                created_count += len(provision_general_ledger_accounts(holders, only_missing=True))
+
+        self.stdout.write(self.style.SUCCESS(f"Successfully created {created_count} missing general ledger accounts"))
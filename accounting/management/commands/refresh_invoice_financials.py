@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from accounting.models import Invoice
+from accounting.utils import refresh_invoice_financials
+from core.utils import chunked
+
+
+class Command(BaseCommand):
+    help = "Rebuild or verify the stored financials of invoices"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of invoices refreshed per batch.",
+        )
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Report invoices with out of date financials without writing them to the database.",
+        )
+
+    def handle(self, *args, **kwargs):
+        chunk_size = kwargs["chunk_size"]
+        verify = kwargs["verify"]
+
+        invoice_ids = Invoice.objects.order_by("pk").values_list("pk", flat=True)
+        outdated_ids = []
+        for chunk in chunked(invoice_ids, chunk_size):
+            outdated_ids += [
+                invoice.pk
+                for invoice in refresh_invoice_financials(Invoice.objects.filter(pk__in=chunk), dry_run=verify)
+            ]
+
+        if not verify:
+            self.stdout.write(self.style.SUCCESS(f"Successfully refreshed financials of {len(outdated_ids)} invoices"))
+        elif outdated_ids:
+            raise CommandError(f"{len(outdated_ids)} invoices have out of date financials: {outdated_ids}")
+        else:
+            self.stdout.write(self.style.SUCCESS("All invoice financials are up to date"))
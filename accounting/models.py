@@ -2,7 +2,7 @@ from django.db import models
 from django.db.models.signals import pre_save
 from django.dispatch import receiver
 
-from core.models import BaseAttachment, CommonInfoAbstractModel
+from core.models import BaseAttachment, CommonInfoAbstractModel, SubscriptionAbstractModel, TimestampedAbstractModel
 
 from .managers import ChargeManager, InvoiceManager
 
@@ -40,9 +40,33 @@ class Invoice(CommonInfoAbstractModel):
     arrears_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
     arrear_of = models.ForeignKey("self", related_name="arrears", on_delete=models.SET_NULL, blank=True, null=True)
     total_paid_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    # Stored financials, kept current by ``accounting.signals`` and rolled forward daily by
+    # ``accounting.tasks.roll_invoice_late_fees_task``.
+    total_charges_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    recurring_charges_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    charges_and_rent = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    eligible_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    late_fee = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)
+    payable_late_fee = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)
+    payable_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    financials_updated_on = models.DateField(blank=True, null=True)
+    # Late fee posted to the general ledger by ``accounting.tasks.accrue_invoice_late_fees_task``.
+    accrued_late_fee = models.DecimalField(max_digits=10, decimal_places=2, default=0)
 
     objects = InvoiceManager()
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["subscription", "-id"], name="invoice_subscription_id_idx"),
+            models.Index(fields=["lease", "interval_end_date"], name="invoice_lease_interval_idx"),
+            models.Index(fields=["unit", "status"], name="invoice_unit_status_idx"),
+            models.Index(
+                fields=["due_date"],
+                condition=models.Q(status__in=[PaymentStatusChoices.UNPAID, PaymentStatusChoices.REJECTED]),
+                name="invoice_unpaid_due_date_idx",
+            ),
+        ]
+
     def __str__(self):
         return self.unit.name
 
@@ -91,6 +115,17 @@ class Charge(CommonInfoAbstractModel):
                 violation_error_message="Recurring Charge cannot have status and vise versa.",
             )
         ]
+        indexes = [
+            models.Index(fields=["subscription", "-id"], name="charge_subscription_id_idx"),
+            models.Index(fields=["unit", "charge_type"], name="charge_unit_type_idx"),
+            models.Index(
+                fields=["unit", "created_at"],
+                condition=models.Q(
+                    charge_type=ChargeTypeChoices.ONE_TIME, status=PaymentStatusChoices.UNPAID, invoice__isnull=True
+                ),
+                name="charge_pending_unit_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.title
@@ -231,6 +266,58 @@ class GeneralLedgerTransaction(CommonInfoAbstractModel):
         return f"{self.gl_account} - {self.amount} - {self.transaction_type}"
 
 
+class GeneralLedgerBalance(TimestampedAbstractModel, SubscriptionAbstractModel):
+    """
+    Debit and credit totals of the transactions of a GL account in one month, kept current by
+    :py:func:`accounting.utils.record_general_ledger_balances`.
+    """
+
+    gl_account = models.ForeignKey(GeneralLedgerAccount, related_name="balances", on_delete=models.CASCADE)
+    # First day of the month.
+    period = models.DateField()
+    debit_amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    credit_amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    def __str__(self):
+        return f"{self.gl_account} - {self.period:%Y-%m}"
+
+    class Meta:
+        unique_together = ("gl_account", "period")
+        indexes = [models.Index(fields=["subscription", "period"], name="gl_balance_subscription_idx")]
+
+
+class InvoicePaymentEvent(TimestampedAbstractModel):
+    """
+    A succeeded Stripe payment of an invoice, stored by the webhook and settled in bulk by
+    :py:func:`accounting.tasks.settle_invoice_payments_task`.
+    """
+
+    class StatusChoices(models.TextChoices):
+        PENDING = "PENDING", "Pending"
+        SETTLED = "SETTLED", "Settled"
+        DUPLICATE = "DUPLICATE", "Duplicate"
+
+    # ``<invoice id>:<payment intent id>``, redelivered webhooks of the same payment are ignored.
+    idempotency_key = models.CharField(max_length=255, unique=True)
+    invoice = models.ForeignKey(Invoice, related_name="payment_events", on_delete=models.CASCADE)
+    payment_intent_id = models.CharField(max_length=255)
+    amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    status = models.CharField(max_length=20, choices=StatusChoices.choices, default=StatusChoices.PENDING)
+    settled_at = models.DateTimeField(blank=True, null=True)
+
+    def __str__(self):
+        return self.idempotency_key
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["id"],
+                condition=models.Q(status="PENDING"),
+                name="payment_event_pending_idx",
+            )
+        ]
+
+
 @receiver(pre_save, sender=Charge)
 def set_status_null(sender, instance, *args, **kwargs):
     if instance.charge_type == ChargeTypeChoices.RECURRING:
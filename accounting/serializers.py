@@ -1,6 +1,5 @@
 from rest_framework import serializers
 
-from authentication.serializers import UserSerializer
 from core.serializers import ModifiedByAbstractSerializer
 
 from .models import (
@@ -130,8 +129,6 @@ class ChargeSerializer(ModifiedByAbstractSerializer):
 
 
 class ChargeAttachmentSerializer(ModifiedByAbstractSerializer):
-    created_by = UserSerializer(many=False, read_only=True)
-
     class Meta:
         model = ChargeAttachment
         fields = (
@@ -164,8 +161,6 @@ class AccountSerializer(ModifiedByAbstractSerializer):
 
 
 class AccountAttachmentSerializer(ModifiedByAbstractSerializer):
-    created_by = UserSerializer(many=False, read_only=True)
-
     class Meta:
         model = AccountAttachment
         fields = (
@@ -205,8 +200,6 @@ class PaymentSerializer(ModifiedByAbstractSerializer):
 
 
 class PaymentAttachmentSerializer(ModifiedByAbstractSerializer):
-    created_by = UserSerializer(many=False, read_only=True)
-
     class Meta:
         model = PaymentAttachment
         fields = (
@@ -253,3 +246,35 @@ class GeneralLedgerTransactionSerializer(ModifiedByAbstractSerializer):
             "gl_account",
             "created_at",
         )
+
+
+class GeneralLedgerAccountBalanceSerializer(serializers.Serializer):
+    gl_account = serializers.IntegerField()
+    account_type = serializers.CharField()
+    sub_account_type = serializers.CharField()
+    label = serializers.CharField(allow_null=True)
+    account_holder_content_type = serializers.IntegerField()
+    account_holder_object_id = serializers.IntegerField()
+    debit_amount = serializers.DecimalField(max_digits=14, decimal_places=2)
+    credit_amount = serializers.DecimalField(max_digits=14, decimal_places=2)
+    balance = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class TrialBalanceSerializer(serializers.Serializer):
+    accounts = GeneralLedgerAccountBalanceSerializer(many=True)
+    total_debit_amount = serializers.DecimalField(max_digits=14, decimal_places=2)
+    total_credit_amount = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class BalanceSheetSerializer(serializers.Serializer):
+    accounts = GeneralLedgerAccountBalanceSerializer(many=True)
+    total_assets = serializers.DecimalField(max_digits=14, decimal_places=2)
+    total_liabilities = serializers.DecimalField(max_digits=14, decimal_places=2)
+    total_equity = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class IncomeStatementSerializer(serializers.Serializer):
+    accounts = GeneralLedgerAccountBalanceSerializer(many=True)
+    total_income = serializers.DecimalField(max_digits=14, decimal_places=2)
+    total_expenses = serializers.DecimalField(max_digits=14, decimal_places=2)
+    net_income = serializers.DecimalField(max_digits=14, decimal_places=2)
@@ -0,0 +1,54 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from property.models import PropertyLateFeePolicy
+
+from .models import Charge, GeneralLedgerTransaction, Invoice
+from .utils import compute_invoice_financials, record_general_ledger_balances, refresh_invoice_financials
+
+
+@receiver(pre_save, sender=Invoice)
+def set_invoice_financials(sender, instance, *args, **kwargs):
+    # The financials are computed from the python values of these fields, the assigned values are kept as they are.
+    assigned_values = {field: getattr(instance, field) for field in ("due_date", "rent_amount", "arrears_amount")}
+    for field, value in assigned_values.items():
+        setattr(instance, field, Invoice._meta.get_field(field).to_python(value))
+    late_fee_policy = PropertyLateFeePolicy.objects.filter(parent_property_id=instance.parent_property_id).first()
+    compute_invoice_financials(instance, late_fee_policy, timezone.now().date())
+    for field, value in assigned_values.items():
+        setattr(instance, field, value)
+
+
+@receiver(post_save, sender=Charge)
+@receiver(post_delete, sender=Charge)
+def refresh_charge_invoice_financials(sender, instance, *args, **kwargs):
+    if instance.invoice_id:
+        refresh_invoice_financials(Invoice.objects.filter(pk=instance.invoice_id))
+
+
+@receiver(post_save, sender=PropertyLateFeePolicy)
+def refresh_property_invoice_financials(sender, instance, created, **kwargs):
+    if not created:
+        refresh_invoice_financials(Invoice.objects.filter(parent_property_id=instance.parent_property_id))
+
+
+@receiver(pre_save, sender=GeneralLedgerTransaction)
+def store_previous_general_ledger_transaction(sender, instance, raw=False, **kwargs):
+    if instance.pk and not raw:
+        instance._previous_transaction = GeneralLedgerTransaction.objects.filter(pk=instance.pk).first()
+
+
+@receiver(post_save, sender=GeneralLedgerTransaction)
+def record_general_ledger_transaction_balance(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    previous_transaction = getattr(instance, "_previous_transaction", None)
+    if previous_transaction is not None:
+        record_general_ledger_balances([previous_transaction], sign=-1)
+    record_general_ledger_balances([instance])
+
+
+@receiver(post_delete, sender=GeneralLedgerTransaction)
+def remove_general_ledger_transaction_balance(sender, instance, **kwargs):
+    record_general_ledger_balances([instance], sign=-1)
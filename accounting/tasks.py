@@ -1,7 +1,179 @@
-from celery import shared_task  # type: ignore[import]
+import logging
+import time
+from typing import List
+
+from celery import chord, shared_task  # type: ignore[import]
 from django.core import management
+from django.db import transaction
+from django.utils import timezone
+
+from core.utils import chunked
+from lease.models import Lease
+from system_preferences.models import BusinessInformation
+
+from .models import Invoice, InvoicePaymentEvent, PaymentStatusChoices
+from .utils import (
+    accrue_invoice_late_fees,
+    create_invoices_for_units,
+    refresh_invoice_financials,
+    settle_invoice_payments,
+)
+
+logger = logging.getLogger(__name__)
 
 
 @shared_task
 def create_invoices_of_units_task():
     management.call_command("create_invoices_of_units")
+
+
+@shared_task
+def dispatch_invoice_shards_task(shard_size: int = 500):
+    """
+    Splits the units whose lease is due for invoice today into id ranges of ``shard_size`` units and invoices them in
+    parallel as a chord. :py:func:`collect_invoice_shard_results_task` receives the result of every shard.
+    """
+    unit_ids = sorted(set(Lease.objects.due_for_invoice(timezone.now().date()).values_list("unit_id", flat=True)))
+    shards = list(chunked(unit_ids, shard_size))
+    if not shards:
+        return None
+
+    logger.info("Dispatching %s invoice shards for %s units", len(shards), len(unit_ids))
+    return chord(create_invoices_shard_task.s(shard) for shard in shards)(collect_invoice_shard_results_task.s()).id
+
+
+@shared_task
+def create_invoices_shard_task(unit_ids: List[int]) -> dict:
+    """
+    Invoices one shard of units. The shard is idempotent: the active leases of the shard are locked with
+    ``SKIP LOCKED`` so that a duplicated delivery running concurrently skips them, and only the leases still due today
+    are invoiced, so a retried shard never bills a lease twice.
+    Errors are reported in the result instead of being raised so that the chord callback always runs.
+    """
+    started_at = time.monotonic()
+    result = {"units": len(unit_ids), "invoices": 0, "error": None}
+    try:
+        with transaction.atomic():
+            locked_unit_ids = list(
+                Lease.objects.filter(unit_id__in=unit_ids, status=Lease.LeaseStatus.ACTIVE)
+                .select_for_update(skip_locked=True)
+                .values_list("unit_id", flat=True)
+            )
+            due_unit_ids = (
+                Lease.objects.due_for_invoice(timezone.now().date())
+                .filter(unit_id__in=locked_unit_ids)
+                .values_list("unit_id", flat=True)
+            )
+            invoices = create_invoices_for_units(due_unit_ids, business_info=BusinessInformation.objects.first())
+        result["invoices"] = len(invoices)
+    except Exception as exc:
+        logger.exception("Invoice shard of units %s-%s failed", unit_ids[0], unit_ids[-1])
+        result["error"] = repr(exc)
+    result["duration"] = time.monotonic() - started_at
+    return result
+
+
+@shared_task
+def collect_invoice_shard_results_task(results: List[dict]) -> dict:
+    summary = {
+        "shards": len(results),
+        "units": sum(result["units"] for result in results),
+        "invoices": sum(result["invoices"] for result in results),
+        "failed_shards": [result for result in results if result["error"]],
+        "max_shard_duration": max((result["duration"] for result in results), default=0),
+    }
+    logger.info(
+        "Invoice run finished: %s invoices for %s units in %s shards, %s failed shards, slowest shard %.2fs",
+        summary["invoices"],
+        summary["units"],
+        summary["shards"],
+        len(summary["failed_shards"]),
+        summary["max_shard_duration"],
+    )
+    return summary
+
+
+@shared_task
+def roll_invoice_late_fees_task(chunk_size: int = 1000) -> int:
+    """
+    Nightly task rolling the day dependent late fee and payable amount of every unpaid invoice forward to today.
+    Invoices already refreshed today are skipped. Returns the number of invoices whose stored values changed.
+    """
+    today = timezone.now().date()
+    invoice_ids = (
+        Invoice.objects.filter(status__in=[PaymentStatusChoices.UNPAID, PaymentStatusChoices.REJECTED])
+        .exclude(financials_updated_on=today)
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+    count = 0
+    for chunk in chunked(invoice_ids, chunk_size):
+        count += len(refresh_invoice_financials(Invoice.objects.filter(pk__in=chunk), today=today))
+    logger.info("Rolled late fees of %s invoices forward to %s", count, today)
+    return count
+
+
+@shared_task
+def accrue_invoice_late_fees_task(chunk_size: int = 1000) -> int:
+    """
+    Daily task posting the late fees of overdue unpaid invoices to the general ledger in batches of ``chunk_size``.
+    Every batch is locked, its financials are rolled forward to today and only the late fee accrued since the last run
+    is posted, so running the task again the same day posts nothing. Returns the number of created transactions.
+    """
+    today = timezone.now().date()
+    unpaid_statuses = [PaymentStatusChoices.UNPAID, PaymentStatusChoices.REJECTED]
+    invoice_ids = (
+        Invoice.objects.filter(status__in=unpaid_statuses, due_date__lt=today)
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+    count = 0
+    for chunk in chunked(invoice_ids, chunk_size):
+        with transaction.atomic():
+            invoices = list(
+                Invoice.objects.filter(pk__in=chunk, status__in=unpaid_statuses).order_by("pk").select_for_update()
+            )
+            refresh_invoice_financials(invoices, today=today)
+            count += len(accrue_invoice_late_fees(invoices, today))
+    logger.info("Accrued late fees of overdue invoices to %s with %s transactions", today, count)
+    return count
+
+
+@shared_task
+def settle_invoice_payments_task(batch_size: int = 500) -> dict:
+    """
+    Settles the pending invoice payment events stored by the Stripe webhook in batches of ``batch_size``. Every batch
+    is locked with ``SKIP LOCKED`` so that concurrent workers share the queue without waiting on each other, and
+    events of already paid invoices are only marked as duplicates, so a redelivered event never settles twice.
+    Returns the counts of the run, the remaining queue depth and the settlement latency of the processed events.
+    """
+    started_at = time.monotonic()
+    result = {"settled": 0, "duplicates": 0, "max_latency": 0.0}
+    while True:
+        with transaction.atomic():
+            events = list(
+                InvoicePaymentEvent.objects.filter(status=InvoicePaymentEvent.StatusChoices.PENDING)
+                .order_by("pk")
+                .select_for_update(skip_locked=True)[:batch_size]
+            )
+            processed_events = settle_invoice_payments(events)
+        for event in processed_events:
+            if event.status == InvoicePaymentEvent.StatusChoices.SETTLED:
+                result["settled"] += 1
+            else:
+                result["duplicates"] += 1
+            result["max_latency"] = max(result["max_latency"], (event.settled_at - event.created_at).total_seconds())
+        if len(events) < batch_size or not processed_events:
+            break
+
+    result["pending"] = InvoicePaymentEvent.objects.filter(status=InvoicePaymentEvent.StatusChoices.PENDING).count()
+    result["duration"] = time.monotonic() - started_at
+    logger.info(
+        "Settled %s invoice payments and %s duplicates in %.2fs, %s pending, slowest settlement %.2fs after receipt",
+        result["settled"],
+        result["duplicates"],
+        result["duration"],
+        result["pending"],
+        result["max_latency"],
+    )
+    return result
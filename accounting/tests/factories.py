@@ -106,3 +106,13 @@ class GeneralLedgerTransactionFactory(SubscriptionAbstractFactory):
     amount = factory.Faker("pydecimal", min_value=0, max_value=1000, right_digits=2)
     description = factory.Faker("text")
     gl_account = factory.SubFactory("accounting.tests.factories.GeneralLedgerAccountFactory")
+
+
+class InvoicePaymentEventFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = "accounting.InvoicePaymentEvent"
+
+    idempotency_key = factory.Sequence(lambda n: f"pi_{n}")
+    invoice = factory.SubFactory("accounting.tests.factories.InvoiceFactory")
+    payment_intent_id = factory.Sequence(lambda n: f"pi_{n}")
+    amount = factory.Faker("pydecimal", min_value=0, max_value=1000, right_digits=2)
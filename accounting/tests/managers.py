@@ -13,7 +13,7 @@ from .models import Invoice
 @pytest.mark.django_db
 def test_invoice_annotate_data(invoice_factory, charge_factory):
     """
-    Testing :py:meth:`accounting.models.InvoiceQuerySet.annotate_data`.
+    Testing :py:meth:`accounting.models.InvoiceQuerySet.annotate_data` and the stored invoice financials.
     """
 
     invoice_1 = invoice_factory(
@@ -52,7 +52,7 @@ def test_invoice_annotate_data(invoice_factory, charge_factory):
 
     assert invoice_1.total_charges_amount == approx(Decimal("60.00"))
     assert invoice_1.charges_and_rent == approx(Decimal("160.00"))
-    assert invoice_1.recurring_charges_amount == approx(Decimal("130.00"))
+    assert invoice_1.recurring_charges_amount == approx(Decimal("30.00"))
 
     assert not invoice_1.is_late_fee_applicable
     assert invoice_2.is_late_fee_applicable
@@ -73,7 +73,7 @@ def test_invoice_annotate_data(invoice_factory, charge_factory):
     invoice_1.parent_property.late_fee_policy.save()
     invoice_1 = Invoice.objects.annotate_data().get(pk=invoice_1.pk)
 
-    assert invoice_1.eligible_amount == invoice_1.recurring_charges_amount
+    assert invoice_1.eligible_amount == invoice_1.recurring_charges_amount + invoice_1.rent_amount
 
     assert invoice_2.late_fee == approx(Decimal("10.00"))
 
@@ -1,6 +1,6 @@
 import pytest
 
-from authentication.serializers import UserSerializer
+from authentication.serializers import AuditUserSerializer
 
 from ..models import Charge, Invoice
 from ..serializers import (
@@ -46,7 +46,7 @@ def test_invoice_serializer_read(invoice_factory, payment_factory):
     assert serializer.data["number_of_days_late"] == instance.number_of_days_late
     assert serializer.data["late_fee"] == instance.late_fee
     assert serializer.data["payable_late_fee"] == instance.payable_late_fee
-    assert serializer.data["payable_amount"] == instance.payable_amount
+    assert serializer.data["payable_amount"] == str(instance.payable_amount)
     assert serializer.data["slug"] == instance.slug
     assert serializer.data["arrears_amount"] == str(instance.arrears_amount)
     assert serializer.data["arrear_of"] == instance.arrear_of
@@ -239,7 +239,7 @@ def test_charge_attachment_serializer_read(charge_factory, charge_attachment_fac
     serializer = ChargeAttachmentSerializer(instance)
 
     assert serializer.data["charge"] == charge.id
-    assert serializer.data["created_by"] == UserSerializer(instance.created_by).data
+    assert serializer.data["created_by"] == AuditUserSerializer(instance.created_by).data
     assert serializer.data["file"] == instance.file
     assert serializer.data["name"] == instance.name
     assert serializer.data["file_type"] == instance.file_type
@@ -406,7 +406,7 @@ def test_account_attachment_serializer_read(account_attachment_factory, user_fac
     serializer = AccountAttachmentSerializer(instance)
 
     assert serializer.data["account"] == instance.account.id
-    assert serializer.data["created_by"] == UserSerializer(instance.created_by).data
+    assert serializer.data["created_by"] == AuditUserSerializer(instance.created_by).data
     assert serializer.data["file"] == instance.file
     assert serializer.data["name"] == instance.name
     assert serializer.data["file_type"] == instance.file_type
@@ -582,7 +582,7 @@ def test_payment_attachment_serializer_read(payment_attachment_factory, user_fac
     serializer = PaymentAttachmentSerializer(instance)
 
     assert serializer.data["payment"] == instance.payment.id
-    assert serializer.data["created_by"] == UserSerializer(instance.created_by).data
+    assert serializer.data["created_by"] == AuditUserSerializer(instance.created_by).data
     assert serializer.data["file"] == instance.file
     assert serializer.data["name"] == instance.name
     assert serializer.data["file_type"] == instance.file_type
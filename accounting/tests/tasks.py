@@ -1,10 +1,23 @@
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
 import pytest
+from django.core import management
 from django.utils import timezone
 
 from lease.models import Lease
 
-from ..models import Invoice
-from ..tasks import create_invoices_of_units_task
+from ..models import GeneralLedgerAccount, GeneralLedgerTransaction, Invoice, InvoicePaymentEvent
+from ..tasks import (
+    accrue_invoice_late_fees_task,
+    collect_invoice_shard_results_task,
+    create_invoices_of_units_task,
+    create_invoices_shard_task,
+    dispatch_invoice_shards_task,
+    roll_invoice_late_fees_task,
+    settle_invoice_payments_task,
+)
 
 
 @pytest.mark.django_db
@@ -23,3 +36,247 @@ def test_create_invoice_task(lease_factory):
     create_invoices_of_units_task()
 
     assert Invoice.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_create_invoices_of_units_command_dry_run(lease_factory):
+    """
+    Testing :py:mod:`accounting.management.commands.create_invoices_of_units` with ``--dry-run``
+    """
+    for _ in range(3):
+        lease_factory(status="ACTIVE", start_date=timezone.now().date() - timezone.timedelta(days=1))
+
+    out = StringIO()
+    management.call_command("create_invoices_of_units", "--dry-run", "--chunk-size=2", stdout=out)
+
+    assert "3 invoices would be created" in out.getvalue()
+    assert Invoice.objects.count() == 0
+
+    management.call_command("create_invoices_of_units", "--chunk-size=2", stdout=out)
+
+    assert Invoice.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test_create_invoices_shard_task(lease_factory):
+    """
+    Testing :py:func:`accounting.tasks.create_invoices_shard_task` is idempotent
+    """
+    leases = [
+        lease_factory(status="ACTIVE", start_date=timezone.now().date() - timezone.timedelta(days=1)) for _ in range(2)
+    ]
+    unit_ids = [lease.unit_id for lease in leases]
+
+    result = create_invoices_shard_task(unit_ids)
+
+    assert result["units"] == 2
+    assert result["invoices"] == 2
+    assert result["error"] is None
+    assert Invoice.objects.count() == 2
+
+    result = create_invoices_shard_task(unit_ids)
+
+    assert result["invoices"] == 0
+    assert Invoice.objects.count() == 2
+
+
+def test_collect_invoice_shard_results_task():
+    """
+    Testing :py:func:`accounting.tasks.collect_invoice_shard_results_task`
+    """
+    failed_shard = {"units": 3, "invoices": 0, "error": "OperationalError()", "duration": 2.5}
+    summary = collect_invoice_shard_results_task(
+        [{"units": 2, "invoices": 2, "error": None, "duration": 1.0}, failed_shard]
+    )
+
+    assert summary == {
+        "shards": 2,
+        "units": 5,
+        "invoices": 2,
+        "failed_shards": [failed_shard],
+        "max_shard_duration": 2.5,
+    }
+
+
+@pytest.mark.django_db
+def test_dispatch_invoice_shards_task(lease_factory, mocker):
+    """
+    Testing :py:func:`accounting.tasks.dispatch_invoice_shards_task`
+    """
+    mocked_chord = mocker.patch("accounting.tasks.chord")
+
+    assert dispatch_invoice_shards_task() is None
+    mocked_chord.assert_not_called()
+
+    leases = [
+        lease_factory(status="ACTIVE", start_date=timezone.now().date() - timezone.timedelta(days=1)) for _ in range(3)
+    ]
+    dispatch_invoice_shards_task(shard_size=2)
+
+    header = list(mocked_chord.call_args.args[0])
+    assert [signature.args[0] for signature in header] == [
+        sorted(lease.unit_id for lease in leases)[:2],
+        sorted(lease.unit_id for lease in leases)[2:],
+    ]
+
+
+@pytest.mark.django_db
+def test_roll_invoice_late_fees_task(invoice_factory, freezer):
+    """
+    Testing :py:func:`accounting.tasks.roll_invoice_late_fees_task`
+    """
+    freezer.move_to("2023-01-10")
+    invoice = invoice_factory(
+        due_date=timezone.now().date() - timedelta(days=1), rent_amount=Decimal("100.00"), arrears_amount=0
+    )
+    late_fee_policy = invoice.parent_property.late_fee_policy
+    late_fee_policy.late_fee_type = "flat"
+    late_fee_policy.base_amount_fee = Decimal("10.00")
+    late_fee_policy.charge_daily_late_fees = True
+    late_fee_policy.daily_amount_per_month_max = Decimal("25.00")
+    late_fee_policy.save()
+    invoice_factory(parent_property=invoice.parent_property, status="VERIFIED")
+
+    invoice.refresh_from_db()
+    assert invoice.payable_late_fee == Decimal("10.00")
+    assert invoice.payable_amount == Decimal("110.00")
+
+    assert roll_invoice_late_fees_task() == 0
+
+    freezer.move_to("2023-01-11")
+    assert roll_invoice_late_fees_task() == 1
+
+    invoice.refresh_from_db()
+    assert invoice.payable_late_fee == Decimal("20.00")
+    assert invoice.payable_amount == Decimal("120.00")
+    assert invoice.financials_updated_on == timezone.now().date()
+
+    freezer.move_to("2023-01-12")
+    roll_invoice_late_fees_task()
+
+    invoice.refresh_from_db()
+    assert invoice.payable_late_fee == Decimal("25.00")
+
+
+@pytest.mark.django_db
+def test_accrue_invoice_late_fees_task(invoice_factory, freezer):
+    """
+    Testing :py:func:`accounting.tasks.accrue_invoice_late_fees_task`
+    """
+    freezer.move_to("2023-01-10")
+    invoice = invoice_factory(
+        due_date=timezone.now().date() - timedelta(days=1), rent_amount=Decimal("100.00"), arrears_amount=0
+    )
+    late_fee_policy = invoice.parent_property.late_fee_policy
+    late_fee_policy.late_fee_type = "flat"
+    late_fee_policy.base_amount_fee = Decimal("10.00")
+    late_fee_policy.charge_daily_late_fees = True
+    late_fee_policy.daily_amount_per_month_max = Decimal("25.00")
+    late_fee_policy.save()
+    invoice_factory(parent_property=invoice.parent_property, due_date=timezone.now().date(), arrears_amount=0)
+    invoice_factory(parent_property=invoice.parent_property, status="VERIFIED")
+
+    assert accrue_invoice_late_fees_task() == 2
+    assert accrue_invoice_late_fees_task() == 0
+
+    freezer.move_to("2023-01-11")
+    assert accrue_invoice_late_fees_task(chunk_size=1) == 4
+
+    invoice.refresh_from_db()
+    assert invoice.accrued_late_fee == Decimal("20.00")
+    assert invoice.financials_updated_on == timezone.now().date()
+
+    transactions = GeneralLedgerTransaction.objects.filter(description__contains=f"{Invoice.SLUG}-{invoice.pk} ")
+    debits = transactions.filter(transaction_type="DEBIT")
+    credits = transactions.filter(transaction_type="CREDIT")
+    assert sum(debit.amount for debit in debits) == Decimal("20.00")
+    assert sum(credit.amount for credit in credits) == Decimal("20.00")
+    assert {(debit.gl_account.account_type, debit.gl_account.label) for debit in debits} == {("ASSET", "LATE_FEE")}
+    assert {debit.gl_account.account_holder_object_id for debit in debits} == {invoice.unit_id}
+    assert {(credit.gl_account.account_type, credit.gl_account.label) for credit in credits} == {
+        ("INCOME", "LATE_FEE")
+    }
+
+
+@pytest.mark.django_db
+def test_settle_invoice_payments_task(invoice_factory, charge_factory, invoice_payment_event_factory):
+    """
+    Testing :py:func:`accounting.tasks.settle_invoice_payments_task`
+    """
+    invoice = invoice_factory(due_date=timezone.now().date(), rent_amount=Decimal("100.00"), arrears_amount=0)
+    charge = charge_factory(invoice=invoice, amount=Decimal("20.00"))
+    paid_invoice = invoice_factory(status="VERIFIED")
+    events = [
+        invoice_payment_event_factory(invoice=invoice),
+        invoice_payment_event_factory(invoice=invoice),
+        invoice_payment_event_factory(invoice=paid_invoice),
+    ]
+    invoice_payment_event_factory(invoice=invoice_factory(), status="SETTLED")
+
+    result = settle_invoice_payments_task(batch_size=2)
+
+    assert (result["settled"], result["duplicates"], result["pending"]) == (1, 2, 0)
+    invoice.refresh_from_db()
+    assert invoice.status == "VERIFIED"
+    assert invoice.payed_at == timezone.now().date()
+    assert invoice.total_paid_amount == Decimal("120.00")
+    charge.refresh_from_db()
+    assert charge.status == "VERIFIED"
+    assert [InvoicePaymentEvent.objects.get(pk=event.pk).status for event in events] == [
+        "SETTLED",
+        "DUPLICATE",
+        "DUPLICATE",
+    ]
+    assert settle_invoice_payments_task()["settled"] == 0
+
+
+@pytest.mark.django_db
+def test_refresh_invoice_financials_command(invoice_factory, charge_factory):
+    """
+    Testing :py:mod:`accounting.management.commands.refresh_invoice_financials`
+    """
+    invoice = invoice_factory(rent_amount=Decimal("100.00"))
+    charge_factory(invoice=invoice, amount=Decimal("20.00"))
+    Invoice.objects.filter(pk=invoice.pk).update(total_charges_amount=0, charges_and_rent=0)
+
+    with pytest.raises(management.CommandError, match="1 invoices have out of date financials"):
+        management.call_command("refresh_invoice_financials", "--verify", stdout=StringIO())
+
+    out = StringIO()
+    management.call_command("refresh_invoice_financials", stdout=out)
+
+    assert "Successfully refreshed financials of 1 invoices" in out.getvalue()
+    invoice.refresh_from_db()
+    assert invoice.total_charges_amount == Decimal("20.00")
+    assert invoice.charges_and_rent == Decimal("120.00")
+
+    management.call_command("refresh_invoice_financials", "--verify", stdout=out)
+
+    assert "All invoice financials are up to date" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_reconcile_general_ledger_accounts_command(unit_factory, project_factory):
+    """
+    Testing :py:mod:`accounting.management.commands.reconcile_general_ledger_accounts`
+    """
+    unit_factory()
+    project = project_factory()
+    GeneralLedgerAccount.objects.filter(account_holder_content_type__model="unit", label="LATE_FEE").delete()
+    GeneralLedgerAccount.objects.filter(account_holder_content_type__model="project").delete()
+
+    out = StringIO()
+    management.call_command("reconcile_general_ledger_accounts", stdout=out)
+
+    assert "Successfully created 3 missing general ledger accounts" in out.getvalue()
+    assert GeneralLedgerAccount.objects.filter(account_holder_content_type__model="unit").count() == 14
+    assert (
+        GeneralLedgerAccount.objects.filter(
+            account_holder_object_id=project.id, account_holder_content_type__model="project"
+        ).count()
+        == 1
+    )
+
+    management.call_command("reconcile_general_ledger_accounts", stdout=out)
+
+    assert "Successfully created 0 missing general ledger accounts" in out.getvalue()
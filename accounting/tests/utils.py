@@ -1,13 +1,22 @@
-from datetime import timedelta
+from datetime import date, timedelta
+from decimal import Decimal
 
 import pytest
 from django.utils import timezone
+from pytest_django.asserts import assertNumQueries
 
 from lease.models import Lease
 from property.models import PropertyLateFeePolicy
 
-from ..models import Invoice
-from ..utils import create_invoice_for_unit_lease
+from ..models import GeneralLedgerAccount, GeneralLedgerBalance, Invoice
+from ..utils import (
+    bulk_provision_general_ledger_accounts,
+    create_invoice_for_unit_lease,
+    create_invoices_for_units,
+    provision_general_ledger_accounts,
+    rebuild_general_ledger_balances,
+    record_general_ledger_balances,
+)
 
 
 @pytest.mark.django_db
@@ -70,3 +79,121 @@ def test_create_invoice_for_unit_lease(unit_factory, lease_factory, charge_facto
     create_invoice_for_unit_lease(lease_5.unit)
     create_invoice_for_unit_lease(lease_5.unit)
     assert Invoice.objects.latest("pk").arrears_amount > 0
+
+
+@pytest.mark.django_db
+def test_create_invoices_for_units(lease_factory, charge_factory, invoice_factory):
+    """
+    Testing :py:func:`accounting.utils.create_invoices_for_units`
+    """
+    leases = [Lease.objects.get(id=lease_factory(status="ACTIVE").id) for _ in range(3)]
+    for lease in leases:
+        charge_factory(
+            status=None,
+            tenant_id=lease.primary_tenant.id,
+            unit=lease.unit,
+            parent_property=lease.unit.parent_property,
+            charge_type="RECURRING",
+            invoice=None,
+        )
+    unit_ids = [lease.unit_id for lease in leases]
+
+    invoices = create_invoices_for_units(unit_ids, dry_run=True)
+
+    assert len(invoices) == 3
+    assert Invoice.objects.count() == 0
+
+    with assertNumQueries(10):
+        create_invoices_for_units(unit_ids)
+
+    assert Invoice.objects.count() == 3
+    for lease in leases:
+        invoice = Invoice.objects.get(lease=lease)
+        assert invoice.interval_start_date == lease.start_date
+        assert invoice.arrears_amount == 0
+        assert invoice.charges.filter(parent_charge__isnull=False).count() == 1
+
+    with assertNumQueries(11):
+        invoices = create_invoices_for_units(unit_ids)
+
+    for invoice in invoices:
+        previous_invoice = Invoice.objects.filter(lease=invoice.lease).exclude(pk=invoice.pk).get()
+        assert previous_invoice.arrear_of == invoice
+        assert invoice.interval_start_date == previous_invoice.interval_end_date + timedelta(days=1)
+        assert invoice.arrears_amount > 0
+
+
+@pytest.mark.django_db
+def test_create_invoices_for_units_without_active_lease(unit_factory, lease_factory):
+    """
+    Testing :py:func:`accounting.utils.create_invoices_for_units` skips units without an active lease
+    """
+    lease = lease_factory(status="CLOSED")
+
+    assert create_invoices_for_units([unit_factory().pk, lease.unit_id]) == []
+    assert Invoice.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_record_general_ledger_balances(general_ledger_account_factory, general_ledger_transaction_factory, freezer):
+    """
+    Testing :py:func:`accounting.utils.record_general_ledger_balances`
+    """
+    gl_account = general_ledger_account_factory()
+    freezer.move_to("2023-01-15")
+    debit = general_ledger_transaction_factory(gl_account=gl_account, transaction_type="DEBIT", amount=100)
+    general_ledger_transaction_factory(gl_account=gl_account, transaction_type="CREDIT", amount=30)
+    freezer.move_to("2023-02-01")
+    credit = general_ledger_transaction_factory(gl_account=gl_account, transaction_type="CREDIT", amount=20)
+
+    balances = GeneralLedgerBalance.objects.filter(gl_account=gl_account).order_by("period")
+    assert [(b.period, b.debit_amount, b.credit_amount) for b in balances.all()] == [
+        (date(2023, 1, 1), Decimal("100.00"), Decimal("30.00")),
+        (date(2023, 2, 1), Decimal("0.00"), Decimal("20.00")),
+    ]
+
+    debit.amount = 80
+    debit.save()
+    credit.delete()
+    assert [(b.period, b.debit_amount, b.credit_amount) for b in balances.all()] == [
+        (date(2023, 1, 1), Decimal("80.00"), Decimal("30.00")),
+        (date(2023, 2, 1), Decimal("0.00"), Decimal("0.00")),
+    ]
+
+    # savepoint, locked balances, balances update, release savepoint
+    with assertNumQueries(4):
+        record_general_ledger_balances([debit], sign=-1)
+
+    assert balances.first().debit_amount == Decimal("0.00")
+    assert rebuild_general_ledger_balances() == 1
+    assert [(b.period, b.debit_amount, b.credit_amount) for b in balances.all()] == [
+        (date(2023, 1, 1), Decimal("80.00"), Decimal("30.00")),
+    ]
+
+
+@pytest.mark.django_db
+def test_bulk_provision_general_ledger_accounts(unit_factory, inventory_factory):
+    """
+    Testing :py:func:`accounting.utils.bulk_provision_general_ledger_accounts`
+    """
+    with bulk_provision_general_ledger_accounts():
+        units = [unit_factory() for _ in range(3)]
+        with bulk_provision_general_ledger_accounts():
+            inventory = inventory_factory()
+        assert not GeneralLedgerAccount.objects.exists()
+
+    holder_ids = GeneralLedgerAccount.objects.values_list("account_holder_object_id", flat=True)
+    assert sorted(holder_ids.filter(account_holder_content_type__model="unit").distinct()) == [u.id for u in units]
+    assert GeneralLedgerAccount.objects.filter(account_holder_content_type__model="unit").count() == 3 * 14
+    assert list(holder_ids.filter(account_holder_content_type__model="inventory")) == [inventory.id]
+
+    with pytest.raises(ValueError):
+        with bulk_provision_general_ledger_accounts():
+            unit_factory()
+            raise ValueError
+
+    assert GeneralLedgerAccount.objects.count() == 3 * 14 + 1
+
+    # existing general ledger accounts
+    with assertNumQueries(1):
+        assert provision_general_ledger_accounts(units, only_missing=True) == []
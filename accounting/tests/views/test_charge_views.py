@@ -1,3 +1,6 @@
+import csv
+import io
+
 import pytest
 from django.urls import reverse
 from pytest_django.asserts import assertNumQueries
@@ -250,7 +253,7 @@ def test_charge_update(api_rf, charge_factory, tenant_factory, unit_factory, use
         "notes": "Language church surface really go. Offer wonder teacher turn evidence concern occur.",
     }
 
-    with assertNumQueries(7):
+    with assertNumQueries(11):
         url = reverse("accounting:charge-detail", kwargs={"pk": charge.id})
         request = api_rf.patch(url, data, format="json")
         request.user = user
@@ -271,7 +274,7 @@ def test_charge_delete(api_rf, charge_factory, user_with_permissions):
     user = user_with_permissions([("accounting", "charge")])
     charge = charge_factory(subscription=user.associated_subscription)
 
-    with assertNumQueries(6):
+    with assertNumQueries(10):
         url = reverse("accounting:charge-detail", kwargs={"pk": charge.id})
         request = api_rf.delete(url, format="json")
         request.user = user
@@ -281,3 +284,27 @@ def test_charge_delete(api_rf, charge_factory, user_with_permissions):
     assert response.status_code == 204
 
     assert Charge.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_charge_export(api_rf, user_with_permissions, charge_factory):
+    """
+    Testing :py:meth:`accounting.views.ChargeViewSet.export` method.
+    """
+    user = user_with_permissions([("accounting", "charge")])
+    charges = [charge_factory(subscription=user.associated_subscription) for _ in range(3)]
+    charge_factory()
+
+    with assertNumQueries(3):
+        url = reverse("accounting:charge-export")
+        request = api_rf.get(url, format="json")
+        request.user = user
+        view = ChargeViewSet.as_view({"get": "export"})
+        response = view(request)
+        content = b"".join(response.streaming_content).decode()
+
+    assert response.status_code == 200
+    rows = list(csv.reader(io.StringIO(content)))
+    assert rows[0] == list(ChargeViewSet.export_fields)
+    assert [int(row[0]) for row in rows[1:]] == [charge.id for charge in reversed(charges)]
+    assert rows[1][2] == charges[-1].title
@@ -0,0 +1,123 @@
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.urls import reverse
+from pytest_django.asserts import assertNumQueries
+
+from accounting.models import GeneralLedgerAccount
+from accounting.views import GeneralLedgerBalanceViewSet
+from property.models import Unit
+
+
+@pytest.fixture
+def unit_with_transactions(user_with_permissions, unit_factory, general_ledger_transaction_factory, freezer):
+    user = user_with_permissions([("accounting", "generalledgerbalance")])
+    unit = unit_factory(subscription=user.associated_subscription)
+    gl_accounts = GeneralLedgerAccount.objects.filter(
+        account_holder_content_type=ContentType.objects.get_for_model(Unit),
+        account_holder_object_id=unit.id,
+        label="LATE_FEE",
+    )
+    receivable_account = gl_accounts.get(account_type="ASSET")
+    income_account = gl_accounts.get(account_type="INCOME")
+
+    for day, amount in (("2023-01-15", 100), ("2023-02-10", 50)):
+        freezer.move_to(day)
+        general_ledger_transaction_factory(
+            subscription=user.associated_subscription,
+            gl_account=receivable_account,
+            transaction_type="DEBIT",
+            amount=amount,
+        )
+        general_ledger_transaction_factory(
+            subscription=user.associated_subscription,
+            gl_account=income_account,
+            transaction_type="CREDIT",
+            amount=amount,
+        )
+    general_ledger_transaction_factory()
+
+    return user, unit
+
+
+@pytest.mark.parametrize(
+    "query_params, total_debit_amount",
+    (
+        ({}, "150.00"),
+        ({"end_date": "2023-01-31"}, "100.00"),
+        ({"start_date": "2023-02-01"}, "50.00"),
+        ({"gl_account__account_type": "ASSET"}, "150.00"),
+    ),
+)
+@pytest.mark.django_db
+def test_general_ledger_trial_balance(api_rf, unit_with_transactions, query_params, total_debit_amount):
+    """
+    Testing :py:meth:`accounting.views.GeneralLedgerBalanceViewSet.trial_balance` method.
+    """
+    user, unit = unit_with_transactions
+
+    with assertNumQueries(3):
+        url = reverse("accounting:general-ledger-balance-trial-balance")
+        request = api_rf.get(url, query_params, format="json")
+        request.user = user
+        view = GeneralLedgerBalanceViewSet.as_view({"get": "trial_balance"})
+        response = view(request)
+
+    assert response.status_code == 200
+    assert response.data["total_debit_amount"] == total_debit_amount
+    assert response.data["accounts"][0].keys() == {
+        "gl_account",
+        "account_type",
+        "sub_account_type",
+        "label",
+        "account_holder_content_type",
+        "account_holder_object_id",
+        "debit_amount",
+        "credit_amount",
+        "balance",
+    }
+    assert all(account["account_holder_object_id"] == unit.id for account in response.data["accounts"])
+
+
+@pytest.mark.django_db
+def test_general_ledger_balance_sheet(api_rf, unit_with_transactions, unit_factory):
+    """
+    Testing :py:meth:`accounting.views.GeneralLedgerBalanceViewSet.balance_sheet` method.
+    """
+    user, unit = unit_with_transactions
+    other_unit = unit_factory(subscription=user.associated_subscription)
+
+    for query_params, total_assets in (
+        ({"unit": unit.id, "end_date": "2023-01-31"}, "100.00"),
+        ({"parent_property": unit.parent_property.id}, "150.00"),
+        ({"unit": other_unit.id}, "0.00"),
+    ):
+        url = reverse("accounting:general-ledger-balance-balance-sheet")
+        request = api_rf.get(url, query_params, format="json")
+        request.user = user
+        view = GeneralLedgerBalanceViewSet.as_view({"get": "balance_sheet"})
+        response = view(request)
+
+        assert response.status_code == 200
+        assert response.data["total_assets"] == total_assets
+        assert response.data["total_liabilities"] == "0.00"
+        assert response.data["total_equity"] == "0.00"
+
+
+@pytest.mark.django_db
+def test_general_ledger_income_statement(api_rf, unit_with_transactions):
+    """
+    Testing :py:meth:`accounting.views.GeneralLedgerBalanceViewSet.income_statement` method.
+    """
+    user, unit = unit_with_transactions
+
+    url = reverse("accounting:general-ledger-balance-income-statement")
+    request = api_rf.get(url, {"start_date": "2023-02-01", "end_date": "2023-02-28"}, format="json")
+    request.user = user
+    view = GeneralLedgerBalanceViewSet.as_view({"get": "income_statement"})
+    response = view(request)
+
+    assert response.status_code == 200
+    assert [account["account_type"] for account in response.data["accounts"]] == ["INCOME"]
+    assert response.data["total_income"] == "50.00"
+    assert response.data["total_expenses"] == "0.00"
+    assert response.data["net_income"] == "50.00"
@@ -1,3 +1,5 @@
+import csv
+import io
 from datetime import datetime
 
 import pytest
@@ -162,7 +164,7 @@ def test_invoice_update(api_rf, invoice_factory, user_with_permissions):
     invoice = invoice_factory(subscription=user.associated_subscription)
     data = {"status": "VERIFIED"}
 
-    with assertNumQueries(6):
+    with assertNumQueries(7):
         url = reverse("accounting:invoice-detail", kwargs={"pk": invoice.id})
         request = api_rf.patch(url, data, format="json")
         request.user = user
@@ -172,3 +174,29 @@ def test_invoice_update(api_rf, invoice_factory, user_with_permissions):
     assert response.status_code == 200
     for key, value in data.items():
         assert response.data[key] == value
+
+
+@pytest.mark.django_db
+def test_invoice_export(api_rf, user_with_permissions, invoice_factory):
+    """
+    Testing :py:meth:`accounting.views.InvoiceViewSet.export` method.
+    """
+    user = user_with_permissions([("accounting", "invoice")])
+    instance_1 = invoice_factory(status="UNPAID", subscription=user.associated_subscription)
+    instance_2 = invoice_factory(status="PAID", subscription=user.associated_subscription)
+    invoice_factory(status="UNPAID")
+
+    url = reverse("accounting:invoice-export")
+    request = api_rf.get(url, {"status": "UNPAID"}, format="json")
+    request.user = user
+    view = InvoiceViewSet.as_view({"get": "export"})
+    response = view(request)
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "text/csv"
+    assert response["Content-Disposition"] == 'attachment; filename="invoice.csv"'
+
+    rows = list(csv.reader(io.StringIO(b"".join(response.streaming_content).decode())))
+    assert rows[0] == list(InvoiceViewSet.export_fields)
+    assert [int(row[0]) for row in rows[1:]] == [instance_1.id]
+    assert instance_2.id not in [int(row[0]) for row in rows[1:]]
@@ -8,6 +8,7 @@ from .views import (
     ChargeAttachmentViewSet,
     ChargeViewSet,
     GeneralLedgerAccountViewSet,
+    GeneralLedgerBalanceViewSet,
     GeneralLedgerTransactionViewSet,
     InvoiceViewSet,
     PaymentAttachmentViewSet,
@@ -25,6 +26,7 @@ router.register("account-attachment", AccountAttachmentViewSet, basename="accoun
 router.register("payment", PaymentViewSet, basename="payment")
 router.register("payment-attachment", PaymentAttachmentViewSet, basename="payment-attachment")
 router.register("general-ledger-account", GeneralLedgerAccountViewSet, basename="general-ledger-account")
+router.register("general-ledger-balance", GeneralLedgerBalanceViewSet, basename="general-ledger-balance")
 router.register("general-ledger-transaction", GeneralLedgerTransactionViewSet, basename="general-ledger-transaction")
 
 urlpatterns = router.urls
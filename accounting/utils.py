@@ -1,110 +1,659 @@
-from datetime import timedelta
-from typing import Optional
+import logging
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Iterable, List, Optional
 
-from django.db.models import Q, Sum
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import DateField, Max, Model, Q, Sum
+from django.db.models.functions import TruncMonth
 from django.utils import timezone
 
 from lease.models import Lease
 from property.models import PropertyLateFeePolicy, Unit
 from system_preferences.models import BusinessInformation
+from tenant.utils import invalidate_tenant_homes
 
-from .models import Charge, ChargeTypeChoices, Invoice, PaymentStatusChoices
+from .models import (
+    Charge,
+    ChargeTypeChoices,
+    GeneralLedgerAccount,
+    GeneralLedgerAccountLabelChoices,
+    GeneralLedgerAccountTypeChoices,
+    GeneralLedgerBalance,
+    GeneralLedgerSubAccountTypeChoices,
+    GeneralLedgerTransaction,
+    GeneralLedgerTransactionTypeChoices,
+    Invoice,
+    InvoicePaymentEvent,
+    PaymentStatusChoices,
+)
 
+logger = logging.getLogger(__name__)
 
-def create_invoice_for_unit_lease(unit: Unit) -> Optional[Invoice]:
+RENT_CYCLE_INTERVALS = {
+    Lease.RentCycleChoices.WEEKLY: timedelta(weeks=1),
+    Lease.RentCycleChoices.MONTHLY: timedelta(days=30),
+    Lease.RentCycleChoices.QUARTERLY: timedelta(days=91),
+    Lease.RentCycleChoices.SIX_MONTHS: timedelta(days=182),
+    Lease.RentCycleChoices.YEARLY: timedelta(days=365),
+}
+
+CLONED_CHARGE_FIELDS = (
+    "title",
+    "description",
+    "amount",
+    "gl_account",
+    "tenant_id",
+    "parent_property_id",
+    "unit_id",
+    "notes",
+)
+
+INVOICE_FINANCIAL_FIELDS = (
+    "total_charges_amount",
+    "recurring_charges_amount",
+    "charges_and_rent",
+    "eligible_amount",
+    "late_fee",
+    "payable_late_fee",
+    "payable_amount",
+)
+
+CENT = Decimal("0.01")
+
+# Account type, sub account type and label of the GL accounts provisioned for every holder model.
+GENERAL_LEDGER_ACCOUNT_TEMPLATES = {
+    "property.unit": (
+        (GeneralLedgerAccountTypeChoices.ASSET, GeneralLedgerSubAccountTypeChoices.RECEIVABLES, None),
+        (
+            GeneralLedgerAccountTypeChoices.ASSET,
+            GeneralLedgerSubAccountTypeChoices.RECEIVABLES,
+            GeneralLedgerAccountLabelChoices.SALES_TAX,
+        ),
+        (GeneralLedgerAccountTypeChoices.ASSET, GeneralLedgerSubAccountTypeChoices.INVENTORY, None),
+        (GeneralLedgerAccountTypeChoices.ASSET, GeneralLedgerSubAccountTypeChoices.FIXED_ASSETS, None),
+        (GeneralLedgerAccountTypeChoices.INCOME, GeneralLedgerSubAccountTypeChoices.DIRECT_INCOME, None),
+        (GeneralLedgerAccountTypeChoices.INCOME, GeneralLedgerSubAccountTypeChoices.INDIRECT_INCOME, None),
+        (GeneralLedgerAccountTypeChoices.EXPENSE, GeneralLedgerSubAccountTypeChoices.DIRECT_EXPENSE, None),
+        (GeneralLedgerAccountTypeChoices.EXPENSE, GeneralLedgerSubAccountTypeChoices.INDIRECT_EXPENSE, None),
+        (GeneralLedgerAccountTypeChoices.LIABILITY, GeneralLedgerSubAccountTypeChoices.CURRENT_LIABILITY, None),
+        (GeneralLedgerAccountTypeChoices.LIABILITY, GeneralLedgerSubAccountTypeChoices.NON_CURRENT_LIABILITY, None),
+        (
+            GeneralLedgerAccountTypeChoices.ASSET,
+            GeneralLedgerSubAccountTypeChoices.RECEIVABLES,
+            GeneralLedgerAccountLabelChoices.LATE_FEE,
+        ),
+        (
+            GeneralLedgerAccountTypeChoices.INCOME,
+            GeneralLedgerSubAccountTypeChoices.INDIRECT_INCOME,
+            GeneralLedgerAccountLabelChoices.LATE_FEE,
+        ),
+        (
+            GeneralLedgerAccountTypeChoices.ASSET,
+            GeneralLedgerSubAccountTypeChoices.RECEIVABLES,
+            GeneralLedgerAccountLabelChoices.CHARGE,
+        ),
+        (
+            GeneralLedgerAccountTypeChoices.INCOME,
+            GeneralLedgerSubAccountTypeChoices.INDIRECT_INCOME,
+            GeneralLedgerAccountLabelChoices.CHARGE,
+        ),
+    ),
+    "maintenance.project": (
+        (GeneralLedgerAccountTypeChoices.EXPENSE, GeneralLedgerSubAccountTypeChoices.INDIRECT_EXPENSE, None),
+    ),
+    "maintenance.inventory": (
+        (GeneralLedgerAccountTypeChoices.ASSET, GeneralLedgerSubAccountTypeChoices.INVENTORY, None),
+    ),
+}
+
+_general_ledger_account_batch = threading.local()
+
+
+def provision_general_ledger_accounts(
+    holders: Iterable[Model], only_missing: bool = False
+) -> List[GeneralLedgerAccount]:
     """
-    NOTE Only creates invoice when its next day of last invoice end interval or start of lease date if no invoice exists
+    Creates the GL accounts of ``holders`` listed in ``GENERAL_LEDGER_ACCOUNT_TEMPLATES`` with a single insert. With
+    ``only_missing`` the existing accounts of the holders are loaded first and only the missing ones are created.
     """
+    holders_by_model = defaultdict(list)
+    for holder in holders:
+        holders_by_model[holder._meta.label_lower].append(holder)
 
-    late_fee_policy = (
-        PropertyLateFeePolicy.objects.filter(parent_property=unit.parent_property).annotate_is_expired().first()
-    )
-    recurring_charges = Charge.objects.filter(charge_type=ChargeTypeChoices.RECURRING)
-
-    for charge in recurring_charges:
-        required_keys = [
-            "title",
-            "description",
-            "amount",
-            "gl_account",
-            "tenant_id",
-            "parent_property_id",
-            "unit_id",
-            "notes",
-        ]
-        charge_dict = charge.__dict__
-        charge_data = {key: charge_dict[key] for key in required_keys}  # type: ignore[index]
-        Charge.objects.create(
-            charge_type=ChargeTypeChoices.ONE_TIME,
-            status=PaymentStatusChoices.UNPAID,
-            parent_charge=charge,
-            subscription=unit.subscription,
-            **charge_data,
-        )
+    gl_accounts = []
+    for model_label, model_holders in holders_by_model.items():
+        content_type = ContentType.objects.get_for_model(model_holders[0])
+        existing_accounts = set()
+        if only_missing:
+            existing_accounts = set(
+                GeneralLedgerAccount.objects.filter(
+                    account_holder_content_type=content_type,
+                    account_holder_object_id__in=[holder.pk for holder in model_holders],
+                ).values_list("account_holder_object_id", "account_type", "sub_account_type", "label")
+            )
+        for holder in model_holders:
+            for account_type, sub_account_type, label in GENERAL_LEDGER_ACCOUNT_TEMPLATES[model_label]:
+                if (holder.pk, account_type, sub_account_type, label) in existing_accounts:
+                    continue
+                gl_accounts.append(
+                    GeneralLedgerAccount(
+                        account_type=account_type,
+                        sub_account_type=sub_account_type,
+                        label=label,
+                        account_holder_content_type=content_type,
+                        account_holder_object_id=holder.pk,
+                        subscription_id=holder.subscription_id,
+                    )
+                )
+    return GeneralLedgerAccount.objects.bulk_create(gl_accounts)
 
-    if not late_fee_policy.is_expired:
-        if late_fee_policy.grace_period_type == PropertyLateFeePolicy.GracePeriodType.NUMBER_OF_DAY:
-            due_date = timezone.now() + timedelta(days=late_fee_policy.grace_period)
-        elif late_fee_policy.grace_period_type == PropertyLateFeePolicy.GracePeriodType.TILL_DATE_OF_MONTH:
-            due_date = timezone.now().replace(day=late_fee_policy.grace_period)
-        else:
-            due_date = timezone.now()
+
+@contextmanager
+def bulk_provision_general_ledger_accounts():
+    """
+    Defers the GL account provisioning of the holders created inside the block, so that the accounts of all of them
+    are created with a single insert when the block exits without error.
+    """
+    outer_batch = getattr(_general_ledger_account_batch, "holders", None)
+    holders: list = []
+    _general_ledger_account_batch.holders = holders
+    try:
+        yield
+    finally:
+        _general_ledger_account_batch.holders = outer_batch
+    if outer_batch is not None:
+        outer_batch.extend(holders)
     else:
-        due_date = timezone.now()
-
-    lease = Lease.objects.filter(unit=unit, status=Lease.LeaseStatus.ACTIVE).first()
-    if not lease:
-        return None
-
-    charges = Charge.objects.filter(
-        unit=unit,
-        status=PaymentStatusChoices.UNPAID,
-        charge_type=ChargeTypeChoices.ONE_TIME,
-        invoice=None,
-        created_at__month=timezone.now().month,
-    )
-    business_info = BusinessInformation.objects.first()
+        provision_general_ledger_accounts(holders)
 
-    if lease.invoices.exists():  # type: ignore[union-attr]
-        last_invoice: Invoice = lease.invoices.all().order_by("-created_at").first()  # type: ignore[union-attr]
-        invoice_start_date = last_invoice.interval_end_date + timedelta(days=1)
+
+def provision_holder_general_ledger_accounts(holder: Model) -> None:
+    """
+    Provisions the GL accounts of a newly created ``holder``, or defers it to the enclosing
+    :py:func:`bulk_provision_general_ledger_accounts` block.
+    """
+    holders = getattr(_general_ledger_account_batch, "holders", None)
+    if holders is None:
+        provision_general_ledger_accounts([holder])
     else:
-        invoice_start_date = lease.start_date  # type: ignore[union-attr]
-
-    if lease.rent_cycle == Lease.RentCycleChoices.WEEKLY:  # type: ignore[union-attr]
-        invoice_end_date = invoice_start_date + timedelta(weeks=1)
-    elif lease.rent_cycle == Lease.RentCycleChoices.YEARLY:  # type: ignore[union-attr]
-        invoice_end_date = invoice_start_date + timedelta(days=365)
-    elif lease.rent_cycle == Lease.RentCycleChoices.QUARTERLY:  # type: ignore[union-attr]
-        invoice_end_date = invoice_start_date + timedelta(days=91)
-    elif lease.rent_cycle == Lease.RentCycleChoices.SIX_MONTHS:  # type: ignore[union-attr]
-        invoice_end_date = invoice_start_date + timedelta(days=182)
+        holders.append(holder)
+
+
+def get_invoice_due_date(late_fee_policy: Optional[PropertyLateFeePolicy], today: date) -> date:
+    """
+    Returns the due date of an invoice issued on ``today`` according to the grace period of the late fee policy.
+    An expired policy (or no policy at all) gives no grace period.
+    """
+    if late_fee_policy is None or (late_fee_policy.end_date is not None and late_fee_policy.end_date < today):
+        return today
+    if late_fee_policy.grace_period_type == PropertyLateFeePolicy.GracePeriodType.NUMBER_OF_DAY:
+        return today + timedelta(days=late_fee_policy.grace_period)
+    if late_fee_policy.grace_period_type == PropertyLateFeePolicy.GracePeriodType.TILL_DATE_OF_MONTH:
+        return today.replace(day=late_fee_policy.grace_period)
+    return today
+
+
+def get_invoice_interval_end_date(start_date: date, rent_cycle: str) -> date:
+    return start_date + RENT_CYCLE_INTERVALS.get(rent_cycle, RENT_CYCLE_INTERVALS[Lease.RentCycleChoices.MONTHLY])
+
+
+def compute_invoice_financials(
+    invoice: Invoice, late_fee_policy: Optional[PropertyLateFeePolicy], today: date
+) -> None:
+    """
+    Sets the stored financials of ``invoice`` from its stored charge totals, rent, arrears and the late fee policy of
+    its property as of ``today``. Nothing is written to the database.
+
+    Without a configured base amount there is no late fee. A daily late fee is capped at the monthly maximum of the
+    policy and a late fee only adds to the payable amount once the invoice is past its due date.
+    """
+    invoice.charges_and_rent = invoice.total_charges_amount + invoice.rent_amount
+
+    eligible_charges = getattr(late_fee_policy, "eligible_charges", None)
+    if eligible_charges == PropertyLateFeePolicy.EligibleCharges.EVERY_CHARGE:
+        invoice.eligible_amount = invoice.charges_and_rent
+    elif eligible_charges == PropertyLateFeePolicy.EligibleCharges.ALL_RECURRING_CHARGES:
+        invoice.eligible_amount = invoice.recurring_charges_amount + invoice.rent_amount
+    else:
+        invoice.eligible_amount = invoice.rent_amount
+
+    if late_fee_policy is None or late_fee_policy.base_amount_fee is None:
+        invoice.late_fee = None
+    elif late_fee_policy.late_fee_type == PropertyLateFeePolicy.LateFeeType.PERCENTAGE:
+        invoice.late_fee = (late_fee_policy.base_amount_fee / 100 * invoice.eligible_amount).quantize(CENT)
     else:
-        invoice_end_date = invoice_start_date + timedelta(days=30)
-
-    invoice = Invoice.objects.create(  # type: ignore[misc]
-        business_information=business_info,
-        lease=lease,
-        parent_property=unit.parent_property,
-        unit=unit,
-        interval_start_date=invoice_start_date,
-        interval_end_date=invoice_end_date,
-        due_date=due_date.date(),
-        rent_amount=lease.amount,  # type: ignore[union-attr]
-        subscription=unit.subscription,
+        invoice.late_fee = late_fee_policy.base_amount_fee
+
+    if (
+        invoice.late_fee is not None
+        and late_fee_policy.charge_daily_late_fees  # type: ignore[union-attr]
+        and late_fee_policy.daily_amount_per_month_max is not None  # type: ignore[union-attr]
+    ):
+        number_of_days_late = max((today - invoice.due_date).days, 0)
+        invoice.payable_late_fee = min(
+            number_of_days_late * invoice.late_fee,
+            late_fee_policy.daily_amount_per_month_max,  # type: ignore[union-attr]
+        )
+    else:
+        invoice.payable_late_fee = invoice.late_fee
+
+    invoice.payable_amount = invoice.charges_and_rent + invoice.arrears_amount
+    if invoice.due_date < today and invoice.payable_late_fee is not None:
+        invoice.payable_amount += invoice.payable_late_fee
+    invoice.financials_updated_on = today
+
+
+def refresh_invoice_financials(
+    invoices: Iterable[Invoice], today: Optional[date] = None, dry_run: bool = False
+) -> List[Invoice]:
+    """
+    Recomputes the stored charge totals and financials of ``invoices`` with a fixed number of queries and returns the
+    invoices whose stored values were out of date. With ``dry_run`` nothing is written.
+    """
+    today = today or timezone.now().date()
+    invoices = list(invoices)
+    if not invoices:
+        return []
+    invoice_ids = [invoice.pk for invoice in invoices]
+
+    charge_totals = {
+        row["invoice_id"]: row
+        for row in Charge.objects.filter(invoice_id__in=invoice_ids)
+        .values("invoice_id")
+        .annotate(
+            total_charges_amount=Sum("amount", filter=Q(charge_type=ChargeTypeChoices.ONE_TIME), default=Decimal(0)),
+            recurring_charges_amount=Sum("amount", filter=Q(parent_charge__isnull=False), default=Decimal(0)),
+        )
+    }
+    late_fee_policies = {
+        policy.parent_property_id: policy
+        for policy in PropertyLateFeePolicy.objects.filter(
+            parent_property_id__in={invoice.parent_property_id for invoice in invoices}
+        )
+    }
+
+    outdated_invoices = []
+    for invoice in invoices:
+        stored = [getattr(invoice, field) for field in INVOICE_FINANCIAL_FIELDS]
+        totals = charge_totals.get(invoice.pk, {})
+        invoice.total_charges_amount = totals.get("total_charges_amount", Decimal(0))
+        invoice.recurring_charges_amount = totals.get("recurring_charges_amount", Decimal(0))
+        compute_invoice_financials(invoice, late_fee_policies.get(invoice.parent_property_id), today)
+        if stored != [getattr(invoice, field) for field in INVOICE_FINANCIAL_FIELDS]:
+            outdated_invoices.append(invoice)
+
+    if not dry_run:
+        Invoice.objects.bulk_update(outdated_invoices, [*INVOICE_FINANCIAL_FIELDS, "financials_updated_on"])
+        up_to_date_ids = set(invoice_ids) - {invoice.pk for invoice in outdated_invoices}
+        if up_to_date_ids:
+            Invoice.objects.filter(pk__in=up_to_date_ids).update(financials_updated_on=today)
+
+    return outdated_invoices
+
+
+def record_general_ledger_balances(transactions: Iterable[GeneralLedgerTransaction], sign: int = 1) -> None:
+    """
+    Adds ``transactions`` to the monthly balances of their GL accounts, or subtracts them with ``sign=-1``, with a
+    fixed number of queries. Missing balances are created first and the touched balances are locked, so concurrent
+    writers never lose an update.
+    """
+    totals: dict = defaultdict(lambda: {"debit_amount": Decimal(0), "credit_amount": Decimal(0)})
+    subscription_ids = {}
+    for gl_transaction in transactions:
+        key = (gl_transaction.gl_account_id, timezone.localdate(gl_transaction.created_at).replace(day=1))
+        if gl_transaction.transaction_type == GeneralLedgerTransactionTypeChoices.DEBIT:
+            totals[key]["debit_amount"] += sign * Decimal(gl_transaction.amount)
+        else:
+            totals[key]["credit_amount"] += sign * Decimal(gl_transaction.amount)
+        subscription_ids[key] = gl_transaction.subscription_id
+    if not totals:
+        return
+
+    with transaction.atomic():
+        if sign > 0:
+            GeneralLedgerBalance.objects.bulk_create(
+                [
+                    GeneralLedgerBalance(gl_account_id=gl_account_id, period=period, subscription_id=subscription_id)
+                    for (gl_account_id, period), subscription_id in subscription_ids.items()
+                ],
+                ignore_conflicts=True,
+            )
+        balances = []
+        for balance in GeneralLedgerBalance.objects.select_for_update().filter(
+            gl_account_id__in={gl_account_id for gl_account_id, _ in totals},
+            period__in={period for _, period in totals},
+        ):
+            if (balance.gl_account_id, balance.period) in totals:
+                total = totals[balance.gl_account_id, balance.period]
+                balance.debit_amount += total["debit_amount"]
+                balance.credit_amount += total["credit_amount"]
+                balance.updated_at = timezone.now()
+                balances.append(balance)
+        GeneralLedgerBalance.objects.bulk_update(balances, ["debit_amount", "credit_amount", "updated_at"])
+
+
+def rebuild_general_ledger_balances(batch_size: int = 1000) -> int:
+    """
+    Recomputes every monthly GL balance from the transactions and returns the number of balances.
+    """
+    balances = (
+        GeneralLedgerTransaction.objects.annotate(period=TruncMonth("created_at", output_field=DateField()))
+        .values("gl_account_id", "period", "gl_account__subscription_id")
+        .annotate(
+            debit_amount=Sum(
+                "amount", filter=Q(transaction_type=GeneralLedgerTransactionTypeChoices.DEBIT), default=Decimal(0)
+            ),
+            credit_amount=Sum(
+                "amount", filter=Q(transaction_type=GeneralLedgerTransactionTypeChoices.CREDIT), default=Decimal(0)
+            ),
+        )
+        .order_by()
     )
-    charges.update(invoice=invoice)
-    pending_previous_invoices = (
-        Invoice.objects.filter(unit=unit, lease=lease)
-        .filter(Q(status=PaymentStatusChoices.UNPAID) | Q(status=PaymentStatusChoices.REJECTED))
-        .exclude(pk=invoice.pk)
+    with transaction.atomic():
+        GeneralLedgerBalance.objects.all().delete()
+        return len(
+            GeneralLedgerBalance.objects.bulk_create(
+                (
+                    GeneralLedgerBalance(
+                        gl_account_id=balance["gl_account_id"],
+                        period=balance["period"],
+                        subscription_id=balance["gl_account__subscription_id"],
+                        debit_amount=balance["debit_amount"],
+                        credit_amount=balance["credit_amount"],
+                    )
+                    for balance in balances.iterator()
+                ),
+                batch_size=batch_size,
+            )
+        )
+
+
+def accrue_invoice_late_fees(invoices: Iterable[Invoice], today: date) -> List[GeneralLedgerTransaction]:
+    """
+    Posts the late fee of ``invoices`` accrued since their last accrual to the late fee GL accounts of their unit, as a
+    debit of the receivables account balanced by a credit of the income account, and stores the accrued late fee on
+    the invoices. A late fee that went down is reversed the same way. The financials of ``invoices`` must be current
+    as of ``today``. Uses a fixed number of queries and returns the created transactions.
+    """
+    accruals = []
+    for invoice in invoices:
+        late_fee = (invoice.payable_late_fee or Decimal(0)) if invoice.due_date < today else Decimal(0)
+        if late_fee != invoice.accrued_late_fee:
+            accruals.append((invoice, late_fee))
+    if not accruals:
+        return []
+
+    gl_accounts = {
+        (account.account_holder_object_id, account.account_type): account
+        for account in GeneralLedgerAccount.objects.filter(
+            Q(
+                account_type=GeneralLedgerAccountTypeChoices.ASSET,
+                sub_account_type=GeneralLedgerSubAccountTypeChoices.RECEIVABLES,
+            )
+            | Q(
+                account_type=GeneralLedgerAccountTypeChoices.INCOME,
+                sub_account_type=GeneralLedgerSubAccountTypeChoices.INDIRECT_INCOME,
+            ),
+            account_holder_content_type=ContentType.objects.get_for_model(Unit),
+            account_holder_object_id__in={invoice.unit_id for invoice, _ in accruals},
+            label=GeneralLedgerAccountLabelChoices.LATE_FEE,
+        )
+    }
+
+    transactions = []
+    accrued_invoices = []
+    for invoice, late_fee in accruals:
+        receivable_account = gl_accounts.get((invoice.unit_id, GeneralLedgerAccountTypeChoices.ASSET))
+        income_account = gl_accounts.get((invoice.unit_id, GeneralLedgerAccountTypeChoices.INCOME))
+        if receivable_account is None or income_account is None:
+            logger.warning(
+                "Unit %s has no late fee GL accounts, invoice %s is not accrued", invoice.unit_id, invoice.pk
+            )
+            continue
+        amount = late_fee - invoice.accrued_late_fee
+        if amount < 0:
+            receivable_account, income_account = income_account, receivable_account
+        description = f"Late fee of invoice {Invoice.SLUG}-{invoice.pk} accrued on {today}"
+        for transaction_type, gl_account in (
+            (GeneralLedgerTransactionTypeChoices.DEBIT, receivable_account),
+            (GeneralLedgerTransactionTypeChoices.CREDIT, income_account),
+        ):
+            transactions.append(
+                GeneralLedgerTransaction(
+                    transaction_type=transaction_type,
+                    amount=abs(amount),
+                    description=description,
+                    gl_account=gl_account,
+                    subscription_id=invoice.subscription_id,
+                )
+            )
+        invoice.accrued_late_fee = late_fee
+        accrued_invoices.append(invoice)
+
+    with transaction.atomic():
+        GeneralLedgerTransaction.objects.bulk_create(transactions)
+        record_general_ledger_balances(transactions)
+        Invoice.objects.bulk_update(accrued_invoices, ["accrued_late_fee"])
+
+    return transactions
+
+
+def settle_invoice_payments(events: List[InvoicePaymentEvent]) -> List[InvoicePaymentEvent]:
+    """
+    Settles the invoices paid by the pending ``events``, which must be locked by the running transaction, with a fixed
+    number of queries. The financials of the invoices are rolled forward to today, the invoices and their charges are
+    marked as paid and verified and the events as settled. Events of an invoice already paid are marked as duplicates
+    and events of an invoice locked by another transaction are left pending. Returns the processed events.
+    """
+    now = timezone.now()
+    today = timezone.localdate(now)
+    invoices = {
+        invoice.pk: invoice
+        for invoice in Invoice.objects.filter(pk__in={event.invoice_id for event in events})
+        .order_by("pk")
+        .select_for_update(skip_locked=True)
+    }
+    unpaid_invoices = [
+        invoice for invoice in invoices.values() if invoice.status != PaymentStatusChoices.PAID_VERIFIED
+    ]
+    refresh_invoice_financials(unpaid_invoices, today=today, dry_run=True)
+
+    processed_events = []
+    for event in events:
+        invoice = invoices.get(event.invoice_id)
+        if invoice is None:
+            continue
+        if invoice.status == PaymentStatusChoices.PAID_VERIFIED:
+            event.status = InvoicePaymentEvent.StatusChoices.DUPLICATE
+        else:
+            invoice.status = PaymentStatusChoices.PAID_VERIFIED
+            invoice.payed_at = today
+            invoice.payed_late_fee = max(invoice.payable_late_fee or Decimal(0), Decimal(0))
+            invoice.total_paid_amount = invoice.payable_amount
+            event.status = InvoicePaymentEvent.StatusChoices.SETTLED
+        event.settled_at = now
+        processed_events.append(event)
+
+    with transaction.atomic():
+        Invoice.objects.bulk_update(
+            unpaid_invoices,
+            [
+                *INVOICE_FINANCIAL_FIELDS,
+                "financials_updated_on",
+                "status",
+                "payed_at",
+                "payed_late_fee",
+                "total_paid_amount",
+            ],
+        )
+        Charge.objects.filter(invoice__in=unpaid_invoices).update(status=PaymentStatusChoices.PAID_VERIFIED)
+        InvoicePaymentEvent.objects.bulk_update(processed_events, ["status", "settled_at"])
+    invalidate_tenant_homes(invoice.unit_id for invoice in unpaid_invoices)
+
+    return processed_events
+
+
+def create_invoices_for_units(
+    unit_ids: Iterable[int],
+    business_info: Optional[BusinessInformation] = None,
+    dry_run: bool = False,
+) -> List[Invoice]:
+    """
+    Creates the next invoice of the active lease of every given unit using a fixed number of queries.
+
+    Leases, late fee policies, recurring charges, pending charges, last invoice intervals and pending invoices are
+    loaded for all units at once. Intervals, due dates and arrears are computed in memory and the invoices, cloned
+    recurring charges and arrears links are written with ``bulk_create``/``bulk_update`` in a single transaction.
+    Units without an active lease are skipped. With ``dry_run`` nothing is written and the unsaved invoices are
+    returned.
+    """
+    unit_ids = list(unit_ids)
+    today = timezone.now().date()
+
+    leases = {
+        lease.unit_id: lease
+        for lease in Lease.objects.filter(unit_id__in=unit_ids, status=Lease.LeaseStatus.ACTIVE)
+        .select_related("unit")
+        .only("amount", "rent_cycle", "start_date", "unit", "unit__parent_property", "unit__subscription")
+    }
+    if not leases:
+        return []
+
+    lease_unit_ids = {lease.pk: unit_id for unit_id, lease in leases.items()}
+    lease_ids = list(lease_unit_ids)
+    late_fee_policies = {
+        policy.parent_property_id: policy
+        for policy in PropertyLateFeePolicy.objects.filter(
+            parent_property_id__in={lease.unit.parent_property_id for lease in leases.values()}
+        )
+    }
+    last_interval_end_dates = dict(
+        Invoice.objects.filter(lease_id__in=lease_ids)
+        .values("lease_id")
+        .annotate(last_interval_end_date=Max("interval_end_date"))
+        .values_list("lease_id", "last_interval_end_date")
     )
-    pending_previous_invoices.update(arrear_of=invoice, arrears_amount=0)
-    invoice.arrears_amount = (
-        pending_previous_invoices.annotate_data().aggregate(payable_arrears_amount=Sum("payable_amount"))[
-            "payable_arrears_amount"
-        ]
-        or 0
+
+    recurring_charges_by_unit = defaultdict(list)
+    for charge in Charge.objects.filter(
+        charge_type=ChargeTypeChoices.RECURRING,
+        unit_id__in=leases.keys(),
+        tenant__lease_id__in=lease_ids,
+    ).only("id", *CLONED_CHARGE_FIELDS):
+        recurring_charges_by_unit[charge.unit_id].append(charge)
+
+    pending_charges = list(
+        Charge.objects.filter(
+            unit_id__in=leases.keys(),
+            status=PaymentStatusChoices.UNPAID,
+            charge_type=ChargeTypeChoices.ONE_TIME,
+            invoice=None,
+            created_at__month=today.month,
+        ).only("id", "unit_id", "amount")
     )
-    invoice.save()
-    return invoice
+
+    arrears_by_lease: dict = defaultdict(Decimal)
+    pending_invoices_by_lease = defaultdict(list)
+    for pending_invoice in Invoice.objects.filter(
+        lease_id__in=lease_ids,
+        status__in=[PaymentStatusChoices.UNPAID, PaymentStatusChoices.REJECTED],
+    ).only(
+        "id",
+        "lease_id",
+        "unit_id",
+        "parent_property_id",
+        "due_date",
+        "rent_amount",
+        "arrears_amount",
+        *INVOICE_FINANCIAL_FIELDS,
+    ):
+        if pending_invoice.unit_id != lease_unit_ids[pending_invoice.lease_id]:
+            continue
+        compute_invoice_financials(pending_invoice, late_fee_policies.get(pending_invoice.parent_property_id), today)
+        # Arrears are carried over to the new invoice, so their own arrears must not be counted twice.
+        arrears_by_lease[pending_invoice.lease_id] += pending_invoice.payable_amount - pending_invoice.arrears_amount
+        pending_invoices_by_lease[pending_invoice.lease_id].append(pending_invoice)
+
+    pending_charges_amount_by_unit: dict = defaultdict(Decimal)
+    for charge in pending_charges:
+        pending_charges_amount_by_unit[charge.unit_id] += charge.amount
+
+    invoices = []
+    for unit_id, lease in leases.items():
+        if lease.pk in last_interval_end_dates:
+            interval_start_date = last_interval_end_dates[lease.pk] + timedelta(days=1)
+        else:
+            interval_start_date = lease.start_date
+        late_fee_policy = late_fee_policies.get(lease.unit.parent_property_id)
+        # Cloned recurring charges are one time charges of the new invoice as well.
+        recurring_charges_amount = sum((charge.amount for charge in recurring_charges_by_unit[unit_id]), Decimal(0))
+        invoice = Invoice(
+            business_information=business_info,
+            lease=lease,
+            parent_property_id=lease.unit.parent_property_id,
+            unit_id=unit_id,
+            interval_start_date=interval_start_date,
+            interval_end_date=get_invoice_interval_end_date(interval_start_date, lease.rent_cycle),
+            due_date=get_invoice_due_date(late_fee_policy, today),
+            rent_amount=lease.amount,
+            arrears_amount=arrears_by_lease[lease.pk],
+            total_charges_amount=pending_charges_amount_by_unit[unit_id] + recurring_charges_amount,
+            recurring_charges_amount=recurring_charges_amount,
+            subscription_id=lease.unit.subscription_id,
+        )
+        compute_invoice_financials(invoice, late_fee_policy, today)
+        invoices.append(invoice)
+
+    if dry_run:
+        return invoices
+
+    with transaction.atomic():
+        Invoice.objects.bulk_create(invoices)
+        invoices_by_unit = {invoice.unit_id: invoice for invoice in invoices}
+
+        Charge.objects.bulk_create(
+            [
+                Charge(
+                    charge_type=ChargeTypeChoices.ONE_TIME,
+                    status=PaymentStatusChoices.UNPAID,
+                    parent_charge=charge,
+                    invoice=invoices_by_unit[unit_id],
+                    subscription_id=invoices_by_unit[unit_id].subscription_id,
+                    **{field: getattr(charge, field) for field in CLONED_CHARGE_FIELDS},
+                )
+                for unit_id, charges in recurring_charges_by_unit.items()
+                for charge in charges
+            ]
+        )
+
+        for charge in pending_charges:
+            charge.invoice = invoices_by_unit[charge.unit_id]
+        Charge.objects.bulk_update(pending_charges, ["invoice"])
+
+        pending_invoices = []
+        for invoice in invoices:
+            for pending_invoice in pending_invoices_by_lease[invoice.lease_id]:
+                pending_invoice.arrear_of = invoice
+                pending_invoice.arrears_amount = 0
+                compute_invoice_financials(
+                    pending_invoice, late_fee_policies.get(pending_invoice.parent_property_id), today
+                )
+                pending_invoices.append(pending_invoice)
+        Invoice.objects.bulk_update(
+            pending_invoices, ["arrear_of", "arrears_amount", *INVOICE_FINANCIAL_FIELDS, "financials_updated_on"]
+        )
+
+    return invoices
+
+
+def create_invoice_for_unit_lease(unit: Unit) -> Optional[Invoice]:
+    """
+    NOTE Only creates invoice when its next day of last invoice end interval or start of lease date if no invoice exists
+    """
+    invoices = create_invoices_for_units([unit.pk], business_info=BusinessInformation.objects.first())
+    return invoices[0] if invoices else None
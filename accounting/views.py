@@ -1,16 +1,23 @@
-from django.db.models import Prefetch
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db.models import F, Prefetch, Sum
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, generics, mixins, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
 
-from core.mixins import FilterQuerysetByAssociatedSubscriptionMixin
+from core.mixins import CSVExportMixin, FilterQuerysetByAssociatedSubscriptionMixin
 
-from .filters import ChargeFilter, InvoiceFilter
+from .filters import ChargeFilter, GeneralLedgerBalanceFilter, InvoiceFilter
 from .models import (
     Account,
     AccountAttachment,
     Charge,
     ChargeAttachment,
     GeneralLedgerAccount,
+    GeneralLedgerAccountTypeChoices,
+    GeneralLedgerBalance,
     GeneralLedgerTransaction,
     Invoice,
     Payment,
@@ -19,18 +26,22 @@ from .models import (
 from .serializers import (
     AccountAttachmentSerializer,
     AccountSerializer,
+    BalanceSheetSerializer,
     ChargeAttachmentSerializer,
     ChargeSerializer,
     GeneralLedgerAccountSerializer,
     GeneralLedgerTransactionSerializer,
+    IncomeStatementSerializer,
     InvoiceSerializer,
     PaymentAttachmentSerializer,
     PaymentSerializer,
+    TrialBalanceSerializer,
 )
 
 
 class InvoiceViewSet(
     FilterQuerysetByAssociatedSubscriptionMixin,
+    CSVExportMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.UpdateModelMixin,
@@ -51,9 +62,28 @@ class InvoiceViewSet(
     search_fields = ["parent_property__name", "unit__name"]
     ordering_fields = ["due_date", "rent_amount"]
     filterset_class = InvoiceFilter
+    export_fields = (
+        "id",
+        "slug",
+        "parent_property__name",
+        "unit__name",
+        "interval_start_date",
+        "interval_end_date",
+        "due_date",
+        "status",
+        "rent_amount",
+        "arrears_amount",
+        "total_charges_amount",
+        "late_fee",
+        "payable_late_fee",
+        "payable_amount",
+        "total_paid_amount",
+        "payed_at",
+        "created_at",
+    )
 
 
-class ChargeViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.ModelViewSet):
+class ChargeViewSet(FilterQuerysetByAssociatedSubscriptionMixin, CSVExportMixin, viewsets.ModelViewSet):
     queryset = (
         Charge.objects.annotate_slug()  # type: ignore[attr-defined]
         .select_related("tenant", "parent_property", "unit", "parent_charge", "invoice")
@@ -73,6 +103,21 @@ class ChargeViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.ModelV
         "created_at",
     ]
     filterset_class = ChargeFilter
+    export_fields = (
+        "id",
+        "slug",
+        "title",
+        "charge_type",
+        "status",
+        "amount",
+        "gl_account",
+        "tenant__first_name",
+        "tenant__last_name",
+        "parent_property__name",
+        "unit__name",
+        "invoice",
+        "created_at",
+    )
 
 
 class ChargeAttachmentViewSet(
@@ -112,6 +157,7 @@ class AccountAttachmentViewSet(FilterQuerysetByAssociatedSubscriptionMixin, view
 
 class PaymentViewSet(
     FilterQuerysetByAssociatedSubscriptionMixin,
+    CSVExportMixin,
     mixins.CreateModelMixin,
     mixins.RetrieveModelMixin,
     mixins.UpdateModelMixin,
@@ -132,6 +178,17 @@ class PaymentViewSet(
     }
     search_fields = ["account__account_title", "amount"]
     ordering_fields = ["payment_date", "amount", "invoice__status"]
+    export_fields = (
+        "id",
+        "invoice",
+        "invoice__status",
+        "amount",
+        "payment_method",
+        "payment_date",
+        "account__account_title",
+        "remarks",
+        "created_at",
+    )
 
 
 class PaymentAttachmentViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.ModelViewSet):
@@ -150,10 +207,125 @@ class GeneralLedgerAccountViewSet(FilterQuerysetByAssociatedSubscriptionMixin, v
     filterset_fields = ["account_type", "sub_account_type"]
 
 
-class GeneralLedgerTransactionViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.ReadOnlyModelViewSet):
+class GeneralLedgerTransactionViewSet(
+    FilterQuerysetByAssociatedSubscriptionMixin, CSVExportMixin, viewsets.ReadOnlyModelViewSet
+):
     queryset = GeneralLedgerTransaction.objects.select_related("gl_account").order_by("-pk")
     serializer_class = GeneralLedgerTransactionSerializer
     filter_backends = [filters.SearchFilter, filters.OrderingFilter, DjangoFilterBackend]
     search_fields = ["gl_account__account_holder_content_type__model"]
     ordering_fields = ["transaction_type", "amount"]
     filterset_fields = ["transaction_type", "gl_account", "gl_account__account_type"]
+    export_fields = (
+        "id",
+        "transaction_type",
+        "amount",
+        "description",
+        "gl_account",
+        "gl_account__account_type",
+        "gl_account__sub_account_type",
+        "created_at",
+    )
+
+
+class GeneralLedgerBalanceViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.GenericViewSet):
+    """
+    Financial reports aggregated from the monthly GL balances instead of the transactions. The trial balance and the
+    balance sheet are taken at the month of ``end_date``, the income statement covers the months from ``start_date``
+    to ``end_date``. Reports can be narrowed to a ``unit`` or a ``parent_property`` and its units.
+    """
+
+    queryset = GeneralLedgerBalance.objects.all()
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = GeneralLedgerBalanceFilter
+
+    def get_serializer_class(self):
+        if self.action == "balance_sheet":
+            return BalanceSheetSerializer
+        elif self.action == "income_statement":
+            return IncomeStatementSerializer
+        else:
+            return TrialBalanceSerializer
+
+    def get_account_balances(self, account_types=None):
+        queryset = self.filter_queryset(self.get_queryset())
+        if account_types is not None:
+            queryset = queryset.filter(gl_account__account_type__in=account_types)
+        account_balances = (
+            queryset.values(
+                "gl_account",
+                account_type=F("gl_account__account_type"),
+                sub_account_type=F("gl_account__sub_account_type"),
+                label=F("gl_account__label"),
+                account_holder_content_type=F("gl_account__account_holder_content_type"),
+                account_holder_object_id=F("gl_account__account_holder_object_id"),
+            )
+            .annotate(total_debit_amount=Sum("debit_amount"), total_credit_amount=Sum("credit_amount"))
+            .order_by("gl_account")
+        )
+        accounts = []
+        for account_balance in account_balances:
+            debit_amount = account_balance.pop("total_debit_amount")
+            credit_amount = account_balance.pop("total_credit_amount")
+            # Assets and expenses have a debit normal balance, the other account types a credit one.
+            if account_balance["account_type"] in (
+                GeneralLedgerAccountTypeChoices.ASSET,
+                GeneralLedgerAccountTypeChoices.EXPENSE,
+            ):
+                balance = debit_amount - credit_amount
+            else:
+                balance = credit_amount - debit_amount
+            accounts.append(
+                {**account_balance, "debit_amount": debit_amount, "credit_amount": credit_amount, "balance": balance}
+            )
+        return accounts
+
+    @staticmethod
+    def get_totals_by_account_type(accounts):
+        totals: dict = defaultdict(Decimal)
+        for account in accounts:
+            totals[account["account_type"]] += account["balance"]
+        return totals
+
+    @action(detail=False, methods=["get"], url_path="trial-balance")
+    def trial_balance(self, request):
+        accounts = self.get_account_balances()
+        data = {
+            "accounts": accounts,
+            "total_debit_amount": sum((account["debit_amount"] for account in accounts), Decimal(0)),
+            "total_credit_amount": sum((account["credit_amount"] for account in accounts), Decimal(0)),
+        }
+        return Response(self.get_serializer(data).data)
+
+    @action(detail=False, methods=["get"], url_path="balance-sheet")
+    def balance_sheet(self, request):
+        accounts = self.get_account_balances(
+            [
+                GeneralLedgerAccountTypeChoices.ASSET,
+                GeneralLedgerAccountTypeChoices.LIABILITY,
+                GeneralLedgerAccountTypeChoices.EQUITY,
+            ]
+        )
+        totals = self.get_totals_by_account_type(accounts)
+        data = {
+            "accounts": accounts,
+            "total_assets": totals[GeneralLedgerAccountTypeChoices.ASSET],
+            "total_liabilities": totals[GeneralLedgerAccountTypeChoices.LIABILITY],
+            "total_equity": totals[GeneralLedgerAccountTypeChoices.EQUITY],
+        }
+        return Response(self.get_serializer(data).data)
+
+    @action(detail=False, methods=["get"], url_path="income-statement")
+    def income_statement(self, request):
+        accounts = self.get_account_balances(
+            [GeneralLedgerAccountTypeChoices.INCOME, GeneralLedgerAccountTypeChoices.EXPENSE]
+        )
+        totals = self.get_totals_by_account_type(accounts)
+        data = {
+            "accounts": accounts,
+            "total_income": totals[GeneralLedgerAccountTypeChoices.INCOME],
+            "total_expenses": totals[GeneralLedgerAccountTypeChoices.EXPENSE],
+            "net_income": totals[GeneralLedgerAccountTypeChoices.INCOME]
+            - totals[GeneralLedgerAccountTypeChoices.EXPENSE],
+        }
+        return Response(self.get_serializer(data).data)
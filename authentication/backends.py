@@ -0,0 +1,94 @@
+import time
+from uuid import uuid4
+
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication  # type: ignore[import]
+from rest_framework_simplejwt.settings import api_settings  # type: ignore[import]
+from rest_framework_simplejwt.utils import get_md5_hash_password  # type: ignore[import]
+
+from core.utils import LRUCache
+
+AUTH_VERSION_CACHE_KEY = "auth-version:{user_id}"
+AUTH_VERSION_CLAIM = "auth_version"
+USER_PERMISSIONS_CACHE_KEY = "user-permissions:{user_id}"
+USER_PERMISSIONS_CACHE_TIMEOUT = 24 * 60 * 60
+
+user_cache = LRUCache(settings.JWT_USER_CACHE_SIZE)
+
+
+def get_auth_version(user_id) -> str:
+    """
+    Returns the current version of the account, groups and permissions of a user. It changes whenever one of them is
+    changed, see ``authentication.signals``.
+    """
+    cache_key = AUTH_VERSION_CACHE_KEY.format(user_id=user_id)
+    auth_version = cache.get(cache_key)
+    if auth_version is None:
+        cache.add(cache_key, uuid4().hex, None)
+        auth_version = cache.get(cache_key)
+    return auth_version
+
+
+def bump_auth_versions(user_ids):
+    cache.delete_many([AUTH_VERSION_CACHE_KEY.format(user_id=user_id) for user_id in user_ids])
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication serving the users from an in-process LRU cache of ``JWT_USER_CACHE_SIZE`` users instead of
+    fetching them on every request. Cached users also keep the permissions Django caches on them. A cached user is used
+    for ``JWT_USER_CACHE_TIMEOUT`` seconds at most, as long as the auth version of the user is the one it was loaded
+    with.
+
+    Tokens are validated as by ``JWTAuthentication``; a cached user must not be changed by the request.
+    """
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None:
+            return super().get_user(validated_token)
+
+        auth_version = get_auth_version(user_id)
+        cached_user = user_cache.get(user_id)
+        if (
+            cached_user is None
+            or cached_user[0] != auth_version
+            or cached_user[1] < time.monotonic() - settings.JWT_USER_CACHE_TIMEOUT
+        ):
+            user = super().get_user(validated_token)
+            user_cache.set(user_id, (auth_version, time.monotonic(), user))
+            return user
+
+        user = cached_user[2]
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            return super().get_user(validated_token)
+        return user
+
+
+class CachedModelBackend(ModelBackend):
+    """
+    Model backend resolving the permissions of a user from the shared cache. The cached permissions are used as long as
+    the auth version of the user is the one they were resolved with.
+    """
+
+    def get_all_permissions(self, user_obj, obj=None):
+        if not user_obj.is_active or user_obj.is_anonymous or obj is not None:
+            return set()
+        if not hasattr(user_obj, "_perm_cache"):
+            user_obj._perm_cache = self.get_cached_permissions(user_obj)
+        return user_obj._perm_cache
+
+    def get_cached_permissions(self, user_obj):
+        auth_version = get_auth_version(user_obj.pk)
+        cache_key = USER_PERMISSIONS_CACHE_KEY.format(user_id=user_obj.pk)
+        cached_permissions = cache.get(cache_key)
+        if cached_permissions is not None and cached_permissions[0] == auth_version:
+            return cached_permissions[1]
+
+        permissions = {*self.get_user_permissions(user_obj), *self.get_group_permissions(user_obj)}
+        cache.set(cache_key, (auth_version, permissions), USER_PERMISSIONS_CACHE_TIMEOUT)
+        return permissions
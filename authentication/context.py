@@ -0,0 +1,84 @@
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+USER_CONTEXT_CACHE_KEY = "user-context:{user_id}"
+USER_CONTEXT_REQUEST_ATTR = "_user_context"
+
+
+@dataclass(frozen=True)
+class UserContext:
+    """
+    Facts about the current user that most requests need: its subscription, its role flags and its current tenant
+    record, i.e. the latest one, with the lease and the unit of that tenant.
+    """
+
+    subscription_id: Optional[int] = None
+    is_superuser: bool = False
+    is_admin: bool = False
+    is_tenant: bool = False
+    is_subscription_staff: bool = False
+    tenant_id: Optional[int] = None
+    lease_id: Optional[int] = None
+    lease_status: Optional[str] = None
+    unit_id: Optional[int] = None
+
+
+def build_user_context(user_id) -> UserContext:
+    from people.models import Tenant
+
+    User = get_user_model()
+    user = (
+        User.objects.annotate_is_tenant_is_admin()
+        .values("associated_subscription_id", "is_superuser", "is_admin", "is_tenant", "is_subscription_staff")
+        .get(pk=user_id)
+    )
+    tenant = (
+        Tenant.objects.filter(user_id=user_id)
+        .order_by("-created_at")
+        .values("id", "lease_id", "lease__status", "lease__unit_id")
+        .first()
+    ) or {}
+    return UserContext(
+        subscription_id=user["associated_subscription_id"],
+        is_superuser=user["is_superuser"],
+        is_admin=user["is_admin"],
+        is_tenant=user["is_tenant"],
+        is_subscription_staff=user["is_subscription_staff"],
+        tenant_id=tenant.get("id"),
+        lease_id=tenant.get("lease_id"),
+        lease_status=tenant.get("lease__status"),
+        unit_id=tenant.get("lease__unit_id"),
+    )
+
+
+def get_user_context(request) -> UserContext:
+    """
+    Returns the :py:class:`UserContext` of ``request.user``. It is built once per request, from a shared cache entry
+    kept for ``USER_CONTEXT_CACHE_TIMEOUT`` seconds and invalidated by the signals of ``authentication.signals``.
+    """
+    user = request.user
+    user_context = getattr(request, USER_CONTEXT_REQUEST_ATTR, None)
+    if user_context is not None and user_context[0] == user.pk:
+        return user_context[1]
+
+    if not user.is_authenticated:
+        return UserContext()
+
+    cache_key = USER_CONTEXT_CACHE_KEY.format(user_id=user.pk)
+    cached_data = cache.get(cache_key)
+    if cached_data is None:
+        context = build_user_context(user.pk)
+        cache.set(cache_key, asdict(context), settings.USER_CONTEXT_CACHE_TIMEOUT)
+    else:
+        context = UserContext(**cached_data)
+
+    setattr(request, USER_CONTEXT_REQUEST_ATTR, (user.pk, context))
+    return context
+
+
+def invalidate_user_contexts(user_ids):
+    cache.delete_many([USER_CONTEXT_CACHE_KEY.format(user_id=user_id) for user_id in user_ids])
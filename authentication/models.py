@@ -7,7 +7,7 @@ import stripe
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.db import models
-from django.db.models.signals import m2m_changed, post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 from djstripe.models import Customer
@@ -64,24 +64,66 @@ class Role(CommonInfoAbstractModel):
         return self.name
 
 
+def sync_role_user_groups(user_ids):
+    """
+    Sets the groups of the users to the groups of their roles, with one delete and one insert on the through table.
+    """
+    from .backends import bump_auth_versions
+
+    user_ids = set(user_ids)
+    if not user_ids:
+        return
+    UserGroup = User.groups.through
+    user_groups = (
+        Role.users.through.objects.filter(user_id__in=user_ids, role__groups__isnull=False)
+        .values_list("user_id", "role__groups")
+        .distinct()
+    )
+    UserGroup.objects.filter(user_id__in=user_ids).delete()
+    UserGroup.objects.bulk_create(
+        [UserGroup(user_id=user_id, group_id=group_id) for user_id, group_id in user_groups], ignore_conflicts=True
+    )
+    # Through table operations do not send m2m_changed, the permissions of the users are invalidated here instead.
+    bump_auth_versions(user_ids)
+
+
+def get_role_user_ids(sender, instance, pk_set):
+    """
+    Returns the ids of the users whose groups depend on the changed roles.
+    """
+    if isinstance(instance, Role):
+        if sender is Role.users.through and pk_set is not None:
+            return list(pk_set)
+        role_ids = [instance.pk]
+    else:
+        role_ids = list(pk_set) if pk_set is not None else list(instance.roles.values_list("pk", flat=True))
+    return list(Role.users.through.objects.filter(role_id__in=role_ids).values_list("user_id", flat=True))
+
+
 @receiver(m2m_changed, sender=Role.groups.through)
 @receiver(m2m_changed, sender=Role.users.through)
-def update_role_user_groups(sender, instance, action, **kwargs):
-    if isinstance(instance, Role):
-        if action == "pre_add" or action == "pre_remove" or action == "pre_clear":
-            for user in instance.users.all():
-                user.groups.clear()
+def update_role_user_groups(sender, instance, action, pk_set, **kwargs):
+    if isinstance(instance, User):
+        if action in ("post_add", "post_remove", "post_clear"):
+            sync_role_user_groups([instance.pk])
+        return
+
+    if action == "pre_clear":
+        instance._role_user_ids = get_role_user_ids(sender, instance, pk_set=None)
+    elif action == "post_clear":
+        sync_role_user_groups(instance._role_user_ids)
+    elif action in ("post_add", "post_remove"):
+        sync_role_user_groups(get_role_user_ids(sender, instance, pk_set))
+
 
-        elif action == "post_add" or action == "post_remove" or action == "post_clear":
-            for user in instance.users.all():
-                user.groups.set(instance.groups.all())
+@receiver(pre_delete, sender=Role)
+def collect_deleted_role_user_ids(sender, instance, **kwargs):
+    instance._role_user_ids = list(instance.users.values_list("pk", flat=True))
 
-    elif isinstance(instance, User):
-        if action == "pre_add" or action == "pre_remove" or action == "pre_clear":
-            instance.groups.clear()
 
-        elif action == "post_add" or action == "post_remove" or action == "post_clear":
-            instance.groups.set(instance.roles.all().values_list("groups", flat=True))
+@receiver(post_delete, sender=Role)
+def update_deleted_role_user_groups(sender, instance, **kwargs):
+    sync_role_user_groups(instance._role_user_ids)
 
 
 @receiver(post_save, sender=User)
@@ -1,6 +1,7 @@
-from .user import GroupSerializer, UserSerializer
+from .user import AuditUserSerializer, GroupSerializer, UserSerializer
 
 __all__ = [
+    "AuditUserSerializer",
     "UserSerializer",
     "GroupSerializer",
 ]
@@ -1,50 +1,65 @@
 from typing import List, Optional
 
 from django.contrib.auth import get_user_model
-from django.contrib.auth.models import Group
-from django.core.exceptions import ObjectDoesNotExist
+from django.contrib.auth.models import Group, update_last_login
 from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer  # type: ignore[import]
+from rest_framework_simplejwt.serializers import TokenObtainSerializer  # type: ignore[import]
+from rest_framework_simplejwt.settings import api_settings as jwt_settings  # type: ignore[import]
+from rest_framework_simplejwt.tokens import RefreshToken  # type: ignore[import]
+
+from ..backends import AUTH_VERSION_CLAIM, CachedModelBackend, get_auth_version
 
 User = get_user_model()
 
 
-class AdminTokenObtainPairSerializer(TokenObtainPairSerializer):
+class SubscriptionTokenObtainPairSerializer(TokenObtainSerializer):
+    """
+    Issues a token pair to the users allowed by ``is_allowed``. The tokens carry the subscription, the role flags and
+    the auth version of the user as claims, which access tokens obtained by refreshing them inherit.
+    """
+
+    token_class = RefreshToken
+    role_flag: str
+
+    def is_allowed(self, user) -> bool:
+        raise NotImplementedError
+
     def validate(self, attrs):
         data = super().validate(attrs)
-        email = attrs.get("email")
-        try:
-            user = User.objects.annotate_is_tenant_is_admin().get(email=email)
-            data["is_admin"] = user.is_admin
+        user = User.objects.annotate_is_tenant_is_admin().get(pk=self.user.pk)
+        if not self.is_allowed(user) or user.associated_subscription_id is None:
+            raise serializers.ValidationError(
+                {"detail": "You are not allowed to login. Please contact your administrator."}
+            )
 
-            if (user.is_admin or user.is_subscription_staff) and user.associated_subscription is not None:
-                return data
-            else:
-                raise serializers.ValidationError(
-                    {"detail": "You are not allowed to login. Please contact your administrator."}
-                )
+        if jwt_settings.UPDATE_LAST_LOGIN:
+            update_last_login(None, user)
+        # Warm up the permissions of the user for its first requests.
+        CachedModelBackend().get_all_permissions(user)
 
-        except ObjectDoesNotExist:
-            pass
+        refresh = self.get_token(user)
+        refresh["subscription_id"] = user.associated_subscription_id
+        refresh["is_admin"] = user.is_admin
+        refresh["is_tenant"] = user.is_tenant
+        refresh[AUTH_VERSION_CLAIM] = get_auth_version(user.pk)
+        data["refresh"] = str(refresh)
+        data["access"] = str(refresh.access_token)
+        data[self.role_flag] = getattr(user, self.role_flag)
+        return data
 
 
-class TenantTokenObtainPairSerializer(TokenObtainPairSerializer):
-    def validate(self, attrs):
-        data = super().validate(attrs)
-        email = attrs.get("email")
-        try:
-            user = User.objects.annotate_is_tenant_is_admin().get(email=email)
-            data["is_tenant"] = user.is_tenant
+class AdminTokenObtainPairSerializer(SubscriptionTokenObtainPairSerializer):
+    role_flag = "is_admin"
+
+    def is_allowed(self, user) -> bool:
+        return user.is_admin or user.is_subscription_staff
 
-            if (not user.is_admin and user.is_tenant) and user.associated_subscription is not None:
-                return data
-            else:
-                raise serializers.ValidationError(
-                    {"detail": "You are not allowed to login. Please contact your administrator."}
-                )
 
-        except ObjectDoesNotExist:
-            pass
+class TenantTokenObtainPairSerializer(SubscriptionTokenObtainPairSerializer):
+    role_flag = "is_tenant"
+
+    def is_allowed(self, user) -> bool:
+        return not user.is_admin and user.is_tenant
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -104,11 +119,21 @@ class UserSerializer(serializers.ModelSerializer):
 
     def get_group_names(self, obj) -> Optional[List[str]]:
         if isinstance(obj, User):
-            return list(obj.groups.values_list("name", flat=True))
+            return [group.name for group in obj.groups.all()]
         else:
             return None
 
 
+class AuditUserSerializer(serializers.ModelSerializer):
+    """
+    Compact representation of the user who created or last modified an object.
+    """
+
+    class Meta:
+        model = User
+        fields = ("id", "first_name", "last_name")
+
+
 class GroupSerializer(serializers.ModelSerializer):
     class Meta:
         model = Group
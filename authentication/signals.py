@@ -0,0 +1,70 @@
+from django.contrib.auth.models import Group, Permission
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .backends import bump_auth_versions
+from .context import invalidate_user_contexts
+from .models import Role, User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_context(sender, instance, **kwargs):
+    invalidate_user_contexts([instance.pk])
+    bump_auth_versions([instance.pk])
+
+
+@receiver(post_save, sender="people.Tenant")
+@receiver(post_delete, sender="people.Tenant")
+def invalidate_tenant_user_context(sender, instance, **kwargs):
+    invalidate_user_contexts([instance.user_id])
+
+
+@receiver(post_save, sender="lease.Lease")
+def invalidate_lease_tenant_user_context(sender, instance, created, **kwargs):
+    # The tenant of a new lease is saved afterwards and invalidates the context of its user itself.
+    if not created:
+        from people.models import Tenant
+
+        invalidate_user_contexts(Tenant.objects.filter(lease=instance).values_list("user_id", flat=True))
+
+
+@receiver(m2m_changed, sender=Role.users.through)
+def invalidate_role_user_contexts(sender, instance, action, pk_set, **kwargs):
+    if isinstance(instance, User):
+        user_ids = [instance.pk]
+    elif action == "pre_clear":
+        user_ids = list(instance.users.values_list("pk", flat=True))
+    elif action in ("post_add", "post_remove"):
+        user_ids = list(pk_set)
+    else:
+        return
+    invalidate_user_contexts(user_ids)
+    bump_auth_versions(user_ids)
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(m2m_changed, sender=User.user_permissions.through)
+def bump_user_auth_versions(sender, instance, action, pk_set, **kwargs):
+    if isinstance(instance, User):
+        bump_auth_versions([instance.pk])
+    elif action == "pre_clear":
+        bump_auth_versions(instance.user_set.values_list("pk", flat=True))
+    elif action in ("post_add", "post_remove"):
+        bump_auth_versions(pk_set)
+
+
+@receiver(m2m_changed, sender=Group.permissions.through)
+def bump_group_users_auth_versions(sender, instance, action, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if isinstance(instance, Group):
+        bump_auth_versions(instance.user_set.values_list("pk", flat=True))
+    elif isinstance(instance, Permission):
+        group_ids = instance.group_set.values_list("pk", flat=True) if action == "pre_clear" else pk_set
+        bump_auth_versions(User.objects.filter(groups__in=group_ids).values_list("pk", flat=True))
+
+
+@receiver(pre_delete, sender=Group)
+def bump_deleted_group_users_auth_versions(sender, instance, **kwargs):
+    bump_auth_versions(instance.user_set.values_list("pk", flat=True))
@@ -0,0 +1,77 @@
+import pytest
+from django.urls import reverse
+from pytest_django.asserts import assertNumQueries
+from rest_framework_simplejwt.tokens import RefreshToken  # type: ignore[import]
+
+from ..backends import user_cache
+from ..models import User
+
+
+@pytest.mark.django_db
+def test_cached_jwt_authentication(api_client, user_with_permissions, group_factory):
+    """
+    Testing :py:class:`authentication.backends.CachedJWTAuthentication`
+    """
+    user_cache.clear()
+    user = user_with_permissions([("authentication", "role")])
+    access_token = str(RefreshToken.for_user(user).access_token)
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
+    url = reverse("authentication:role-list")
+
+    # user, user permissions, group permissions, roles
+    with assertNumQueries(4):
+        response = api_client.get(url)
+
+    assert response.status_code == 200
+
+    with assertNumQueries(1):
+        response = api_client.get(url)
+
+    assert response.status_code == 200
+
+    user.groups.add(group_factory())
+
+    with assertNumQueries(4):
+        response = api_client.get(url)
+
+    assert response.status_code == 200
+
+    user.is_active = False
+    user.save()
+
+    response = api_client.get(url)
+
+    assert response.status_code == 401
+
+
+@pytest.mark.django_db
+def test_cached_model_backend(user_factory, group_factory, role_factory, get_permissions):
+    """
+    Testing :py:class:`authentication.backends.CachedModelBackend`
+    """
+    permissions = get_permissions([("authentication", "role")])
+    group = group_factory()
+    group.permissions.set(permissions)
+    user = user_factory()
+    role = role_factory(groups=(group,), users=(user,))
+
+    # user permissions, group permissions
+    with assertNumQueries(2):
+        assert user.has_perm("authentication.view_role")
+
+    user = User.objects.get(pk=user.pk)
+
+    with assertNumQueries(0):
+        assert user.has_perm("authentication.view_role")
+
+    group.permissions.remove(next(permission for permission in permissions if permission.codename == "view_role"))
+    user = User.objects.get(pk=user.pk)
+
+    assert not user.has_perm("authentication.view_role")
+    assert user.has_perm("authentication.add_role")
+
+    role.delete()
+    user = User.objects.get(pk=user.pk)
+
+    assert user.groups.count() == 0
+    assert not user.has_perm("authentication.add_role")
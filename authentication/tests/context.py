@@ -0,0 +1,41 @@
+import pytest
+from django.core.cache import cache
+
+from ..context import USER_CONTEXT_CACHE_KEY, UserContext, get_user_context
+
+
+@pytest.mark.django_db
+def test_get_user_context(api_rf, tenant_user_with_permissions, django_assert_num_queries):
+    """
+    Testing :py:func:`authentication.context.get_user_context`
+    """
+    user, lease = tenant_user_with_permissions([])
+    request = api_rf.get("/")
+    request.user = user
+
+    with django_assert_num_queries(2):
+        user_context = get_user_context(request)
+        get_user_context(request)
+
+    assert user_context == UserContext(
+        subscription_id=user.associated_subscription_id,
+        is_tenant=True,
+        tenant_id=lease.primary_tenant.id,
+        lease_id=lease.id,
+        lease_status="ACTIVE",
+        unit_id=lease.unit_id,
+    )
+
+    request = api_rf.get("/")
+    request.user = user
+
+    with django_assert_num_queries(0):
+        assert get_user_context(request) == user_context
+
+    lease.status = "CLOSED"
+    lease.save()
+    request = api_rf.get("/")
+    request.user = user
+
+    assert cache.get(USER_CONTEXT_CACHE_KEY.format(user_id=user.pk)) is None
+    assert get_user_context(request).lease_status == "CLOSED"
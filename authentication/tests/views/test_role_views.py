@@ -69,7 +69,7 @@ def test_role_list(api_rf, user_with_permissions, role_factory, query_params, in
             },
             None,
             201,
-            10,
+            9,
             1,
         ),
     ),
@@ -136,7 +136,7 @@ def test_role_update(api_rf, role_factory, group_factory, user_with_permissions)
         "groups": [group.pk],
     }
 
-    with assertNumQueries(11):
+    with assertNumQueries(10):
         url = reverse("authentication:role-detail", kwargs={"pk": role.id})
         request = api_rf.patch(url, data, format="json")
         request.user = user
@@ -157,7 +157,7 @@ def test_role_delete(api_rf, role_factory, user_with_permissions):
     user = user_with_permissions([("authentication", "role")])
     role = role_factory(subscription=user.associated_subscription)
 
-    with assertNumQueries(6):
+    with assertNumQueries(7):
         url = reverse("authentication:role-detail", kwargs={"pk": role.id})
         request = api_rf.delete(url, format="json")
         request.user = user
@@ -2,7 +2,9 @@ import pytest
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from pytest_django.asserts import assertNumQueries
-from rest_framework_simplejwt.tokens import RefreshToken  # type: ignore[import]
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken  # type: ignore[import]
+
+from authentication.backends import AUTH_VERSION_CLAIM, get_auth_version
 
 User = get_user_model()
 
@@ -94,16 +96,23 @@ def test_admin_token_obtain_pair_give_success(api_client, user_factory, email, p
     """
     Testing that token obtain pair executes successfully when valid input is provided.
     """
-    user_factory(username="lindacarr", email="matthewhughes@example.net", password="Q)t8JXi_(5")
+    user = user_factory(username="lindacarr", email="matthewhughes@example.net", password="Q)t8JXi_(5")
     request_data = {"email": email, "password": password}
 
-    with assertNumQueries(4):
+    with assertNumQueries(5):
         response = api_client.post(reverse("authentication:admin_token_obtain_pair"), request_data)
 
     assert response.status_code == 200
     assert "access" in response.data
     assert "refresh" in response.data
 
+    access_token = AccessToken(response.data["access"])
+
+    assert access_token["subscription_id"] == user.associated_subscription_id
+    assert access_token["is_admin"] is False
+    assert access_token["is_tenant"] is False
+    assert access_token[AUTH_VERSION_CLAIM] == get_auth_version(user.pk)
+
 
 @pytest.mark.parametrize(
     "email, password, status_code, expected_response",
@@ -209,7 +218,7 @@ def test_tenant_token_obtain_pair_give_success(api_client, user_factory, email,
 
     request_data = {"email": email, "password": password}
 
-    with assertNumQueries(4):
+    with assertNumQueries(5):
         response = api_client.post(reverse("authentication:tenant_token_obtain_pair"), request_data)
 
     assert response.status_code == 200
@@ -11,21 +11,21 @@ User = get_user_model()
 @pytest.mark.parametrize(
     "query_params, index_result, num_queries",
     (
-        ({"search": "ard"}, [0], 7),
-        ({"search": "row"}, [0], 7),
-        ({"search": "tt7"}, [0], 7),
-        ({"search": "USR-999"}, [0], 7),
-        ({"search": "nit"}, [1], 7),
-        ({"search": "rci"}, [1], 7),
-        ({"search": "eher"}, [1], 7),
-        ({"search": "USR-1000"}, [1], 7),
-        ({"search": "chel"}, [2], 7),
-        ({"search": "llow"}, [2], 7),
-        ({"search": "e_ga"}, [2], 7),
-        ({"search": "USR-1001"}, [2], 7),
-        ({"search": "w"}, [2, 0], 11),
-        ({"search": "ga"}, [2, 1], 11),
-        ({"is_tenant": True}, [1], 7),
+        ({"search": "ard"}, [0], 6),
+        ({"search": "row"}, [0], 6),
+        ({"search": "tt7"}, [0], 6),
+        ({"search": "USR-999"}, [0], 6),
+        ({"search": "nit"}, [1], 6),
+        ({"search": "rci"}, [1], 6),
+        ({"search": "eher"}, [1], 6),
+        ({"search": "USR-1000"}, [1], 6),
+        ({"search": "chel"}, [2], 6),
+        ({"search": "llow"}, [2], 6),
+        ({"search": "e_ga"}, [2], 6),
+        ({"search": "USR-1001"}, [2], 6),
+        ({"search": "w"}, [2, 0], 7),
+        ({"search": "ga"}, [2, 1], 7),
+        ({"is_tenant": True}, [1], 6),
     ),
 )
 @pytest.mark.django_db
@@ -110,7 +110,7 @@ def test_user_list(api_rf, user_with_permissions, lease_factory, query_params, i
             },
             None,
             201,
-            17,
+            16,
             2,
         ),
     ),
@@ -158,7 +158,7 @@ def test_user_retrieve(api_rf, user_with_permissions):
 
     user = user_with_permissions([("authentication", "user")])
 
-    with assertNumQueries(7):
+    with assertNumQueries(6):
         url = reverse("authentication:user-detail", kwargs={"pk": user.id})
         request = api_rf.get(url, format="json")
         request.user = user
@@ -213,7 +213,7 @@ def test_user_update(api_rf, user_with_permissions):
         "other_information": "Lorem ipsum dolor sit amet.",
     }
 
-    with assertNumQueries(14):
+    with assertNumQueries(15):
         url = reverse("authentication:user-detail", kwargs={"pk": user.id})
         request = api_rf.patch(url, data, format="json")
         request.user = user
@@ -233,7 +233,7 @@ def test_user_delete(api_rf, user_with_permissions):
 
     user = user_with_permissions([("authentication", "user")])
 
-    with assertNumQueries(178):
+    with assertNumQueries(180):
         url = reverse("authentication:user-detail", kwargs={"pk": user.id})
         request = api_rf.delete(url, format="json")
         request.user = user
@@ -16,7 +16,12 @@ User = get_user_model()
 
 
 class UserViewSet(viewsets.ModelViewSet):
-    queryset = User.objects.annotate_slug().annotate_is_tenant_is_admin().order_by("-pk")  # type: ignore[attr-defined]
+    queryset = (
+        User.objects.annotate_slug()  # type: ignore[attr-defined]
+        .annotate_is_tenant_is_admin()
+        .prefetch_related("groups", "roles")
+        .order_by("-pk")
+    )
     filter_backends = [SearchFilter, DjangoFilterBackend]
     search_fields = ["first_name", "last_name", "username", "email", "slug"]
     filterset_class = UserFilter
@@ -38,7 +43,12 @@ class CurrentUserDetailsAPIView(generics.RetrieveAPIView):
     serializer_class = UserSerializer
 
     def get_object(self):
-        return User.objects.annotate_slug().annotate_is_tenant_is_admin().get(pk=self.request.user.pk)
+        return (
+            User.objects.annotate_slug()  # type: ignore[attr-defined]
+            .annotate_is_tenant_is_admin()
+            .prefetch_related("groups", "roles")
+            .get(pk=self.request.user.pk)
+        )
 
 
 class RoleViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.ModelViewSet):
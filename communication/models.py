@@ -108,6 +108,12 @@ class EmailTemplate(BaseEmailAbstractModel):
 
 
 class Email(BaseEmailAbstractModel):
+    class StatusChoices(models.TextChoices):
+        QUEUED = "QUEUED", "Queued"
+        SENDING = "SENDING", "Sending"
+        SENT = "SENT", "Sent"
+        FAILED = "FAILED", "Failed"
+
     recipient_emails = ArrayField(
         models.EmailField(),
         blank=True,
@@ -121,6 +127,8 @@ class Email(BaseEmailAbstractModel):
         blank=True,
         null=True,
     )
+    status = models.CharField(max_length=10, choices=StatusChoices.choices, default=StatusChoices.QUEUED)
+    sent_at = models.DateTimeField(blank=True, null=True)
 
 
 class EmailAttachment(BaseAttachment, CommonInfoAbstractModel):
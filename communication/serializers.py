@@ -1,7 +1,7 @@
+from django.db import transaction
 from django.utils import timezone
 from rest_framework import serializers
 
-from authentication.serializers import UserSerializer
 from core.serializers import ModifiedByAbstractSerializer
 from property.models import Property, Unit
 
@@ -16,7 +16,7 @@ from .models import (
     Note,
     NoteAttachment,
 )
-from .utils import send_email_from_email_model
+from .tasks import send_email_task
 
 
 class ContactSerializer(ModifiedByAbstractSerializer):
@@ -40,8 +40,6 @@ class ContactSerializer(ModifiedByAbstractSerializer):
 
 
 class NoteAttachmentSerializer(ModifiedByAbstractSerializer):
-    created_by = UserSerializer(many=False, read_only=True)
-
     class Meta:
         model = NoteAttachment
         fields = (
@@ -121,7 +119,6 @@ class EmailSignatureSerializer(ModifiedByAbstractSerializer):
 
 class EmailTemplateSerializer(ModifiedByAbstractSerializer):
     recipient_emails = serializers.SerializerMethodField()
-    created_by = UserSerializer(many=False, read_only=True)
 
     class Meta:
         model = EmailTemplate
@@ -150,8 +147,6 @@ class EmailTemplateSerializer(ModifiedByAbstractSerializer):
 
 
 class EmailAttachmentSerializer(ModifiedByAbstractSerializer):
-    created_by = UserSerializer(many=False, read_only=True)
-
     class Meta:
         model = EmailAttachment
         fields = (
@@ -168,7 +163,6 @@ class EmailAttachmentSerializer(ModifiedByAbstractSerializer):
 
 class EmailSerializer(ModifiedByAbstractSerializer):
     attachments = EmailAttachmentSerializer(many=True, required=False)
-    created_by = UserSerializer(many=False, read_only=True)
 
     class Meta:
         model = Email
@@ -186,10 +180,12 @@ class EmailSerializer(ModifiedByAbstractSerializer):
             "body",
             "signature",
             "attachments",
+            "status",
+            "sent_at",
             "created_by",
             "created_at",
         )
-        read_only_fields = ("id",)
+        read_only_fields = ("id", "status", "sent_at")
 
     def create(self, validated_data):
         attachments_data = validated_data.pop("attachments")
@@ -199,7 +195,7 @@ class EmailSerializer(ModifiedByAbstractSerializer):
             EmailAttachment.objects.create(
                 email=email, created_by=user, subscription=user.associated_subscription, **attachment_data
             )
-        send_email_from_email_model(email)
+        transaction.on_commit(lambda: send_email_task.delay(email.id))
         return email
 
 
@@ -252,8 +248,6 @@ class AnnouncementSerializer(ModifiedByAbstractSerializer):
 
 
 class AnnouncementAttachmentSerializer(ModifiedByAbstractSerializer):
-    created_by = UserSerializer(many=False, read_only=True)
-
     class Meta:
         model = AnnouncementAttachment
         fields = (
@@ -0,0 +1,74 @@
+import logging
+from smtplib import SMTPException
+from typing import List
+
+from botocore.exceptions import ClientError  # type: ignore[import]
+from celery import chord, shared_task  # type: ignore[import]
+from django.conf import settings
+from django.core.mail import get_connection
+from django.utils import timezone
+
+from core.utils import chunked
+
+from .models import Email
+from .utils import build_email_messages, fetch_email_attachments, remove_email_attachments
+
+logger = logging.getLogger(__name__)
+
+EMAIL_RETRY_BACKOFF = 60
+
+
+@shared_task
+def send_email_task(email_id: int):
+    """
+    Sends ``email`` to its recipients in batches of ``EMAIL_RECIPIENTS_BATCH_SIZE``, run in parallel as a chord.
+    :py:func:`finish_email_task` records the outcome of every batch on the email.
+    """
+    email = Email.objects.get(id=email_id)
+    batches = list(chunked(email.recipient_emails or [], settings.EMAIL_RECIPIENTS_BATCH_SIZE))
+    if not batches:
+        Email.objects.filter(id=email_id).update(status=Email.StatusChoices.SENT, sent_at=timezone.now())
+        return None
+
+    fetch_email_attachments(email)
+    Email.objects.filter(id=email_id).update(status=Email.StatusChoices.SENDING)
+    return chord(send_email_batch_task.s(email_id, batch) for batch in batches)(finish_email_task.s(email_id)).id
+
+
+@shared_task(bind=True, max_retries=5)
+def send_email_batch_task(self, email_id: int, recipient_emails: List[str]) -> dict:
+    """
+    Sends ``email`` to a batch of recipients over a single SMTP connection. Failures are retried with an exponential
+    backoff, then reported in the result instead of being raised so that the chord callback always runs.
+    """
+    email = Email.objects.get(id=email_id)
+    try:
+        attachment_paths = fetch_email_attachments(email)
+        with get_connection() as connection:
+            connection.send_messages(build_email_messages(email, recipient_emails, attachment_paths))
+    except (SMTPException, OSError, ClientError) as exc:
+        if self.request.retries < self.max_retries:
+            raise self.retry(exc=exc, countdown=EMAIL_RETRY_BACKOFF * 2**self.request.retries)
+        logger.exception("Email %s could not be sent to %s recipients", email_id, len(recipient_emails))
+        return {"recipients": len(recipient_emails), "error": repr(exc)}
+    return {"recipients": len(recipient_emails), "error": None}
+
+
+@shared_task
+def finish_email_task(results: List[dict], email_id: int):
+    email = Email.objects.get(id=email_id)
+    failed_results = [result for result in results if result["error"]]
+    if failed_results:
+        email.status = Email.StatusChoices.FAILED
+    else:
+        email.status = Email.StatusChoices.SENT
+        email.sent_at = timezone.now()
+    email.save(update_fields=["status", "sent_at"])
+    remove_email_attachments(email)
+
+    logger.info(
+        "Email %s sent to %s recipients, %s failed batches",
+        email_id,
+        sum(result["recipients"] for result in results if not result["error"]),
+        len(failed_results),
+    )
@@ -1,8 +1,8 @@
 import pytest
 
-from authentication.serializers import UserSerializer
+from authentication.serializers import AuditUserSerializer
 
-from ..models import Announcement
+from ..models import Announcement, Email
 from ..serializers import (
     AnnouncementAttachmentSerializer,
     AnnouncementSerializer,
@@ -215,7 +215,7 @@ def test_note_attachment_serializer_read(note_factory, note_attachment_factory,
     serializer = NoteAttachmentSerializer(instance)
 
     assert serializer.data["note"] == note.id
-    assert serializer.data["created_by"] == UserSerializer(instance.created_by).data
+    assert serializer.data["created_by"] == AuditUserSerializer(instance.created_by).data
     assert serializer.data["file"] == instance.file
     assert serializer.data["name"] == instance.name
     assert serializer.data["file_type"] == instance.file_type
@@ -354,7 +354,7 @@ def test_email_template_serializer_read(email_template_factory, email_signature_
     assert serializer.data["body"] == instance.body
     assert serializer.data["signature"] == email_signature.id
     assert serializer.data["created_at"] is not None
-    assert serializer.data["created_by"] == UserSerializer(instance.created_by).data
+    assert serializer.data["created_by"] == AuditUserSerializer(instance.created_by).data
     assert serializer.data.keys() == {
         "id",
         "recipient_type",
@@ -463,8 +463,10 @@ def test_email_serializer_read(
     assert serializer.data["body"] == instance.body
     assert serializer.data["signature"] == email_signature.id
     assert serializer.data["attachments"] == EmailAttachmentSerializer(instance.attachments.all(), many=True).data
+    assert serializer.data["status"] == Email.StatusChoices.QUEUED
+    assert serializer.data["sent_at"] is None
     assert serializer.data["created_at"] is not None
-    assert serializer.data["created_by"] == UserSerializer(instance.created_by).data
+    assert serializer.data["created_by"] == AuditUserSerializer(instance.created_by).data
     assert serializer.data.keys() == {
         "id",
         "recipient_type",
@@ -479,6 +481,8 @@ def test_email_serializer_read(
         "body",
         "signature",
         "attachments",
+        "status",
+        "sent_at",
         "created_at",
         "created_by",
     }
@@ -733,7 +737,7 @@ def test_announcement_attachment_serializer_read(announcement_factory, announcem
     serializer = AnnouncementAttachmentSerializer(instance)
 
     assert serializer.data["announcement"] == announcement.id
-    assert serializer.data["created_by"] == UserSerializer(instance.created_by).data
+    assert serializer.data["created_by"] == AuditUserSerializer(instance.created_by).data
     assert serializer.data["file"] == instance.file
     assert serializer.data["name"] == instance.name
     assert serializer.data["file_type"] == instance.file_type
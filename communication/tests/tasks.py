@@ -0,0 +1,88 @@
+import os
+from smtplib import SMTPException
+
+import pytest
+from celery.exceptions import Retry  # type: ignore[import]
+from django.core import mail
+
+from ..models import Email
+from ..tasks import finish_email_task, send_email_batch_task, send_email_task
+from ..utils import get_email_attachment_path
+
+
+@pytest.fixture
+def mocked_s3_client(mocker):
+    def download_file(bucket, key, path):
+        with open(path, "w") as file:
+            file.write(key)
+
+    s3_client = mocker.patch("communication.utils.boto3.client").return_value
+    s3_client.download_file.side_effect = download_file
+    return s3_client
+
+
+@pytest.mark.django_db
+def test_send_email_task(email_factory, email_attachment_factory, mocked_s3_client, mocker, settings):
+    """
+    Testing :py:func:`communication.tasks.send_email_task`
+    """
+    settings.EMAIL_RECIPIENTS_BATCH_SIZE = 2
+    mocked_chord = mocker.patch("communication.tasks.chord")
+
+    email = email_factory(recipient_emails=[])
+    send_email_task(email.id)
+    email.refresh_from_db()
+
+    mocked_chord.assert_not_called()
+    assert email.status == Email.StatusChoices.SENT
+
+    email = email_factory(recipient_emails=["a@example.com", "b@example.com", "c@example.com"])
+    attachment = email_attachment_factory(email=email)
+    attachment_path = get_email_attachment_path(attachment)
+    send_email_task(email.id)
+    email.refresh_from_db()
+
+    header = list(mocked_chord.call_args.args[0])
+    assert [signature.args[1] for signature in header] == [["a@example.com", "b@example.com"], ["c@example.com"]]
+    assert email.status == Email.StatusChoices.SENDING
+    assert os.path.exists(attachment_path)
+
+    finish_email_task([{"recipients": 2, "error": None}, {"recipients": 1, "error": None}], email.id)
+    email.refresh_from_db()
+
+    assert email.status == Email.StatusChoices.SENT
+    assert email.sent_at is not None
+    assert not os.path.exists(attachment_path)
+    mocked_s3_client.download_file.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_send_email_batch_task(email_factory, email_attachment_factory, mocked_s3_client, mocker):
+    """
+    Testing :py:func:`communication.tasks.send_email_batch_task`
+    """
+    email = email_factory(recipient_emails=["a@example.com", "b@example.com"])
+    email_attachment_factory(email=email)
+
+    result = send_email_batch_task(email.id, email.recipient_emails)
+
+    assert result == {"recipients": 2, "error": None}
+    assert [message.to for message in mail.outbox] == [["a@example.com"], ["b@example.com"]]
+    assert all(len(message.attachments) == 1 for message in mail.outbox)
+
+    mocker.patch("django.core.mail.backends.locmem.EmailBackend.send_messages", side_effect=SMTPException)
+
+    with pytest.raises(Retry):
+        send_email_batch_task.apply(args=(email.id, email.recipient_emails), throw=True)
+
+    mocker.patch.object(send_email_batch_task, "max_retries", 0)
+    result = send_email_batch_task.apply(args=(email.id, email.recipient_emails)).get()
+
+    assert result["recipients"] == 2
+    assert result["error"] is not None
+
+    finish_email_task([result], email.id)
+    email.refresh_from_db()
+
+    assert email.status == Email.StatusChoices.FAILED
+    assert email.sent_at is None
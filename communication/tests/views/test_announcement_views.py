@@ -114,7 +114,7 @@ def test_announcement_list(
             },
             None,
             201,
-            11,
+            12,
             1,
             1,
             1,
@@ -131,7 +131,7 @@ def test_announcement_list(
             },
             None,
             201,
-            9,
+            10,
             1,
             2,
             2,
@@ -149,7 +149,7 @@ def test_announcement_list(
             },
             None,
             201,
-            10,
+            11,
             1,
             1,
             1,
@@ -167,7 +167,7 @@ def test_announcement_list(
             },
             None,
             201,
-            10,
+            11,
             1,
             2,
             1,
@@ -282,7 +282,7 @@ def test_announcement_update(
         "units": [unit.id],
     }
 
-    with assertNumQueries(14):
+    with assertNumQueries(16):
         url = reverse("communication:announcement-detail", kwargs={"pk": announcement.id})
         request = api_rf.patch(url, data, format="json")
         request.user = user
@@ -303,7 +303,7 @@ def test_announcement_delete(api_rf, announcement_factory, user_with_permissions
     user = user_with_permissions([("communication", "announcement")])
     announcement = announcement_factory(subscription=user.associated_subscription)
 
-    with assertNumQueries(9):
+    with assertNumQueries(10):
         url = reverse("communication:announcement-detail", kwargs={"pk": announcement.id})
         request = api_rf.delete(url, format="json")
         request.user = user
@@ -337,7 +337,7 @@ def test_announcement_unit_list(
     units = [unit_1.id, unit_2.id]
     index_result = [1, 0]
 
-    with assertNumQueries(19):
+    with assertNumQueries(4):
         url = reverse(
             "communication:announcement-units-list",
             kwargs={"announcement_id": announcement.id, "property_id": prop.id},
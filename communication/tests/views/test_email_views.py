@@ -110,7 +110,7 @@ def test_email_list(
             },
             None,
             201,
-            24,
+            23,
             1,
         ),
     ),
@@ -180,6 +180,8 @@ def test_email_retrieve(api_rf, email_factory, user_with_permissions):
         "body",
         "signature",
         "attachments",
+        "status",
+        "sent_at",
         "created_at",
         "created_by",
     }
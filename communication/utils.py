@@ -1,4 +1,6 @@
 import os
+import tempfile
+from typing import List
 
 import boto3  # type: ignore[import]
 from django.conf import settings
@@ -8,25 +10,56 @@ from django.utils.html import strip_tags
 
 from .models import Email
 
+EMAIL_ATTACHMENTS_CACHE_DIR = os.path.join(tempfile.gettempdir(), "email-attachments")
 
-def send_email_from_email_model(email: Email):
+
+def get_email_attachment_path(attachment) -> str:
+    return os.path.join(EMAIL_ATTACHMENTS_CACHE_DIR, f"{attachment.id}-{os.path.basename(attachment.name)}")
+
+
+def fetch_email_attachments(email: Email) -> List[str]:
+    """
+    Downloads the attachments of ``email`` from S3 into the shared attachments cache, once for all recipient batches,
+    and returns their paths.
+    """
+    os.makedirs(EMAIL_ATTACHMENTS_CACHE_DIR, exist_ok=True)
+    s3_client = None
+    paths = []
+    for attachment in email.attachments.all():
+        path = get_email_attachment_path(attachment)
+        if not os.path.exists(path):
+            if s3_client is None:
+                s3_client = boto3.client(
+                    "s3",
+                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                    region_name=settings.AWS_S3_REGION_NAME,
+                )
+            # Download next to the final path so that concurrent batches never read a partial file.
+            download_path = f"{path}.{os.getpid()}.part"
+            s3_client.download_file(settings.AWS_STORAGE_BUCKET_NAME, attachment.file, download_path)
+            os.replace(download_path, path)
+        paths.append(path)
+    return paths
+
+
+def remove_email_attachments(email: Email):
+    for attachment in email.attachments.all():
+        path = get_email_attachment_path(attachment)
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def build_email_messages(email: Email, recipient_emails: List[str], attachment_paths: List[str]) -> List[EmailMessage]:
+    """
+    Returns one message of ``email`` for each recipient so that recipients do not see each other.
+    """
     message = render_to_string("communication/emails/email_template.html", {"email": email})
     plain_message = strip_tags(message)
-    email_message = EmailMessage(
-        email.subject,
-        plain_message,
-        settings.DEFAULT_FROM_EMAIL,
-        email.recipient_emails,
-    )
-    for attachment in email.attachments.all():
-        s3_client = boto3.client(
-            "s3",
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            region_name=settings.AWS_S3_REGION_NAME,
-        )
-        s3_client.download_file(settings.AWS_STORAGE_BUCKET_NAME, attachment.file, attachment.name)
-        email_message.attach_file(attachment.name)
-
-        os.remove(attachment.name)
-    email_message.send(fail_silently=False)
+    email_messages = []
+    for recipient_email in recipient_emails:
+        email_message = EmailMessage(email.subject, plain_message, settings.DEFAULT_FROM_EMAIL, [recipient_email])
+        for path in attachment_paths:
+            email_message.attach_file(path)
+        email_messages.append(email_message)
+    return email_messages
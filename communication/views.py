@@ -156,7 +156,7 @@ class AnnouncementAttachmentByAnnouncementListAPIView(
 
 
 class AnnouncementUnitsListAPIView(FilterQuerysetByAssociatedSubscriptionMixin, generics.ListAPIView):
-    queryset = Unit.objects.all()
+    queryset = Unit.objects.select_related("unit_type", "parent_property", "current_lease").with_cover_photo()
     serializer_class = UnitListSerializer
 
     def get_queryset(self):
@@ -9,6 +9,7 @@ from accounting.tests.factories import (
     GeneralLedgerAccountFactory,
     GeneralLedgerTransactionFactory,
     InvoiceFactory,
+    InvoicePaymentEventFactory,
     PaymentAttachmentFactory,
     PaymentFactory,
 )
@@ -172,6 +173,34 @@ def tenant_user_with_permissions(user_with_permissions, lease_factory):
     return generate
 
 
+@pytest.fixture
+def assert_constant_queries():
+    """
+    Returns a function asserting that ``make_request`` runs the same number of queries after ``add_rows`` adds more
+    rows to its results. Use it on list endpoints so that queries run per row fail the test. ``make_request`` is
+    called once beforehand to warm up per user caches such as permissions.
+    """
+
+    def inner(make_request, add_rows):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        make_request()
+        with CaptureQueriesContext(connection) as initial_queries:
+            make_request()
+        add_rows()
+        with CaptureQueriesContext(connection) as queries:
+            make_request()
+
+        assert len(queries) == len(
+            initial_queries
+        ), f"{len(queries)} queries executed after adding rows, {len(initial_queries)} before:\n" + "\n".join(
+            query["sql"] for query in queries.captured_queries
+        )
+
+    return inner
+
+
 # Authentication
 register(UserFactory)
 register(SuperUserFactory)
@@ -269,6 +298,7 @@ register(PaymentFactory)
 register(PaymentAttachmentFactory)
 register(GeneralLedgerAccountFactory)
 register(GeneralLedgerTransactionFactory)
+register(InvoicePaymentEventFactory)
 
 # Subscription
 register(SubscriptionFactory)
@@ -0,0 +1,81 @@
+import json
+
+from django.core.exceptions import EmptyResultSet
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.urls import URLPattern, URLResolver, get_resolver
+
+from core.mixins import FilterQuerysetByAssociatedSubscriptionMixin
+
+
+def get_view_classes(url_patterns):
+    """
+    Yields the class of every class based view registered in ``url_patterns``, following included url confs.
+    """
+    for pattern in url_patterns:
+        if isinstance(pattern, URLResolver):
+            yield from get_view_classes(pattern.url_patterns)
+        elif isinstance(pattern, URLPattern):
+            view_class = getattr(pattern.callback, "cls", None) or getattr(pattern.callback, "view_class", None)
+            if view_class is not None:
+                yield view_class
+
+
+def get_sequential_scans(plan):
+    """
+    Yields the relation name of every ``Seq Scan`` node of a PostgreSQL JSON query plan.
+    """
+    if plan["Node Type"] == "Seq Scan":
+        yield plan["Relation Name"]
+    for sub_plan in plan.get("Plans", []):
+        yield from get_sequential_scans(sub_plan)
+
+
+class Command(BaseCommand):
+    help = "Explain the queryset of every registered view and report sequential scans over large tables"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--min-rows",
+            type=int,
+            default=10000,
+            help="Only report sequential scans over tables with at least this many (estimated) rows.",
+        )
+        parser.add_argument(
+            "--subscription",
+            type=int,
+            help="Subscription id used to filter the querysets of subscription scoped views.",
+        )
+
+    def handle(self, *args, **kwargs):
+        if connection.vendor != "postgresql":
+            raise CommandError("The index advisor requires PostgreSQL.")
+
+        min_rows = kwargs["min_rows"]
+        subscription_id = kwargs["subscription"]
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT relname, reltuples FROM pg_class WHERE relkind = 'r'")
+            table_rows = {relname: max(int(reltuples), 0) for relname, reltuples in cursor.fetchall()}
+
+        findings = []
+        for view_class in dict.fromkeys(get_view_classes(get_resolver().url_patterns)):
+            queryset = getattr(view_class, "queryset", None)
+            if queryset is None:
+                continue
+            if subscription_id is not None and issubclass(view_class, FilterQuerysetByAssociatedSubscriptionMixin):
+                queryset = queryset.filter(subscription_id=subscription_id)
+            try:
+                plan = json.loads(queryset.explain(format="json"))[0]["Plan"]
+            except EmptyResultSet:
+                continue
+            for relation in dict.fromkeys(get_sequential_scans(plan)):
+                if table_rows.get(relation, 0) >= min_rows:
+                    findings.append((view_class.__name__, relation, table_rows[relation]))
+
+        for view_name, relation, rows in findings:
+            self.stdout.write(self.style.WARNING(f"{view_name}: sequential scan on {relation} (~{rows} rows)"))
+        if findings:
+            self.stdout.write(self.style.WARNING(f"{len(findings)} sequential scans over large tables found"))
+        else:
+            self.stdout.write(self.style.SUCCESS("No sequential scans over large tables found"))
@@ -0,0 +1,71 @@
+import logging
+import time
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+
+class QueryCounter:
+    """
+    Database execute wrapper counting the queries run through the connection and the time spent in them.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.monotonic()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.monotonic() - start
+
+
+class QueryBudgetMiddleware:
+    """
+    Counts the queries and the database time of every request. They are returned in the ``X-DB-Query-Count`` and
+    ``X-DB-Time`` (milliseconds) headers and logged. A warning is logged when the request exceeds the budget of its
+    URL name in ``QUERY_BUDGETS`` or ``QUERY_BUDGET_DEFAULT``.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        query_counter = QueryCounter()
+        with connection.execute_wrapper(query_counter):
+            response = self.get_response(request)
+
+        url_name = request.resolver_match.view_name if request.resolver_match else None
+        budget = settings.QUERY_BUDGETS.get(url_name, settings.QUERY_BUDGET_DEFAULT)
+        db_time = round(query_counter.duration * 1000, 2)
+
+        response["X-DB-Query-Count"] = str(query_counter.count)
+        response["X-DB-Time"] = str(db_time)
+
+        log_data = {
+            "url_name": url_name,
+            "method": request.method,
+            "path": request.path,
+            "status_code": response.status_code,
+            "query_count": query_counter.count,
+            "query_budget": budget,
+            "db_time": db_time,
+        }
+        if query_counter.count > budget:
+            logger.warning(
+                "%s %s ran %s queries, over its budget of %s",
+                request.method,
+                request.path,
+                query_counter.count,
+                budget,
+                extra=log_data,
+            )
+        else:
+            logger.info("%s %s ran %s queries", request.method, request.path, query_counter.count, extra=log_data)
+
+        return response
@@ -1,3 +1,13 @@
+import csv
+from itertools import chain
+from typing import Sequence
+
+from django.http import StreamingHttpResponse
+from rest_framework.decorators import action
+
+from .utils import Echo
+
+
 class FilterQuerysetByAssociatedSubscriptionMixin:
     """
     Mixin to filter queryset by associated subscription of current user.
@@ -10,4 +20,24 @@ class FilterQuerysetByAssociatedSubscriptionMixin:
             raise AttributeError(f"'{self.__class__.__name__}' should include a `queryset` attribute.")
 
         queryset = super().get_queryset()
-        return queryset.filter(subscription=self.request.user.associated_subscription)
+        return queryset.filter(subscription_id=self.request.user.associated_subscription_id)
+
+
+class CSVExportMixin:
+    """
+    Viewset Mixin adding an `export` action which streams the filtered queryset as CSV rows of `export_fields`.
+    Rows are read through a server-side cursor in chunks of `export_chunk_size`, so memory stays flat whatever the
+    number of exported rows.
+    """
+
+    export_fields: Sequence[str] = ()
+    export_chunk_size = 2000
+
+    @action(detail=False, methods=["get"])
+    def export(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset()).prefetch_related(None).values_list(*self.export_fields)
+        writer = csv.writer(Echo())
+        rows = chain([self.export_fields], queryset.iterator(chunk_size=self.export_chunk_size))
+        response = StreamingHttpResponse((writer.writerow(row) for row in rows), content_type="text/csv")
+        response["Content-Disposition"] = f'attachment; filename="{queryset.model._meta.model_name}.csv"'
+        return response
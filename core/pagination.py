@@ -1,11 +1,97 @@
-from rest_framework.pagination import PageNumberPagination
+import json
+
+from django.core.paginator import Paginator as DjangoPaginator
+from django.db import connection
+from django.utils.functional import cached_property
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from rest_framework.response import Response
 
+COUNT_EXACT = "exact"
+COUNT_ESTIMATE = "estimate"
+COUNT_NONE = "none"
+
+
+def estimate_count(queryset):
+    """
+    Returns the number of rows of ``queryset`` estimated by the PostgreSQL planner, without running a ``COUNT(*)``.
+    """
+    if connection.vendor != "postgresql":
+        return queryset.count()
+    plan = json.loads(queryset.order_by().explain(format="json"))[0]["Plan"]
+    return int(plan["Plan Rows"])
+
+
+class EstimatedCountPaginator(DjangoPaginator):
+    @cached_property
+    def count(self):
+        return estimate_count(self.object_list)
+
+
+class StandardCursorPagination(CursorPagination):
+    """
+    Keyset pagination on the ordering of the queryset, ``-pk`` by default. The ordering set by ``OrderingFilter`` is
+    supported as long as its first field is a column or an annotation of the listed model.
+    """
+
+    ordering = "-pk"
+    page_size = 25
+    page_size_query_param = "size"
+
+    def get_ordering(self, request, queryset, view):
+        ordering = tuple(field for field in queryset.query.order_by if isinstance(field, str)) or (self.ordering,)
+        if "__" in ordering[0]:
+            raise ValidationError({"ordering": f"Ordering by '{ordering[0]}' is not supported by cursor pagination."})
+        if ordering[0].lstrip("-") not in ("pk", "id"):
+            ordering += (self.ordering,)
+        return ordering
+
 
 class StandardPagination(PageNumberPagination):
+    """
+    Page number pagination, used when the ``size`` or ``page`` parameter is given. ``?pagination=cursor`` switches to
+    :py:class:`StandardCursorPagination`, whose pages cost the same whatever their depth.
+
+    ``?count=exact|estimate|none`` selects how the total count is computed. Page number pages count exactly by default
+    and cursor pages skip the count by default; page number pagination cannot skip it.
+    """
+
     page_size_query_param = "size"
+    pagination_query_param = "pagination"
+    count_query_param = "count"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_pagination = None
+        self.count = None
+        pagination = request.query_params.get(self.pagination_query_param)
+
+        if pagination == "cursor":
+            count = request.query_params.get(self.count_query_param, COUNT_NONE)
+            self.cursor_pagination = StandardCursorPagination()
+            page = self.cursor_pagination.paginate_queryset(queryset, request, view)
+            if count == COUNT_EXACT:
+                self.count = queryset.count()
+            elif count == COUNT_ESTIMATE:
+                self.count = estimate_count(queryset)
+            return page
+
+        if request.query_params.get(self.count_query_param) == COUNT_ESTIMATE:
+            self.django_paginator_class = EstimatedCountPaginator
+        else:
+            self.django_paginator_class = DjangoPaginator
+        return super().paginate_queryset(queryset, request, view)
 
     def get_paginated_response(self, data):
+        if self.cursor_pagination:
+            return Response(
+                {
+                    "count": self.count,
+                    "next": self.cursor_pagination.get_next_link(),
+                    "previous": self.cursor_pagination.get_previous_link(),
+                    "results": data,
+                }
+            )
+
         return Response(
             {
                 "count": self.page.paginator.count,
@@ -1,18 +1,92 @@
-from typing import List, Optional
+from typing import List, Optional, Set
 
+from django.contrib.auth import get_user_model
+from django.db.models import QuerySet
 from rest_framework import serializers
 
-from authentication.serializers.user import UserSerializer
+from authentication.serializers.user import AuditUserSerializer, UserSerializer
 from lease.models import RentalApplicationTemplate
 
+User = get_user_model()
+
+EXPAND_QUERY_PARAM = "expand"
+AUDIT_USER_FIELDS = ("created_by", "modified_by")
+AUDIT_USERS_CACHE_ATTR = "_audit_users"
+
+
+def get_expanded_fields(request) -> Set[str]:
+    """
+    Returns the field names listed, comma separated, in the ``expand`` query parameter of ``request``.
+    """
+    if request is None:
+        return set()
+    value = getattr(request, "query_params", request.GET).get(EXPAND_QUERY_PARAM, "")
+    return {field.strip() for field in value.split(",") if field.strip()}
+
 
 class UploadSignedURLSerializer(serializers.Serializer):
     file_name = serializers.CharField()
 
 
+class AuditUserField(serializers.Field):
+    """
+    Read only user who created or last modified an object, represented by ``AuditUserSerializer`` or by the full
+    ``UserSerializer`` when the field is listed in the ``expand`` query parameter. The users of all the objects of the
+    root serializer are fetched with one query on first use and cached on the request.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def get_attribute(self, instance):
+        return getattr(instance, f"{self.source}_id", None)
+
+    def to_representation(self, user_id):
+        expanded = self.field_name in get_expanded_fields(self.context.get("request"))
+        users = self.get_users_cache()[expanded]
+        if user_id not in users:
+            self.load_users(users, {user_id, *self.get_root_user_ids()} - users.keys(), expanded)
+        return users.get(user_id)
+
+    def get_users_cache(self) -> dict:
+        holder = self.context.get("request") or self.root
+        cache = getattr(holder, AUDIT_USERS_CACHE_ATTR, None)
+        if cache is None:
+            cache = {False: {}, True: {}}
+            setattr(holder, AUDIT_USERS_CACHE_ATTR, cache)
+        return cache
+
+    def get_root_user_ids(self) -> Set[int]:
+        instances = self.root.instance
+        if not isinstance(instances, (list, tuple, QuerySet)):
+            instances = [instances]
+        return {
+            user_id
+            for instance in instances
+            for field in AUDIT_USER_FIELDS
+            if (user_id := getattr(instance, f"{field}_id", None)) is not None
+        }
+
+    def load_users(self, users: dict, user_ids: Set[int], expanded: bool) -> None:
+        if expanded:
+            queryset = (
+                User.objects.annotate_slug()  # type: ignore[attr-defined]
+                .annotate_is_tenant_is_admin()
+                .select_related("purchased_subscription")
+                .prefetch_related("groups", "roles")
+            )
+            serializer_class = UserSerializer
+        else:
+            queryset = User.objects.only(*AuditUserSerializer.Meta.fields)
+            serializer_class = AuditUserSerializer
+        for user in queryset.filter(pk__in=user_ids):
+            users[user.pk] = serializer_class(user, context=self.context).data
+
+
 class ModifiedByAbstractSerializer(serializers.ModelSerializer):
-    created_by = UserSerializer(read_only=True)
-    modified_by = UserSerializer(read_only=True)
+    created_by = AuditUserField()
+    modified_by = AuditUserField()
 
     class Meta:
         fields = ["created_by", "modified_by"]
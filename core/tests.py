@@ -1,9 +1,18 @@
+from io import StringIO
+
 import factory  # type: ignore[import]
 import pytest
 from django.core import management
+from django.http import HttpResponse
+from django.test import RequestFactory
 from django.urls import reverse
 from pytest_django.asserts import assertNumQueries
 
+from authentication.serializers import AuditUserSerializer
+from communication.serializers import NoteAttachmentSerializer
+from maintenance.views import InspectionViewSet
+
+from .middleware import QueryBudgetMiddleware
 from .models import BaseAttachment, SubscriptionAbstractModel, UpcomingActivityAbstract
 from .views import ModelChoicesListAPIView
 
@@ -317,3 +326,134 @@ def test_model_choice_list_api_view(
         assert response.data[0].keys() == result
     else:
         assert response.data == result
+
+
+@pytest.mark.django_db
+def test_index_advisor_command(invoice_factory):
+    """
+    Testing :py:mod:`core.management.commands.index_advisor`
+    """
+    invoice = invoice_factory()
+
+    out = StringIO()
+    management.call_command("index_advisor", stdout=out)
+
+    assert "No sequential scans over large tables found" in out.getvalue()
+
+    out = StringIO()
+    management.call_command("index_advisor", "--min-rows=0", f"--subscription={invoice.subscription_id}", stdout=out)
+
+    assert ": sequential scan on authentication_user (~0 rows)" in out.getvalue()
+    assert "No sequential scans" not in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_query_budget_middleware(settings, caplog, user_factory):
+    """
+    Testing :py:class:`core.middleware.QueryBudgetMiddleware`
+    """
+    settings.QUERY_BUDGET_DEFAULT = 1
+
+    def get_response(request):
+        user_factory()
+        return HttpResponse()
+
+    middleware = QueryBudgetMiddleware(get_response)
+    request = RequestFactory().get("/api/")
+    request.resolver_match = None
+
+    with caplog.at_level("INFO", logger="core.middleware"):
+        response = middleware(request)
+
+    query_count = int(response["X-DB-Query-Count"])
+    assert query_count > 1
+    assert float(response["X-DB-Time"]) >= 0
+    assert caplog.records[-1].levelname == "WARNING"
+    assert caplog.records[-1].query_count == query_count
+
+    settings.QUERY_BUDGET_DEFAULT = query_count + 5
+    with caplog.at_level("INFO", logger="core.middleware"):
+        middleware(request)
+
+    assert caplog.records[-1].levelname == "INFO"
+
+
+@pytest.mark.django_db
+def test_standard_pagination_cursor(api_rf, user_with_permissions, inspection_factory):
+    """
+    Testing :py:class:`core.pagination.StandardPagination` with cursor pagination
+    """
+    user = user_with_permissions([("maintenance", "inspection")])
+    inspections = [inspection_factory(subscription=user.associated_subscription) for _ in range(5)]
+    url = reverse("maintenance:inspection-list")
+    view = InspectionViewSet.as_view({"get": "list"})
+
+    request = api_rf.get(url, {"pagination": "cursor", "size": 2}, format="json")
+    request.user = user
+    response = view(request)
+
+    assert response.status_code == 200
+    assert response.data.keys() == {"count", "next", "previous", "results"}
+    assert response.data["count"] is None
+    assert [i["id"] for i in response.data["results"]] == [inspections[4].id, inspections[3].id]
+
+    request = api_rf.get(response.data["next"], format="json")
+    request.user = user
+    with assertNumQueries(2):
+        response = view(request)
+
+    assert [i["id"] for i in response.data["results"]] == [inspections[2].id, inspections[1].id]
+
+    request = api_rf.get(url, {"pagination": "cursor", "size": 2, "ordering": "name", "count": "exact"}, format="json")
+    request.user = user
+    response = view(request)
+
+    assert response.data["count"] == 5
+    assert [i["id"] for i in response.data["results"]] == [
+        inspection.id for inspection in sorted(inspections, key=lambda inspection: (inspection.name, -inspection.id))
+    ][:2]
+
+
+@pytest.mark.django_db
+def test_standard_pagination_estimated_count(api_rf, user_with_permissions, inspection_factory):
+    """
+    Testing :py:class:`core.pagination.StandardPagination` with an estimated count
+    """
+    user = user_with_permissions([("maintenance", "inspection")])
+    for _ in range(3):
+        inspection_factory(subscription=user.associated_subscription)
+    url = reverse("maintenance:inspection-list")
+
+    request = api_rf.get(url, {"size": 2, "count": "estimate"}, format="json")
+    request.user = user
+    response = InspectionViewSet.as_view({"get": "list"})(request)
+
+    assert response.status_code == 200
+    assert isinstance(response.data["count"], int)
+    assert len(response.data["results"]) == 2
+
+
+@pytest.mark.django_db
+def test_audit_user_field(api_rf, user_factory, note_attachment_factory):
+    """
+    Testing :py:class:`core.serializers.AuditUserField`
+    """
+    users = [user_factory() for _ in range(2)]
+    attachments = [note_attachment_factory(created_by=users[index % 2]) for index in range(4)]
+    attachments = list(NoteAttachmentSerializer.Meta.model.objects.filter(pk__in=[a.pk for a in attachments]))
+
+    request = api_rf.get("/api/", format="json")
+    with assertNumQueries(1):
+        data = NoteAttachmentSerializer(attachments, many=True, context={"request": request}).data
+
+    assert [item["created_by"] for item in data] == [
+        AuditUserSerializer(attachment.created_by).data for attachment in attachments
+    ]
+    assert data[0]["created_by"].keys() == {"id", "first_name", "last_name"}
+
+    request = api_rf.get("/api/", {"expand": "created_by"}, format="json")
+    with assertNumQueries(3):
+        data = NoteAttachmentSerializer(attachments, many=True, context={"request": request}).data
+
+    assert [item["created_by"]["id"] for item in data] == [attachment.created_by_id for attachment in attachments]
+    assert "group_names" in data[0]["created_by"]
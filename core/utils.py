@@ -1,4 +1,8 @@
 import logging
+import threading
+from collections import OrderedDict
+from itertools import islice
+from typing import Iterable, Iterator, List
 
 from botocore.exceptions import ClientError  # type: ignore[import]
 
@@ -24,3 +28,54 @@ def generate_presigned_url(s3_client, client_method, method_parameters, expires_
         logger.exception("Couldn't get a presigned URL for client method '%s'.", client_method)
         raise
     return url
+
+
+def chunked(items: Iterable, size: int) -> Iterator[List]:
+    """
+    Splits ``items`` into lists of at most ``size`` elements.
+    """
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class Echo:
+    """
+    File-like object returning what is written to it, to stream the rows of a ``csv.writer``.
+    """
+
+    def write(self, value):
+        return value
+
+
+class LRUCache:
+    """
+    Thread safe in-process mapping keeping the ``maxsize`` most recently used items.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.items: OrderedDict = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self.lock:
+            if key not in self.items:
+                return default
+            self.items.move_to_end(key)
+            return self.items[key]
+
+    def set(self, key, value):
+        with self.lock:
+            self.items[key] = value
+            self.items.move_to_end(key)
+            while len(self.items) > self.maxsize:
+                self.items.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.items.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.items.clear()
@@ -0,0 +1,16 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .views import invalidate_stats_snapshots
+
+
+@receiver(post_save, sender="property.Unit")
+@receiver(post_delete, sender="property.Unit")
+@receiver(post_save, sender="lease.Lease")
+@receiver(post_delete, sender="lease.Lease")
+@receiver(post_save, sender="maintenance.WorkOrder")
+@receiver(post_delete, sender="maintenance.WorkOrder")
+@receiver(post_save, sender="lease.RentalApplication")
+@receiver(post_delete, sender="lease.RentalApplication")
+def invalidate_subscription_stats_snapshots(sender, instance, **kwargs):
+    invalidate_stats_snapshots(instance.subscription_id)
@@ -1,4 +1,5 @@
 import pytest
+from django.core.cache import cache
 from django.urls import reverse
 from pytest_django.asserts import assertNumQueries
 
@@ -43,7 +44,9 @@ def test_dashboard_stats_data_list(
         "vacant_properties_count": 1,
     }
 
-    with assertNumQueries(11):
+    cache.clear()
+
+    with assertNumQueries(2):
         url = reverse("dashboard:dashboard-stats-list")
         request = api_rf.get(url, format="json")
         request.user = user
@@ -78,7 +81,9 @@ def test_general_stats_data_list(api_rf, user_factory, service_request_factory,
         "draft_rental_applications_count": 1,
     }
 
-    with assertNumQueries(11):
+    cache.clear()
+
+    with assertNumQueries(1):
         url = reverse("dashboard:general-stats-list")
         request = api_rf.get(url, format="json")
         request.user = user
@@ -87,3 +92,43 @@ def test_general_stats_data_list(api_rf, user_factory, service_request_factory,
 
     assert response.status_code == 200
     assert response.data == stats_data
+
+
+@pytest.mark.django_db
+def test_dashboard_stats_data_snapshot(api_rf, user_factory, unit_factory):
+    """
+    Testing :py:class:`dashboard.views.StatsSnapshotMixin` caches the stats until a unit is written
+    """
+    cache.clear()
+    user = user_factory()
+    unit_factory(subscription=user.associated_subscription)
+    url = reverse("dashboard:dashboard-stats-list")
+    view = DashboardStatsDataViewSet.as_view({"get": "list"})
+
+    request = api_rf.get(url, format="json")
+    request.user = user
+    assert view(request).data["total_units_count"] == 1
+
+    with assertNumQueries(0):
+        request = api_rf.get(url, format="json")
+        request.user = user
+        response = view(request)
+
+    assert response.data["total_units_count"] == 1
+
+    unit_factory(subscription=user.associated_subscription)
+
+    request = api_rf.get(url, format="json")
+    request.user = user
+    assert view(request).data["total_units_count"] == 2
+
+    with assertNumQueries(0):
+        request = api_rf.get(url, {"fresh": "1"}, format="json")
+        request.user = user
+        view(request)
+
+    user.is_staff = True
+    with assertNumQueries(2):
+        request = api_rf.get(url, {"fresh": "1"}, format="json")
+        request.user = user
+        view(request)
@@ -1,163 +1,161 @@
 from django.contrib.auth import get_user_model
-from django.db.models import Count, Prefetch, Q
+from django.core.cache import cache
+from django.db.models import Count, Exists, F, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from rest_framework import permissions, viewsets
 from rest_framework.response import Response
 
-from lease.models import RentalApplication
+from lease.models import Lease, RentalApplication
 from maintenance.models import ServiceRequest, WorkOrder
 from people.models import Owner, Tenant, Vendor
 from property.models import Property, Unit
+from subscription.models import Subscription
 
 from .serializers import DashboardStatsDataSerializer, GeneralStatsDataSerializer
 
 User = get_user_model()
 
-
-class DashboardStatsDataViewSet(viewsets.GenericViewSet):
-    serializer_class = DashboardStatsDataSerializer
-    permission_classes = (permissions.IsAuthenticated,)
+STATS_SNAPSHOT_CACHE_KEY = "dashboard:{stats_name}:{subscription_id}"
+STATS_SNAPSHOT_TIMEOUT = 15 * 60
+STATS_NAMES = ("dashboard-stats", "general-stats")
+
+
+def invalidate_stats_snapshots(subscription_id):
+    cache.delete_many(
+        [
+            STATS_SNAPSHOT_CACHE_KEY.format(stats_name=stats_name, subscription_id=subscription_id)
+            for stats_name in STATS_NAMES
+        ]
+    )
+
+
+def subscription_count(queryset, subscription_field="subscription"):
+    """
+    Returns a subquery counting the rows of ``queryset`` that belong to the outer ``Subscription``.
+    """
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{subscription_field: OuterRef("pk")})
+            .order_by()
+            .values(subscription_field)
+            .annotate(count=Count("pk"))
+            .values("count"),
+            output_field=IntegerField(),
+        ),
+        0,
+    )
+
+
+def get_subscription_counts(subscription_id, **counts):
+    """
+    Evaluates all ``counts`` subqueries of the subscription in a single query.
+    """
+    return Subscription.objects.filter(pk=subscription_id).annotate(**counts).values(*counts).first() or dict.fromkeys(
+        counts, 0
+    )
+
+
+class StatsSnapshotMixin:
+    """
+    Serves the statistics of the current user's subscription from a cached snapshot. The snapshots are invalidated by
+    ``dashboard.signals`` and support staff can bypass them with ``?fresh=1``.
+    """
+
+    stats_name: str
+
+    def get_stats_data(self, subscription_id):
+        raise NotImplementedError
 
     def list(self, request):
-        user = request.user
-        subscription_record_query = Q(subscription=user.associated_subscription)
+        subscription_id = request.user.associated_subscription_id
+        cache_key = STATS_SNAPSHOT_CACHE_KEY.format(stats_name=self.stats_name, subscription_id=subscription_id)
+        fresh = request.user.is_staff and request.query_params.get("fresh") == "1"
 
-        # Units Section
-        total_units_count = Unit.objects.filter(subscription_record_query).count()
-        occupied_units_count = (
-            Unit.objects.filter(subscription_record_query).annotate_data().filter(is_occupied=True).count()
-        )
-        vacant_units_count = (
-            Unit.objects.filter(subscription_record_query).annotate_data().filter(is_occupied=False).count()
+        stats_data = None if fresh else cache.get(cache_key)
+        if stats_data is None:
+            stats_data = self.get_serializer(self.get_stats_data(subscription_id)).data
+            cache.set(cache_key, stats_data, STATS_SNAPSHOT_TIMEOUT)
+
+        return Response(stats_data)
+
+
+class DashboardStatsDataViewSet(StatsSnapshotMixin, viewsets.GenericViewSet):
+    serializer_class = DashboardStatsDataSerializer
+    permission_classes = (permissions.IsAuthenticated,)
+    stats_name = "dashboard-stats"
+
+    def get_stats_data(self, subscription_id):
+        active_lease = Exists(Lease.objects.filter(unit=OuterRef("pk"), status=Lease.LeaseStatus.ACTIVE))
+
+        counts = get_subscription_counts(
+            subscription_id,
+            total_units_count=subscription_count(Unit.objects.all()),
+            occupied_units_count=subscription_count(Unit.objects.filter(active_lease)),
+            vendors_count=subscription_count(Vendor.objects.all()),
+            tenants_count=subscription_count(Tenant.objects.all()),
+            owners_count=subscription_count(Owner.objects.all()),
+            users_count=subscription_count(User.objects.all(), subscription_field="associated_subscription"),
+            properties_count=subscription_count(Property.objects.all()),
         )
-        occupancy_percentage = occupied_units_count / total_units_count * 100 if total_units_count else 0
-
-        # People Section
-        vendors_count = Vendor.objects.filter(subscription_record_query).count()
-        tenants_count = Tenant.objects.filter(subscription_record_query).count()
-        owners_count = Owner.objects.filter(subscription_record_query).count()
-        users_count = User.objects.filter(associated_subscription=user.associated_subscription).count()
-
-        # Property Section
-        properties_count = Property.objects.filter(subscription_record_query).count()
-        properties = (
-            Property.objects.filter(subscription_record_query)
-            .prefetch_related(
-                Prefetch(
-                    "units",
-                    queryset=Unit.objects.filter(subscription_record_query).annotate_data(),
-                )
-            )
-            .annotate(
-                occupied_units_count=Count("units", filter=Q(units__leases__status="ACTIVE")),
+
+        # Properties without units have no rows here and count as vacant.
+        property_occupancy = (
+            Unit.objects.filter(subscription_id=subscription_id)
+            .order_by()
+            .values("parent_property")
+            .annotate(units_count=Count("pk"), occupied_units_count=Count("pk", filter=active_lease))
+            .aggregate(
+                complete_occupied_properties_count=Count(
+                    "parent_property", filter=Q(occupied_units_count=F("units_count"))
+                ),
+                partial_occupied_properties_count=Count(
+                    "parent_property", filter=Q(occupied_units_count__gt=0, occupied_units_count__lt=F("units_count"))
+                ),
             )
         )
-        complete_occupied_properties_count = properties.filter(occupied_units_count=Count("units")).distinct().count()
-        partial_occupied_properties_count = (
-            properties.filter(occupied_units_count__gt=0, occupied_units_count__lt=Count("units")).distinct().count()
-        )
-        vacant_properties_count = properties.filter(occupied_units_count=0).distinct().count()
-
-        stats_data = {
-            "total_units_count": total_units_count,
-            "occupied_units_count": occupied_units_count,
-            "vacant_units_count": vacant_units_count,
-            "occupancy_percentage": occupancy_percentage,
-            "vendors_count": vendors_count,
-            "tenants_count": tenants_count,
-            "owners_count": owners_count,
-            "users_count": users_count,
-            "properties_count": properties_count,
-            "complete_occupied_properties_count": complete_occupied_properties_count,
-            "partial_occupied_properties_count": partial_occupied_properties_count,
-            "vacant_properties_count": vacant_properties_count,
-        }
 
-        serializer = self.get_serializer(stats_data)
-
-        return Response(serializer.data)
+        total_units_count = counts["total_units_count"]
+        occupied_units_count = counts["occupied_units_count"]
+        return {
+            **counts,
+            "vacant_units_count": total_units_count - occupied_units_count,
+            "occupancy_percentage": occupied_units_count / total_units_count * 100 if total_units_count else 0,
+            **property_occupancy,
+            "vacant_properties_count": counts["properties_count"]
+            - property_occupancy["complete_occupied_properties_count"]
+            - property_occupancy["partial_occupied_properties_count"],
+        }
 
 
-class GeneralStatsDataViewSet(viewsets.GenericViewSet):
+class GeneralStatsDataViewSet(StatsSnapshotMixin, viewsets.GenericViewSet):
     serializer_class = GeneralStatsDataSerializer
     permission_classes = (permissions.IsAuthenticated,)
+    stats_name = "general-stats"
 
-    def list(self, request):
-        user = request.user
-        subscription_record_query = Q(subscription=user.associated_subscription)
-        # Service Requests
-        completed_service_request_query = Q(work_orders__status=WorkOrder.StatusChoices.COMPLETED)
-        completed_service_requests_count = (
-            ServiceRequest.objects.filter(subscription_record_query)
-            .filter(completed_service_request_query)
-            .distinct()
-            .count()
-        )
-        pending_service_requests_count = (
-            ServiceRequest.objects.filter(subscription_record_query)
-            .exclude(completed_service_request_query)
-            .distinct()
-            .count()
+    def get_stats_data(self, subscription_id):
+        completed_work_order = Exists(
+            WorkOrder.objects.filter(service_request=OuterRef("pk"), status=WorkOrder.StatusChoices.COMPLETED)
         )
-
-        # Work Orders
-        unassigned_work_orders_count = (
-            WorkOrder.objects.filter(subscription_record_query)
-            .filter(status=WorkOrder.StatusChoices.UNASSIGNED)
-            .count()
-        )
-        open_work_orders_count = (
-            WorkOrder.objects.filter(subscription_record_query).filter(status=WorkOrder.StatusChoices.OPEN).count()
-        )
-        assigned_work_orders_count = (
-            WorkOrder.objects.filter(subscription_record_query).filter(status=WorkOrder.StatusChoices.ASSIGNED).count()
-        )
-        completed_work_orders_count = (
-            WorkOrder.objects.filter(subscription_record_query)
-            .filter(status=WorkOrder.StatusChoices.COMPLETED)
-            .count()
-        )
-
-        # Rental Applications
-        approved_rental_applications_count = (
-            RentalApplication.objects.filter(subscription_record_query)
-            .filter(status=RentalApplication.RentalApplicationStatusChoices.APPROVED)
-            .count()
-        )
-        pending_rental_applications_count = (
-            RentalApplication.objects.filter(subscription_record_query)
-            .filter(status=RentalApplication.RentalApplicationStatusChoices.PENDING)
-            .count()
-        )
-        rejected_rental_applications_count = (
-            RentalApplication.objects.filter(subscription_record_query)
-            .filter(status=RentalApplication.RentalApplicationStatusChoices.REJECTED)
-            .count()
-        )
-        on_hold_rental_applications_count = (
-            RentalApplication.objects.filter(subscription_record_query)
-            .filter(status=RentalApplication.RentalApplicationStatusChoices.ON_HOLD_OR_WAITING)
-            .count()
-        )
-        draft_rental_applications_count = (
-            RentalApplication.objects.filter(subscription_record_query)
-            .filter(status=RentalApplication.RentalApplicationStatusChoices.DRAFT)
-            .count()
-        )
-
-        general_stats_data = {
-            "completed_service_requests_count": completed_service_requests_count,
-            "pending_service_requests_count": pending_service_requests_count,
-            "unassigned_work_orders_count": unassigned_work_orders_count,
-            "open_work_orders_count": open_work_orders_count,
-            "assigned_work_orders_count": assigned_work_orders_count,
-            "completed_work_orders_count": completed_work_orders_count,
-            "approved_rental_applications_count": approved_rental_applications_count,
-            "pending_rental_applications_count": pending_rental_applications_count,
-            "rejected_rental_applications_count": rejected_rental_applications_count,
-            "on_hold_rental_applications_count": on_hold_rental_applications_count,
-            "draft_rental_applications_count": draft_rental_applications_count,
+        work_order_count = {
+            f"{status.lower()}_work_orders_count": subscription_count(WorkOrder.objects.filter(status=status))
+            for status in WorkOrder.StatusChoices.values
+        }
+        rental_application_statuses = RentalApplication.RentalApplicationStatusChoices
+        rental_application_count = {
+            f"{prefix}_rental_applications_count": subscription_count(RentalApplication.objects.filter(status=status))
+            for prefix, status in (
+                ("approved", rental_application_statuses.APPROVED),
+                ("pending", rental_application_statuses.PENDING),
+                ("rejected", rental_application_statuses.REJECTED),
+                ("on_hold", rental_application_statuses.ON_HOLD_OR_WAITING),
+                ("draft", rental_application_statuses.DRAFT),
+            )
         }
 
-        serializer = self.get_serializer(general_stats_data)
-
-        return Response(serializer.data)
+        return get_subscription_counts(
+            subscription_id,
+            completed_service_requests_count=subscription_count(ServiceRequest.objects.filter(completed_work_order)),
+            pending_service_requests_count=subscription_count(ServiceRequest.objects.filter(~completed_work_order)),
+            **work_order_count,
+            **rental_application_count,
+        )
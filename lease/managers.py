@@ -1,7 +1,10 @@
 from datetime import timedelta
 
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.contrib.postgres.fields import ArrayField
 from django.db import models
 from django.db.models import Case, Exists, F, Max, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce, Concat
 from django.db.models.query import QuerySet
 
 from core.managers import SlugQuerysetMixin
@@ -39,5 +42,32 @@ class LeaseQuerySet(QuerySet):
             )
         )
 
+    def annotate_owner_names(self):
+        """
+        Annotates the full names of the people owning the property of the leases as `owner_names`.
+        """
+        from property.models import PropertyOwner
+
+        owner_names = (
+            PropertyOwner.objects.filter(parent_property=OuterRef("unit__parent_property"))
+            .values("parent_property")
+            .annotate(names=ArrayAgg(Concat("owner__first_name", Value(" "), "owner__last_name"), distinct=True))
+            .values("names")
+        )
+        return self.annotate(
+            owner_names=Coalesce(Subquery(owner_names), Value([]), output_field=ArrayField(models.CharField()))
+        )
+
+    def due_for_invoice(self, invoice_date):
+        """
+        Active leases whose next invoice is due on ``invoice_date``.
+        """
+        from lease.models import Lease
+
+        return self.annotate_next_invoice_date().filter(
+            status=Lease.LeaseStatus.ACTIVE,
+            next_invoice_date__date=invoice_date,
+        )
+
 
 LeaseManager = models.Manager.from_queryset(LeaseQuerySet)
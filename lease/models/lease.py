@@ -117,6 +117,10 @@ class Lease(CommonInfoAbstractModel):
                 violation_error_message="Only one active lease can exist against a unit.",
             )
         ]
+        indexes = [
+            models.Index(fields=["subscription", "-id"], name="lease_subscription_id_idx"),
+            models.Index(fields=["unit", "status"], name="lease_unit_status_idx"),
+        ]
 
 
 class SecondaryTenant(CommonInfoAbstractModel):
@@ -114,6 +114,12 @@ class RentalApplication(CommonInfoAbstractModel):
 
     objects = RentalApplicationManager()
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["subscription", "status"], name="rental_app_sub_status_idx"),
+            models.Index(fields=["subscription", "-id"], name="rental_app_sub_id_idx"),
+        ]
+
     def __str__(self) -> str:
         return f"{self.legal_first_name} {self.legal_last_name}"
 
@@ -4,7 +4,6 @@ from django.db.models import Value
 from django.db.models.functions import Concat
 from rest_framework import serializers
 
-from authentication.serializers import UserSerializer
 from core.serializers import ModifiedByAbstractSerializer
 from lease.models import (
     Applicant,
@@ -42,8 +41,6 @@ class RentalApplicationTemplateSerializer(ModifiedByAbstractSerializer):
 
 
 class RentalApplicationAttachmentSerializer(ModifiedByAbstractSerializer):
-    created_by = UserSerializer(many=False, read_only=True)
-
     class Meta:
         model = RentalApplicationAttachment
         fields = (
@@ -365,6 +362,8 @@ class LeaseSerializer(ModifiedByAbstractSerializer):
 
     def get_owners(self, obj):
         if isinstance(obj, Lease):
+            if hasattr(obj, "owner_names"):
+                return obj.owner_names
             owner_people_ids = obj.unit.parent_property.owners.values_list("owner")
             owner_people = Owner.objects.filter(id__in=owner_people_ids).annotate(
                 full_name=Concat("first_name", Value(" "), "last_name")
@@ -9,11 +9,11 @@ from lease.views import LeaseViewSet
 @pytest.mark.parametrize(
     "query_params, index_result, num_queries",
     (
-        ({}, [2, 1, 0], 15),
-        ({"status": "ACTIVE"}, [0], 9),
-        ({"unit": 0}, [0], 10),
-        ({"unit__parent_property": 2}, [2], 10),
-        ({"remaining_days_less_than": 20}, [1], 9),
+        ({}, [2, 1, 0], 8),
+        ({"status": "ACTIVE"}, [0], 8),
+        ({"unit": 0}, [0], 9),
+        ({"unit__parent_property": 2}, [2], 9),
+        ({"remaining_days_less_than": 20}, [1], 8),
     ),
 )
 @pytest.mark.django_db
@@ -56,6 +56,33 @@ def test_lease_list(api_rf, user_with_permissions, lease_factory, query_params,
     assert response_ids == [leases[i] for i in index_result]
 
 
+@pytest.mark.django_db
+def test_lease_list_queries(
+    api_rf, user_with_permissions, lease_factory, property_owner_factory, assert_constant_queries
+):
+    """
+    Testing :py:meth:`lease.views.LeaseViewSet.list` runs a fixed number of queries
+    """
+    user = user_with_permissions([("lease", "lease")])
+
+    def make_request():
+        url = reverse("lease:lease-list")
+        request = api_rf.get(url, format="json")
+        request.user = user
+        response = LeaseViewSet.as_view({"get": "list"})(request)
+        assert response.status_code == 200
+        assert all(len(lease["owners"]) == 1 for lease in response.data)
+
+    def add_rows():
+        for _ in range(3):
+            lease = lease_factory(subscription=user.associated_subscription)
+            property_owner_factory(parent_property=lease.unit.parent_property)
+
+    lease = lease_factory(subscription=user.associated_subscription)
+    property_owner_factory(parent_property=lease.unit.parent_property)
+    assert_constant_queries(make_request, add_rows)
+
+
 @pytest.mark.parametrize(
     "data, expected_response, status_code, num_queries, obj_count",
     (
@@ -93,7 +120,7 @@ def test_lease_list(api_rf, user_with_permissions, lease_factory, query_params,
             },
             None,
             201,
-            17,
+            20,
             1,
         ),
     ),
@@ -140,7 +167,7 @@ def test_lease_retrieve(api_rf, lease_factory, user_with_permissions):
     user = user_with_permissions([("lease", "lease")])
     lease = lease_factory(subscription=user.associated_subscription)
 
-    with assertNumQueries(9):
+    with assertNumQueries(8):
         url = reverse("lease:lease-detail", kwargs={"pk": lease.id})
         request = api_rf.get(url, format="json")
         request.user = user
@@ -202,7 +229,7 @@ def test_lease_update(api_rf, lease_factory, user_with_permissions):
         "closed_on": "2010-04-22",
     }
 
-    with assertNumQueries(11):
+    with assertNumQueries(13):
         url = reverse("lease:lease-detail", kwargs={"pk": lease.id})
         request = api_rf.patch(url, data, format="json")
         request.user = user
@@ -223,7 +250,7 @@ def test_lease_delete(api_rf, lease_factory, user_with_permissions):
     user = user_with_permissions([("lease", "lease")])
     lease = lease_factory(status="CLOSED", subscription=user.associated_subscription)
 
-    with assertNumQueries(17):
+    with assertNumQueries(22):
         url = reverse("lease:lease-detail", kwargs={"pk": lease.id})
         request = api_rf.delete(url, format="json")
         request.user = user
@@ -244,7 +271,7 @@ def test_lease_close(api_rf, lease_factory, user_with_permissions):
     user = user_with_permissions([("lease", "lease")])
     lease = lease_factory(status="ACTIVE", subscription=user.associated_subscription)
 
-    with assertNumQueries(9):
+    with assertNumQueries(14):
         url = reverse("lease:lease-close", kwargs={"pk": lease.id})
         request = api_rf.post(url, format="json")
         request.user = user
@@ -271,7 +298,7 @@ def test_lease_close(api_rf, lease_factory, user_with_permissions):
                 "due_date": ["This field is required."],
             },
             400,
-            6,
+            11,
             1,
         ),
         (
@@ -292,7 +319,7 @@ def test_lease_close(api_rf, lease_factory, user_with_permissions):
             },
             None,
             201,
-            20,
+            28,
             2,
         ),
     ),
@@ -1,3 +1,4 @@
+from django.db import transaction
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
@@ -136,7 +137,11 @@ class RentalApplicationAttachmentViewSet(FilterQuerysetByAssociatedSubscriptionM
 
 
 class LeaseViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.ModelViewSet):
-    queryset = Lease.objects.prefetch_related("primary_tenant", "rental_application", "unit").order_by("-pk")
+    queryset = (
+        Lease.objects.annotate_owner_names()
+        .prefetch_related("primary_tenant", "rental_application__applicant", "unit__parent_property")
+        .order_by("-pk")
+    )
 
     filter_backends = [SearchFilter, OrderingFilter, DjangoFilterBackend]
     ordering_fields = [
@@ -161,6 +166,7 @@ class LeaseViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.ModelVi
         methods=["post"],
         url_path="close",
     )
+    @transaction.atomic
     def close(self, request, pk=None):
         lease = self.get_object()
         if lease.status == Lease.LeaseStatus.ACTIVE:
@@ -177,6 +183,7 @@ class LeaseViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.ModelVi
         methods=["post"],
         url_path="renewal",
     )
+    @transaction.atomic
     def renewal(self, request, pk=None):
         instance = self.get_object()
         serializer = self.get_serializer(data=request.data)
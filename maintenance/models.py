@@ -113,6 +113,12 @@ class WorkOrder(CommonInfoAbstractModel):
 
     objects = WorkOrderManager()
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["subscription", "status"], name="work_order_sub_status_idx"),
+            models.Index(fields=["subscription", "-id"], name="work_order_sub_id_idx"),
+        ]
+
     def __str__(self) -> str:
         return self.service_request.unit.name
 
@@ -2,8 +2,8 @@ from typing import Any
 
 from rest_framework import serializers
 
-from authentication.serializers import UserSerializer
 from core.serializers import ModifiedByAbstractSerializer
+from property.models import Unit
 from property.serializers import UnitPhotoSerializer
 
 from .models import (
@@ -60,21 +60,15 @@ class ServiceRequestSerializer(ModifiedByAbstractSerializer):
         )
 
     def get_unit_cover_picture(self, obj):
-        if isinstance(obj, Inspection):
-            cover = obj.unit.photos.filter(is_cover=True).first()
+        if isinstance(obj, ServiceRequest):
+            cover = Unit.objects.get_cover_picture(obj.unit)
             if cover:
                 return UnitPhotoSerializer(cover).data
-            else:
-                cover = obj.unit.photos.all().first()
-                if cover:
-                    return UnitPhotoSerializer(cover).data
 
         return None
 
 
 class ServiceRequestAttachmentSerializer(ModifiedByAbstractSerializer):
-    created_by = UserSerializer(many=False, read_only=True)
-
     class Meta:
         model = ServiceRequestAttachment
         fields = (
@@ -148,13 +142,9 @@ class InspectionSerializer(ModifiedByAbstractSerializer):
 
     def get_unit_cover_picture(self, obj):
         if isinstance(obj, Inspection):
-            cover = obj.unit.photos.filter(is_cover=True).first()
+            cover = Unit.objects.get_cover_picture(obj.unit)
             if cover:
                 return UnitPhotoSerializer(cover).data
-            else:
-                cover = obj.unit.photos.all().first()
-                if cover:
-                    return UnitPhotoSerializer(cover).data
 
         return None
 
@@ -232,8 +222,6 @@ class ProjectExpenseSerializer(ModifiedByAbstractSerializer):
 
 
 class ProjectExpenseAttachmentSerializer(ModifiedByAbstractSerializer):
-    created_by = UserSerializer(many=False, read_only=True)
-
     class Meta:
         model = ProjectExpenseAttachment
         fields = (
@@ -272,8 +260,6 @@ class PurchaseOrderItemSerializer(ModifiedByAbstractSerializer):
 
 
 class PurchaseOrderAttachmentSerializer(ModifiedByAbstractSerializer):
-    created_by = UserSerializer(many=False, read_only=True)
-
     class Meta:
         model = PurchaseOrderAttachment
         fields = (
@@ -2,7 +2,7 @@ from decimal import Decimal
 
 import pytest
 
-from authentication.serializers import UserSerializer
+from authentication.serializers import AuditUserSerializer
 
 from ..models import (
     Area,
@@ -475,7 +475,7 @@ def test_purchase_order_attachment_serializer_read(
     instance = purchase_order_attachment_factory(created_by=user, purchase_order=purchase_order)
     serializer = PurchaseOrderAttachmentSerializer(instance)
     assert serializer.data["purchase_order"] == purchase_order.id
-    assert serializer.data["created_by"] == UserSerializer(instance.created_by).data
+    assert serializer.data["created_by"] == AuditUserSerializer(instance.created_by).data
     assert serializer.data["file"] == instance.file
     assert serializer.data["name"] == instance.name
     assert serializer.data["file_type"] == instance.file_type
@@ -1026,7 +1026,7 @@ def test_service_request_attachment_serializer_read(
     serializer = ServiceRequestAttachmentSerializer(instance)
 
     assert serializer.data["service_request"] == service_request.id
-    assert serializer.data["created_by"] == UserSerializer(instance.created_by).data
+    assert serializer.data["created_by"] == AuditUserSerializer(instance.created_by).data
     assert serializer.data["file"] == instance.file
     assert serializer.data["name"] == instance.name
     assert serializer.data["file_type"] == instance.file_type
@@ -1576,7 +1576,7 @@ def test_project_expense_attachment_serializer_read(
     instance = project_expense_attachment_factory(created_by=user, project_expense=project_expense)
     serializer = ProjectExpenseAttachmentSerializer(instance)
     assert serializer.data["project_expense"] == project_expense.id
-    assert serializer.data["created_by"] == UserSerializer(instance.created_by).data
+    assert serializer.data["created_by"] == AuditUserSerializer(instance.created_by).data
     assert serializer.data["file"] == instance.file
     assert serializer.data["name"] == instance.name
     assert serializer.data["file_type"] == instance.file_type
@@ -11,15 +11,15 @@ from maintenance.views import InspectionViewSet
 @pytest.mark.parametrize(
     "query_params, index_result, num_queries",
     (
-        ({}, [2, 1, 0], 12),
-        ({"search": "cost go major"}, [0], 6),
-        ({"ordering": "name"}, [0, 1, 2], 12),
-        ({"ordering": "-name"}, [2, 1, 0], 12),
-        ({"ordering": "date"}, [0, 1, 2], 12),
-        ({"ordering": "-date"}, [2, 1, 0], 12),
-        ({"unit": 0}, [0], 7),
-        ({"date__lte": "2023-1-2"}, [1, 0], 9),
-        ({"date__gte": "2023-1-2"}, [2, 1], 9),
+        ({}, [2, 1, 0], 4),
+        ({"search": "cost go major"}, [0], 4),
+        ({"ordering": "name"}, [0, 1, 2], 4),
+        ({"ordering": "-name"}, [2, 1, 0], 4),
+        ({"ordering": "date"}, [0, 1, 2], 4),
+        ({"ordering": "-date"}, [2, 1, 0], 4),
+        ({"unit": 0}, [0], 5),
+        ({"date__lte": "2023-1-2"}, [1, 0], 4),
+        ({"date__gte": "2023-1-2"}, [2, 1], 4),
     ),
 )
 @pytest.mark.django_db
@@ -61,6 +61,32 @@ def test_inspection_list(
     assert response_ids == [inspections[i] for i in index_result]
 
 
+@pytest.mark.django_db
+def test_inspection_list_queries(
+    api_rf, user_with_permissions, inspection_factory, unit_photo_factory, assert_constant_queries
+):
+    """
+    Testing :py:meth:`maintenance.views.InspectionViewSet.list` runs a fixed number of queries
+    """
+    user = user_with_permissions([("maintenance", "inspection")])
+
+    def make_request():
+        url = reverse("maintenance:inspection-list")
+        request = api_rf.get(url, format="json")
+        request.user = user
+        view = InspectionViewSet.as_view({"get": "list"})
+        response = view(request)
+        assert response.status_code == 200
+
+    def add_rows():
+        for _ in range(3):
+            inspection = inspection_factory(subscription=user.associated_subscription)
+            unit_photo_factory(unit=inspection.unit)
+
+    inspection_factory(subscription=user.associated_subscription)
+    assert_constant_queries(make_request, add_rows)
+
+
 @pytest.mark.parametrize(
     "data, expected_response, status_code, num_queries, obj_count",
     (
@@ -83,7 +109,7 @@ def test_inspection_list(
             },
             None,
             201,
-            7,
+            6,
             1,
         ),
     ),
@@ -124,7 +150,7 @@ def test_inspection_retrieve(api_rf, inspection_factory, user_with_permissions):
     user = user_with_permissions([("maintenance", "inspection")])
     inspection = inspection_factory(subscription=user.associated_subscription)
 
-    with assertNumQueries(6):
+    with assertNumQueries(4):
         url = reverse("maintenance:inspection-detail", kwargs={"pk": inspection.id})
         request = api_rf.get(url, format="json")
         request.user = user
@@ -172,7 +198,7 @@ def test_inspection_delete(api_rf, inspection_factory, user_with_permissions):
     user = user_with_permissions([("maintenance", "inspection")])
     inspection = inspection_factory(subscription=user.associated_subscription)
 
-    with assertNumQueries(5):
+    with assertNumQueries(6):
         url = reverse("maintenance:inspection-detail", kwargs={"pk": inspection.id})
         request = api_rf.delete(url, format="json")
         request.user = user
@@ -325,7 +325,7 @@ def test_inventory_delete(api_rf, inventory_factory, user_with_permissions):
                 },
             ],
             201,
-            12,
+            13,
             2,
         ),
     ),
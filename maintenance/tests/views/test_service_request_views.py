@@ -9,13 +9,13 @@ from maintenance.views import ServiceRequestViewSet
 @pytest.mark.parametrize(
     "query_params, index_result, num_queries",
     (
-        ({}, [2, 1, 0], 6),
+        ({}, [2, 1, 0], 4),
         ({"search": "srq-1"}, [0], 4),
         ({"search": "success thus yourself treatment"}, [1], 4),
-        ({"ordering": "description"}, [0, 1, 2], 6),
-        ({"ordering": "-description"}, [2, 1, 0], 6),
-        ({"ordering": "unit__parent_property__name"}, [0, 2, 1], 6),
-        ({"ordering": "-unit__parent_property__name"}, [1, 2, 0], 6),
+        ({"ordering": "description"}, [0, 1, 2], 4),
+        ({"ordering": "-description"}, [2, 1, 0], 4),
+        ({"ordering": "unit__parent_property__name"}, [0, 2, 1], 4),
+        ({"ordering": "-unit__parent_property__name"}, [1, 2, 0], 4),
         ({"priority": "URGENT"}, [1], 4),
         ({"order_type": "RESIDENT"}, [2], 4),
         ({"work_order_status": "OPEN"}, [2], 4),
@@ -121,7 +121,7 @@ def test_service_request_list(
             },
             None,
             201,
-            5,
+            6,
             1,
         ),
     ),
@@ -209,7 +209,7 @@ def test_service_request_update(api_rf, user_with_permissions, service_request_f
         "description": "Read line shake short term.",
     }
 
-    with assertNumQueries(6):
+    with assertNumQueries(8):
         url = reverse("maintenance:service_requests-detail", kwargs={"pk": service_request.id})
         request = api_rf.patch(url, data, format="json")
         request.user = user
@@ -230,7 +230,7 @@ def test_service_request_delete(api_rf, service_request_factory, user_with_permi
     user = user_with_permissions([("maintenance", "servicerequest")])
     service_request = service_request_factory(subscription=user.associated_subscription)
 
-    with assertNumQueries(6):
+    with assertNumQueries(7):
         url = reverse("maintenance:service_requests-detail", kwargs={"pk": service_request.id})
         request = api_rf.delete(url, format="json")
         request.user = user
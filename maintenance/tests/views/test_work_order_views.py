@@ -124,7 +124,7 @@ def test_work_order_list(
             },
             None,
             201,
-            13,
+            14,
             1,
         ),
     ),
@@ -252,7 +252,7 @@ def test_work_order_update(
         "owner_approved": False,
     }
 
-    with assertNumQueries(10):
+    with assertNumQueries(11):
         url = reverse("maintenance:work_orders-detail", kwargs={"pk": work_order.id})
         request = api_rf.patch(url, data, format="json")
         request.user = user
@@ -273,7 +273,7 @@ def test_work_order_delete(api_rf, service_request_factory, work_order_factory,
     user = user_with_permissions([("maintenance", "workorder")])
     service_request = service_request_factory()
     work_order = work_order_factory(service_request=service_request, subscription=user.associated_subscription)
-    with assertNumQueries(5):
+    with assertNumQueries(6):
         url = reverse("maintenance:work_orders-detail", kwargs={"pk": work_order.id})
         request = api_rf.delete(url, format="json")
         request.user = user
@@ -1,9 +1,13 @@
+from django.db import transaction
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, generics, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from accounting.utils import bulk_provision_general_ledger_accounts
 from core.mixins import FilterQuerysetByAssociatedSubscriptionMixin
+from property.managers import cover_photo_prefetch
+from property.models import UnitPhoto
 
 from .filters import PurchaseOrderFilter, ServiceRequestFilter
 from .models import (
@@ -46,7 +50,11 @@ from .serializers import (
 
 class ServiceRequestViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.ModelViewSet):
     queryset = (
-        ServiceRequest.objects.annotate_slug().annotate_data().select_related("unit").order_by("-pk")  # type: ignore[attr-defined] # noqa: E501
+        ServiceRequest.objects.annotate_slug()  # type: ignore[attr-defined]
+        .annotate_data()
+        .select_related("unit__parent_property")
+        .prefetch_related(cover_photo_prefetch("unit__photos", UnitPhoto))
+        .order_by("-pk")
     )
     filter_backends = [filters.SearchFilter, DjangoFilterBackend, filters.OrderingFilter]
     search_fields = ["subject", "description", "slug"]
@@ -86,7 +94,11 @@ class LaborViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.ModelVi
 
 
 class InspectionViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.ModelViewSet):
-    queryset = Inspection.objects.all().select_related("unit").order_by("-pk")
+    queryset = (
+        Inspection.objects.select_related("unit__parent_property")
+        .prefetch_related(cover_photo_prefetch("unit__photos", UnitPhoto))
+        .order_by("-pk")
+    )
     serializer_class = InspectionSerializer
     filter_backends = [filters.SearchFilter, DjangoFilterBackend, filters.OrderingFilter]
     search_fields = ["name"]
@@ -184,7 +196,8 @@ class InventoryViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.Mod
     def bulk_create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data, many=True)
         serializer.is_valid(raise_exception=True)
-        self.perform_create(serializer)
+        with transaction.atomic(), bulk_provision_general_ledger_accounts():
+            self.perform_create(serializer)
         headers = self.get_success_headers(serializer.data)
         return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
 
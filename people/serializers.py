@@ -1,6 +1,5 @@
 from rest_framework import serializers
 
-from authentication.serializers import UserSerializer
 from core.serializers import ModifiedByAbstractSerializer
 
 from .models import (
@@ -47,8 +46,6 @@ class TenantUpcomingActivitySerializer(ModifiedByAbstractSerializer):
 
 
 class TenantAttachmentSerializer(ModifiedByAbstractSerializer):
-    created_by = UserSerializer(many=False, read_only=True)
-
     class Meta:
         model = TenantAttachment
         fields = (
@@ -115,8 +112,6 @@ class VendorAddressSerializer(ModifiedByAbstractSerializer):
 
 
 class VendorAttachmentSerializer(ModifiedByAbstractSerializer):
-    created_by = UserSerializer(many=False, read_only=True)
-
     class Meta:
         model = VendorAttachment
         fields = (
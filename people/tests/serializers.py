@@ -1,6 +1,6 @@
 import pytest
 
-from authentication.serializers import UserSerializer
+from authentication.serializers import AuditUserSerializer
 
 from ..serializers import (
     OwnerPeopleSerializer,
@@ -148,7 +148,7 @@ def test_tenant_attachment_serializer_read(tenant_factory, tenant_attachment_fac
     serializer = TenantAttachmentSerializer(instance)
 
     assert serializer.data["tenant"] == tenant.id
-    assert serializer.data["created_by"] == UserSerializer(instance.created_by).data
+    assert serializer.data["created_by"] == AuditUserSerializer(instance.created_by).data
     assert serializer.data["file"] == instance.file
     assert serializer.data["name"] == instance.name
     assert serializer.data["file_type"] == instance.file_type
@@ -421,7 +421,7 @@ def test_vendor_attachment_serializer_read(vendor_factory, vendor_attachment_fac
 
     assert serializer.data["id"] == instance.id
     assert serializer.data["vendor"] == vendor.id
-    assert serializer.data["created_by"] == UserSerializer(instance.created_by).data
+    assert serializer.data["created_by"] == AuditUserSerializer(instance.created_by).data
     assert serializer.data["file"] == instance.file
     assert serializer.data["name"] == instance.name
     assert serializer.data["file_type"] == instance.file_type
@@ -0,0 +1,54 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from property.utils import import_portfolio, parse_portfolio_csv
+from subscription.models import Subscription
+
+
+class Command(BaseCommand):
+    help = "Import properties with their unit types and units from a CSV or JSON portfolio file"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path of the CSV file or of the JSON list of properties.")
+        parser.add_argument(
+            "--subscription-id",
+            type=int,
+            required=True,
+            help="Subscription the portfolio is imported into.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of properties imported per transaction.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate the portfolio without importing it.",
+        )
+
+    def handle(self, *args, **kwargs):
+        try:
+            subscription = Subscription.objects.get(pk=kwargs["subscription_id"])
+        except Subscription.DoesNotExist:
+            raise CommandError(f"Subscription {kwargs['subscription_id']} does not exist")
+
+        with open(kwargs["path"], encoding="utf-8-sig", newline="") as file:
+            if kwargs["path"].lower().endswith(".csv"):
+                properties_data = parse_portfolio_csv(file)
+            else:
+                properties_data = json.load(file)
+
+        report = import_portfolio(
+            properties_data, subscription, batch_size=kwargs["batch_size"], dry_run=kwargs["dry_run"]
+        )
+        for error in report["errors"]:
+            self.stderr.write(f"Rows {error['rows']} ({error['name']}): {json.dumps(error['errors'])}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Successfully imported {report['properties']} properties, {report['unit_types']} unit types and "
+                f"{report['units']} units"
+            )
+        )
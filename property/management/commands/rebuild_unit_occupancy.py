@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from core.utils import chunked
+from property.models import Unit
+
+
+class Command(BaseCommand):
+    help = "Rebuild the denormalized occupancy of units from their leases"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of units rebuilt per batch.",
+        )
+
+    def handle(self, *args, **kwargs):
+        unit_ids = Unit.objects.order_by("pk").values_list("pk", flat=True)
+        updated_count = 0
+        for chunk in chunked(unit_ids, kwargs["chunk_size"]):
+            updated_count += Unit.objects.filter(pk__in=chunk).update_occupancy()
+
+        self.stdout.write(self.style.SUCCESS(f"Successfully rebuilt occupancy of {updated_count} units"))
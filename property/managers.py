@@ -6,21 +6,53 @@ from django.db.models import (
     Exists,
     ExpressionWrapper,
     F,
-    Max,
     OuterRef,
+    Prefetch,
     Q,
     Subquery,
     Value,
     When,
 )
-from django.db.models.functions import ExtractDay
+from django.db.models.functions import Coalesce, ExtractDay, TruncDate
 from django.db.models.query import QuerySet
 from django.utils import timezone
 
 from core.managers import SlugQuerysetMixin
 
+COVER_PHOTOS_ATTR = "cover_photos"
+PROPERTY_OWNERS_ATTR = "prefetched_owners"
 
-class PropertyQuerySet(QuerySet, SlugQuerysetMixin):
+
+def cover_photo_prefetch(lookup, photo_model):
+    """
+    Prefetch for the cover photo of the objects at `lookup`, falling back to their first photo.
+    The result is stored as a one item list in `COVER_PHOTOS_ATTR`.
+    """
+    return Prefetch(lookup, queryset=photo_model.objects.order_by("-is_cover", "pk")[:1], to_attr=COVER_PHOTOS_ATTR)
+
+
+class CoverPhotoQuerysetMixin:
+    """
+    Queryset Mixin for prefetching the cover photo of models having `photos` related name.
+    """
+
+    def with_cover_photo(self):
+        return self.prefetch_related(cover_photo_prefetch("photos", self.model.photos.rel.related_model))
+
+
+class CoverPhotoManagerMixin:
+    def get_cover_picture(self, obj):
+        """
+        Returns the cover photo of `obj` or its first photo. Uses the photo prefetched by `with_cover_photo` if any.
+        """
+        if not hasattr(obj, COVER_PHOTOS_ATTR):
+            cover_picture = obj.photos.order_by("-is_cover", "pk").first()
+            setattr(obj, COVER_PHOTOS_ATTR, [cover_picture] if cover_picture else [])
+        cover_photos = getattr(obj, COVER_PHOTOS_ATTR)
+        return cover_photos[0] if cover_photos else None
+
+
+class PropertyQuerySet(QuerySet, SlugQuerysetMixin, CoverPhotoQuerysetMixin):
     def annotate_data(self):
         """
         Annotation to check if property is occupied and if late fee policy is configured
@@ -28,14 +60,11 @@ class PropertyQuerySet(QuerySet, SlugQuerysetMixin):
         from property.models import Unit
 
         units = Unit.objects.filter(parent_property=OuterRef("pk"))
-        active_lease_subquery = (
-            Unit.objects.filter(parent_property=OuterRef("pk")).annotate_data().filter(is_occupied=True)
-        )
         return self.annotate(
             number_of_units=Count("units", distinct=True),
             is_occupied=Case(
-                When(~Exists(Subquery(units)), then=Value(None)),
-                When(Exists(Subquery(active_lease_subquery)), then=Value(True)),
+                When(~Exists(units), then=Value(None)),
+                When(Exists(units.filter(current_lease__isnull=False)), then=Value(True)),
                 default=Value(False),
                 output_field=BooleanField(),
             ),
@@ -50,31 +79,43 @@ class PropertyQuerySet(QuerySet, SlugQuerysetMixin):
             ),
         )
 
+    def with_owners(self):
+        """
+        Prefetches the owners of the properties with their people into `PROPERTY_OWNERS_ATTR`.
+        """
+        from property.models import PropertyOwner
+
+        return self.prefetch_related(
+            Prefetch(
+                "owners",
+                queryset=PropertyOwner.objects.select_related("owner").order_by("owner_id"),
+                to_attr=PROPERTY_OWNERS_ATTR,
+            )
+        )
+
     def annotate_portfolio_data(self):
         return self.annotate(
             units_count=Count("units"),
-            occupied_units_count=Count("units", filter=Q(units__leases__status="ACTIVE")),
-            vacant_units_count=Count("units", filter=~Q(units__leases__status="ACTIVE")),
+            occupied_units_count=Count("units", filter=Q(units__current_lease__isnull=False)),
+            vacant_units_count=Count("units", filter=Q(units__current_lease__isnull=True)),
         )
 
 
-class PropertyManager(models.Manager.from_queryset(PropertyQuerySet)):  # type: ignore[misc]
-    def get_cover_picture(self, prop):
-        cover_photos = prop.photos.filter(is_cover=True)
-        if cover_photos.exists():
-            return cover_photos.get()
-        else:
-            return prop.photos.first()
+class PropertyManager(CoverPhotoManagerMixin, models.Manager.from_queryset(PropertyQuerySet)):  # type: ignore[misc]
+    def get_owner_peoples(self, obj):
+        """
+        Returns the people owning `obj`. Uses the owners prefetched by `with_owners` if any.
+        """
+        if not hasattr(obj, PROPERTY_OWNERS_ATTR):
+            setattr(obj, PROPERTY_OWNERS_ATTR, list(obj.owners.select_related("owner").order_by("owner_id")))
+        return list({owner.owner_id: owner.owner for owner in getattr(obj, PROPERTY_OWNERS_ATTR)}.values())
+
 
+class UnitTypeQuerySet(QuerySet, CoverPhotoQuerysetMixin):
+    pass
 
-class UnitTypeManager(models.Manager):
-    def get_cover_picture(self, unit_type):
-        cover_photos = unit_type.photos.filter(is_cover=True)
-        if cover_photos.exists():
-            return cover_photos.get()
-        else:
-            return unit_type.photos.first()
 
+class UnitTypeManager(CoverPhotoManagerMixin, models.Manager.from_queryset(UnitTypeQuerySet)):  # type: ignore[misc]
     def apply_on_all_units(self, unit_type):
         return unit_type.units.update(
             market_rent=unit_type.market_rent,
@@ -85,61 +126,45 @@ class UnitTypeManager(models.Manager):
         )
 
 
-class UnitQuerySet(QuerySet, SlugQuerysetMixin):
+class UnitQuerySet(QuerySet, SlugQuerysetMixin, CoverPhotoQuerysetMixin):
     def annotate_data(self):
+        """
+        Annotation of the occupancy of units, read from their denormalized occupancy columns
+        """
+        return self.annotate(
+            is_occupied=ExpressionWrapper(Q(current_lease__isnull=False), output_field=BooleanField()),
+            lease_id=F("current_lease_id"),
+            tenant_id=F("current_tenant_id"),
+            tenant_first_name=F("current_tenant__first_name"),
+            tenant_last_name=F("current_tenant__last_name"),
+            vacant_for_days=ExtractDay(Value(timezone.now().date()) - F("vacant_since")),
+        )
+
+    def update_occupancy(self):
+        """
+        Recomputes the occupancy columns of the units from their leases. A unit is occupied by its active lease, and
+        vacant since the end of its last closed lease or since its creation.
+        """
         from lease.models import Lease
 
-        active_lease_subquery = Lease.objects.filter(unit_id=OuterRef("pk"), status=Lease.LeaseStatus.ACTIVE)
-        closed_lease_subquery = Lease.objects.filter(unit_id=OuterRef("pk"), status=Lease.LeaseStatus.CLOSED)
-        return self.annotate(
-            is_occupied=Case(
-                When(Exists(Subquery(active_lease_subquery)), then=Value(True)),
-                default=Value(False),
-                output_field=BooleanField(),
-            ),
-            lease_id=Subquery(
-                active_lease_subquery.values("id")[:1],
-                output_field=models.IntegerField(),
-            ),
-            tenant_id=Subquery(
-                active_lease_subquery.values("primary_tenant__id")[:1],
-                output_field=models.IntegerField(),
-            ),
-            tenant_first_name=Subquery(
-                active_lease_subquery.values("primary_tenant__first_name")[:1],
-                output_field=models.CharField(),
-            ),
-            tenant_last_name=Subquery(
-                active_lease_subquery.values("primary_tenant__last_name")[:1],
-                output_field=models.CharField(),
-            ),
-            vacant_for_days=Case(
-                When(
-                    ~Q(leases__status="ACTIVE") & Exists(Subquery(closed_lease_subquery)),
-                    then=ExtractDay(
-                        timezone.now().date()
-                        - Max(
-                            F("leases__end_date"),
-                            output_field=models.DateField(),
-                        )
-                    ),
-                ),
-                When(
-                    ~Q(leases__status="ACTIVE") & ~Exists(Subquery(closed_lease_subquery)),
-                    then=ExtractDay(timezone.now().date() - F("created_at")),
-                ),
-                default=Value(None),
+        active_leases = Lease.objects.filter(unit_id=OuterRef("pk"), status=Lease.LeaseStatus.ACTIVE)
+        last_closed_lease = Lease.objects.filter(unit_id=OuterRef("pk"), status=Lease.LeaseStatus.CLOSED).order_by(
+            "-end_date"
+        )
+        return self.update(
+            current_lease=Subquery(active_leases.values("pk")[:1]),
+            current_tenant=Subquery(active_leases.values("primary_tenant__pk")[:1]),
+            occupied_since=Subquery(active_leases.values("start_date")[:1]),
+            vacant_since=Case(
+                When(Exists(active_leases), then=Value(None)),
+                default=Coalesce(Subquery(last_closed_lease.values("end_date")[:1]), TruncDate("created_at")),
+                output_field=models.DateField(),
             ),
         )
 
 
-class UnitManager(models.Manager.from_queryset(UnitQuerySet)):  # type: ignore[misc]
-    def get_cover_picture(self, unit):
-        cover_photos = unit.photos.filter(is_cover=True)
-        if cover_photos.exists():
-            return cover_photos.get()
-        else:
-            return unit.photos.first()
+class UnitManager(CoverPhotoManagerMixin, models.Manager.from_queryset(UnitQuerySet)):  # type: ignore[misc]
+    pass
 
 
 class LateFeePolicyQuerySet(QuerySet):
@@ -1,6 +1,7 @@
 from django.db import models
 from django.db.models.signals import post_save
 from django.dispatch import receiver
+from django.utils import timezone
 
 from core.models import CommonInfoAbstractModel, UpcomingActivityAbstract
 
@@ -37,10 +38,22 @@ class Unit(CommonInfoAbstractModel):
 
     parent_property = models.ForeignKey("Property", related_name="units", on_delete=models.CASCADE)
 
+    # Occupancy, denormalized from the leases of the unit by `UnitQuerySet.update_occupancy`
+    current_lease = models.ForeignKey(
+        "lease.Lease", related_name="+", on_delete=models.SET_NULL, blank=True, null=True, editable=False
+    )
+    current_tenant = models.ForeignKey(
+        "people.Tenant", related_name="+", on_delete=models.SET_NULL, blank=True, null=True, editable=False
+    )
+    occupied_since = models.DateField(blank=True, null=True, db_index=True, editable=False)
+    vacant_since = models.DateField(blank=True, null=True, db_index=True, editable=False)
+
     objects = UnitManager()
 
     def save(self, *args, **kwargs):
         self.parent_property = self.unit_type.parent_property
+        if self._state.adding and self.current_lease_id is None and self.vacant_since is None:
+            self.vacant_since = timezone.now().date()
         super().save(*args, **kwargs)
 
     def __str__(self):
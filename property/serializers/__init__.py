@@ -3,6 +3,7 @@ from .properties import (
     OwnerPeopleSerializerForPropertyList,
     PortfolioPropertySerializer,
     PropertyAttachmentSerializer,
+    PropertyImportSerializer,
     PropertyLateFeePolicySerializer,
     PropertyLeaseRenewalAttachmentSerializer,
     PropertyLeaseTemplateAttachmentSerializer,
@@ -40,4 +41,5 @@ __all__ = [  # type: ignore[misc]
     PropertyLeaseTemplateAttachmentSerializer,
     OwnerOwnedPropertiesListSerializer,
     PortfolioPropertySerializer,
+    PropertyImportSerializer,
 ]
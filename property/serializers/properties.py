@@ -1,7 +1,6 @@
 from django.db.models import Max
 from rest_framework import serializers
 
-from authentication.serializers import UserSerializer
 from core.serializers import ModifiedByAbstractSerializer
 from people.models import Owner as PeopleOwner
 from property.models import (
@@ -14,6 +13,8 @@ from property.models import (
     PropertyPhoto,
     PropertyUpcomingActivity,
     PropertyUtilityBilling,
+    Unit,
+    UnitType,
 )
 
 
@@ -89,8 +90,6 @@ class PropertyLateFeePolicySerializer(ModifiedByAbstractSerializer):
 
 
 class PropertyAttachmentSerializer(ModifiedByAbstractSerializer):
-    created_by = UserSerializer(many=False, read_only=True)
-
     class Meta:
         model = PropertyAttachment
         fields = (
@@ -106,8 +105,6 @@ class PropertyAttachmentSerializer(ModifiedByAbstractSerializer):
 
 
 class PropertyLeaseTemplateAttachmentSerializer(ModifiedByAbstractSerializer):
-    created_by = UserSerializer(many=False, read_only=True)
-
     class Meta:
         model = PropertyLeaseTemplateAttachment
         fields = (
@@ -123,8 +120,6 @@ class PropertyLeaseTemplateAttachmentSerializer(ModifiedByAbstractSerializer):
 
 
 class PropertyLeaseRenewalAttachmentSerializer(ModifiedByAbstractSerializer):
-    created_by = UserSerializer(many=False, read_only=True)
-
     class Meta:
         model = PropertyLeaseRenewalAttachment
         fields = (
@@ -295,9 +290,7 @@ class PropertyListSerializer(ModifiedByAbstractSerializer):
                 return cover_picture.image
 
     def get_owner_peoples(self, obj):
-        owner_people_ids = obj.owners.values_list("owner")
-        owner_people = PeopleOwner.objects.filter(id__in=owner_people_ids)
-        return OwnerPeopleSerializerForPropertyList(owner_people, many=True).data
+        return OwnerPeopleSerializerForPropertyList(Property.objects.get_owner_peoples(obj), many=True).data
 
 
 RENT_INCREASE_TYPE = (
@@ -349,3 +342,91 @@ class PortfolioPropertySerializer(ModifiedByAbstractSerializer):
 
     def get_vacant_for_days(self, obj):
         return obj.units.annotate_data().aggregate(Max("vacant_for_days"))["vacant_for_days__max"]
+
+
+class UnitImportSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Unit
+        fields = (
+            "name",
+            "address",
+            "ready_for_show_on",
+            "virtual_showing_available",
+            "utility_bills",
+            "utility_bills_date",
+            "lock_box",
+            "description",
+            "non_revenues_status",
+        )
+
+
+class UnitTypeImportSerializer(serializers.ModelSerializer):
+    units = UnitImportSerializer(many=True, required=False)
+
+    class Meta:
+        model = UnitType
+        fields = (
+            "name",
+            "bed_rooms",
+            "bath_rooms",
+            "square_feet",
+            "market_rent",
+            "future_market_rent",
+            "effective_date",
+            "application_fee",
+            "estimate_turn_over_cost",
+            "is_cat_allowed",
+            "is_dog_allowed",
+            "is_smoking_allowed",
+            "marketing_title",
+            "marketing_description",
+            "marketing_youtube_url",
+            "units",
+        )
+
+
+class PropertyImportSerializer(serializers.ModelSerializer):
+    """
+    Validates a property of a portfolio import with its unit types and units, without any query. The ids of the
+    property types of the subscription are expected in the ``property_type_ids`` context.
+    """
+
+    property_type = serializers.IntegerField()
+    unit_types = UnitTypeImportSerializer(many=True, required=False)
+
+    class Meta:
+        model = Property
+        fields = (
+            "name",
+            "address",
+            "property_type",
+            "description",
+            "renters_tax_location_code",
+            "property_owner_license",
+            "year_built",
+            "management_start_date",
+            "management_end_date",
+            "management_end_reason",
+            "nsf_fee",
+            "management_fees_amount",
+            "management_fees_percentage",
+            "management_commission_type",
+            "is_cat_allowed",
+            "is_dog_allowed",
+            "is_smoking_allowed",
+            "notes",
+            "tax_authority",
+            "portfolio",
+            "maintenance_limit_amount",
+            "insurance_expiration_date",
+            "has_home_warranty_coverage",
+            "home_warranty_company",
+            "home_warranty_expiration_date",
+            "maintenance_notes",
+            "unit_types",
+        )
+
+    def validate_property_type(self, value):
+        if value not in self.context["property_type_ids"]:
+            raise serializers.ValidationError("Invalid property type.")
+        return value
@@ -162,14 +162,15 @@ class UnitListSerializer(ModifiedByAbstractSerializer):
                 return cover_picture.id
 
     def get_lease_start_date(self, obj) -> Optional[str]:
-        lease = obj.leases.filter(status="ACTIVE").first()
+        # The active lease is denormalized on the unit, select ``current_lease`` to read it without a query per unit.
+        lease = obj.current_lease
         if lease:
             return lease.start_date
         else:
             return None
 
     def get_lease_end_date(self, obj) -> Optional[str]:
-        lease = obj.leases.filter(status="ACTIVE").first()
+        lease = obj.current_lease
         if lease:
             return lease.end_date
         else:
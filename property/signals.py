@@ -1,110 +1,20 @@
-from django.contrib.contenttypes.models import ContentType
-from django.db.models.signals import post_save
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from accounting.models import (
-    GeneralLedgerAccount,
-    GeneralLedgerAccountLabelChoices,
-    GeneralLedgerAccountTypeChoices,
-    GeneralLedgerSubAccountTypeChoices,
-)
+from accounting.utils import provision_holder_general_ledger_accounts
+
+from .models import Unit
 
 
 @receiver(post_save, sender="property.Unit")
-def create_unit_general_ledger_accounts(sender, instance, created, **kwargs):
-    if created:
-        content_type = ContentType.objects.get_for_model(instance)
-        GLAccountData = [
-            {
-                "account_type": GeneralLedgerAccountTypeChoices.ASSET,
-                "sub_account_type": GeneralLedgerSubAccountTypeChoices.RECEIVABLES,
-                "account_holder_content_type": content_type,
-                "account_holder_object_id": instance.id,
-            },
-            {
-                "account_type": GeneralLedgerAccountTypeChoices.ASSET,
-                "sub_account_type": GeneralLedgerSubAccountTypeChoices.RECEIVABLES,
-                "account_holder_content_type": content_type,
-                "account_holder_object_id": instance.id,
-                "label": GeneralLedgerAccountLabelChoices.SALES_TAX,
-            },
-            {
-                "account_type": GeneralLedgerAccountTypeChoices.ASSET,
-                "sub_account_type": GeneralLedgerSubAccountTypeChoices.INVENTORY,
-                "account_holder_content_type": content_type,
-                "account_holder_object_id": instance.id,
-            },
-            {
-                "account_type": GeneralLedgerAccountTypeChoices.ASSET,
-                "sub_account_type": GeneralLedgerSubAccountTypeChoices.FIXED_ASSETS,
-                "account_holder_content_type": content_type,
-                "account_holder_object_id": instance.id,
-            },
-            {
-                "account_type": GeneralLedgerAccountTypeChoices.INCOME,
-                "sub_account_type": GeneralLedgerSubAccountTypeChoices.DIRECT_INCOME,
-                "account_holder_content_type": content_type,
-                "account_holder_object_id": instance.id,
-            },
-            {
-                "account_type": GeneralLedgerAccountTypeChoices.INCOME,
-                "sub_account_type": GeneralLedgerSubAccountTypeChoices.INDIRECT_INCOME,
-                "account_holder_content_type": content_type,
-                "account_holder_object_id": instance.id,
-            },
-            {
-                "account_type": GeneralLedgerAccountTypeChoices.EXPENSE,
-                "sub_account_type": GeneralLedgerSubAccountTypeChoices.DIRECT_EXPENSE,
-                "account_holder_content_type": content_type,
-                "account_holder_object_id": instance.id,
-            },
-            {
-                "account_type": GeneralLedgerAccountTypeChoices.EXPENSE,
-                "sub_account_type": GeneralLedgerSubAccountTypeChoices.INDIRECT_EXPENSE,
-                "account_holder_content_type": content_type,
-                "account_holder_object_id": instance.id,
-            },
-            {
-                "account_type": GeneralLedgerAccountTypeChoices.LIABILITY,
-                "sub_account_type": GeneralLedgerSubAccountTypeChoices.CURRENT_LIABILITY,
-                "account_holder_content_type": content_type,
-                "account_holder_object_id": instance.id,
-            },
-            {
-                "account_type": GeneralLedgerAccountTypeChoices.LIABILITY,
-                "sub_account_type": GeneralLedgerSubAccountTypeChoices.NON_CURRENT_LIABILITY,
-                "account_holder_content_type": content_type,
-                "account_holder_object_id": instance.id,
-            },
-            {
-                "account_type": GeneralLedgerAccountTypeChoices.ASSET,
-                "sub_account_type": GeneralLedgerSubAccountTypeChoices.RECEIVABLES,
-                "account_holder_content_type": content_type,
-                "account_holder_object_id": instance.id,
-                "label": GeneralLedgerAccountLabelChoices.LATE_FEE,
-            },
-            {
-                "account_type": GeneralLedgerAccountTypeChoices.INCOME,
-                "sub_account_type": GeneralLedgerSubAccountTypeChoices.INDIRECT_INCOME,
-                "account_holder_content_type": content_type,
-                "account_holder_object_id": instance.id,
-                "label": GeneralLedgerAccountLabelChoices.LATE_FEE,
-            },
-            {
-                "account_type": GeneralLedgerAccountTypeChoices.ASSET,
-                "sub_account_type": GeneralLedgerSubAccountTypeChoices.RECEIVABLES,
-                "account_holder_content_type": content_type,
-                "account_holder_object_id": instance.id,
-                "label": GeneralLedgerAccountLabelChoices.CHARGE,
-            },
-            {
-                "account_type": GeneralLedgerAccountTypeChoices.INCOME,
-                "sub_account_type": GeneralLedgerSubAccountTypeChoices.INDIRECT_INCOME,
-                "account_holder_content_type": content_type,
-                "account_holder_object_id": instance.id,
-                "label": GeneralLedgerAccountLabelChoices.CHARGE,
-            },
-        ]
-        GeneralLedgerAccount.objects.bulk_create(
-            [GeneralLedgerAccount(**data, subscription=instance.subscription) for data in GLAccountData]
-        )
+def create_unit_general_ledger_accounts(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        provision_holder_general_ledger_accounts(instance)
+
+
+@receiver(post_save, sender="lease.Lease")
+@receiver(post_delete, sender="lease.Lease")
+def update_lease_unit_occupancy(sender, instance, raw=False, **kwargs):
+    if not raw:
+        Unit.objects.filter(Q(pk=instance.unit_id) | Q(current_lease=instance.pk)).update_occupancy()
@@ -1,5 +1,6 @@
 import pytest
 from django.utils import timezone
+from pytest_django.asserts import assertNumQueries
 
 from property.models import Property, PropertyLateFeePolicy, Unit, UnitType
 
@@ -162,3 +163,27 @@ def test_unit_annotate_data(unit_factory, lease_factory, freezer):
     unit = Unit.objects.annotate_data().get(id=unit.id)
 
     assert unit.vacant_for_days == 1
+
+
+@pytest.mark.django_db
+def test_unit_manager_with_cover_photo(unit_factory, unit_photo_factory):
+    """
+    Testing :py:meth:`property.managers.CoverPhotoQuerysetMixin.with_cover_photo`.
+    """
+    unit_without_photos = unit_factory()
+    unit_without_cover = unit_factory()
+    first_photo = unit_photo_factory(unit=unit_without_cover)
+    unit_photo_factory(unit=unit_without_cover)
+    unit_with_cover = unit_factory()
+    unit_photo_factory(unit=unit_with_cover)
+    cover_photo = unit_photo_factory(unit=unit_with_cover, is_cover=True)
+
+    with assertNumQueries(2):
+        units = {unit.id: unit for unit in Unit.objects.with_cover_photo()}  # type: ignore[attr-defined]
+        assert Unit.objects.get_cover_picture(units[unit_without_photos.id]) is None
+        assert Unit.objects.get_cover_picture(units[unit_without_cover.id]) == first_photo
+        assert Unit.objects.get_cover_picture(units[unit_with_cover.id]) == cover_photo
+
+    with assertNumQueries(1):
+        assert Unit.objects.get_cover_picture(unit_with_cover) == cover_photo
+        assert Unit.objects.get_cover_picture(unit_with_cover) == cover_photo
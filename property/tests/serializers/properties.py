@@ -1,7 +1,7 @@
 import pytest
 from django.db.models import Max
 
-from authentication.serializers import UserSerializer
+from authentication.serializers import AuditUserSerializer
 from property.models import Property
 from property.serializers import (
     OwnerOwnedPropertiesListSerializer,
@@ -150,7 +150,7 @@ def test_property_attachment_serializer_read(property_factory, property_attachme
     serializer = PropertyAttachmentSerializer(instance)
 
     assert serializer.data["parent_property"] == prop.id
-    assert serializer.data["created_by"] == UserSerializer(instance.created_by).data
+    assert serializer.data["created_by"] == AuditUserSerializer(instance.created_by).data
     assert serializer.data["file"] == instance.file
     assert serializer.data["name"] == instance.name
     assert serializer.data["file_type"] == instance.file_type
@@ -232,7 +232,7 @@ def test_property_lease_template_attachment_serializer_read(
     serializer = PropertyLeaseTemplateAttachmentSerializer(instance)
 
     assert serializer.data["parent_property"] == prop.id
-    assert serializer.data["created_by"] == UserSerializer(instance.created_by).data
+    assert serializer.data["created_by"] == AuditUserSerializer(instance.created_by).data
     assert serializer.data["file"] == instance.file
     assert serializer.data["name"] == instance.name
     assert serializer.data["file_type"] == instance.file_type
@@ -314,7 +314,7 @@ def test_property_lease_renewal_attachment_serializer_read(
     serializer = PropertyLeaseRenewalAttachmentSerializer(instance)
 
     assert serializer.data["parent_property"] == prop.id
-    assert serializer.data["created_by"] == UserSerializer(instance.created_by).data
+    assert serializer.data["created_by"] == AuditUserSerializer(instance.created_by).data
     assert serializer.data["file"] == instance.file
     assert serializer.data["name"] == instance.name
     assert serializer.data["file_type"] == instance.file_type
@@ -1,5 +1,10 @@
+import json
+from io import StringIO
+
 import pytest
+from django.core import management
 
+from property.models import Property, Unit
 from property.tasks import scheduled_rent_increase
 
 
@@ -22,3 +27,67 @@ def test_scheduled_rent_increase(property_factory, unit_type_factory, unit_facto
     scheduled_rent_increase(prop.id, rent_increase, rent_increase_type)
     unit.refresh_from_db()
     assert unit.market_rent == 250
+
+
+@pytest.mark.django_db
+def test_rebuild_unit_occupancy_command(unit_factory, lease_factory):
+    """
+    Testing :py:mod:`property.management.commands.rebuild_unit_occupancy`
+    """
+    unit = unit_factory()
+    lease = lease_factory(rental_application__applicant__unit=unit, unit=unit, status="ACTIVE")
+    unit_factory()
+    Unit.objects.update(current_lease=None, current_tenant=None, occupied_since=None, vacant_since=None)
+
+    out = StringIO()
+    management.call_command("rebuild_unit_occupancy", "--chunk-size", "1", stdout=out)
+
+    assert "Successfully rebuilt occupancy of 2 units" in out.getvalue()
+    unit.refresh_from_db()
+    assert unit.current_lease == lease
+    assert unit.current_tenant == lease.primary_tenant
+    lease.refresh_from_db()
+    assert unit.occupied_since == lease.start_date
+    assert unit.vacant_since is None
+    assert Unit.objects.filter(current_lease__isnull=True, vacant_since__isnull=False).count() == 1
+
+
+@pytest.mark.django_db
+def test_import_portfolio_command(tmp_path, property_type_factory):
+    """
+    Testing :py:mod:`property.management.commands.import_portfolio`
+    """
+    property_type = property_type_factory()
+    path = tmp_path / "portfolio.json"
+    path.write_text(
+        json.dumps(
+            [
+                {
+                    "name": f"Property {index}",
+                    "address": f"{index} Main Street",
+                    "property_type": property_type.id,
+                    "unit_types": [{"name": "Studio", "units": [{"name": "1"}, {"name": "2"}]}],
+                }
+                for index in range(3)
+            ]
+            + [{"name": "Invalid", "property_type": property_type.id}]
+        )
+    )
+
+    out = StringIO()
+    err = StringIO()
+    management.call_command(
+        "import_portfolio",
+        str(path),
+        "--subscription-id",
+        str(property_type.subscription_id),
+        "--batch-size",
+        "2",
+        stdout=out,
+        stderr=err,
+    )
+
+    assert "Successfully imported 3 properties, 3 unit types and 6 units" in out.getvalue()
+    assert "Rows [3] (Invalid)" in err.getvalue()
+    assert Property.objects.filter(subscription=property_type.subscription).count() == 3
+    assert Unit.objects.filter(subscription=property_type.subscription).count() == 6
@@ -59,7 +59,7 @@ def test_property_late_fee_policy_update(api_rf, property_factory, user_with_per
         "grace_period": 5,
     }
 
-    with assertNumQueries(4):
+    with assertNumQueries(5):
         url = reverse("property:property_late_fee_policy-detail", kwargs={"pk": prop.late_fee_policy.id})
         request = api_rf.patch(url, data, format="json")
         request.user = user
@@ -1,7 +1,9 @@
 import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
 from pytest_django.asserts import assertNumQueries
 
+from accounting.models import GeneralLedgerAccount
 from property.models import Property
 from property.views import PortfolioPropertiesListAPIView, PropertyViewSet
 
@@ -9,21 +11,21 @@ from property.views import PortfolioPropertiesListAPIView, PropertyViewSet
 @pytest.mark.parametrize(
     "query_params, index_result, num_queries",
     (
-        ({}, [2, 1, 0], 12),
-        ({"search": "John Property"}, [0], 6),
-        ({"search": "2370 Box 4044"}, [1], 6),
-        ({"search": "Villa"}, [2], 6),
-        ({"search": "prp-2"}, [1], 6),
-        ({"ordering": "pk"}, [0, 1, 2], 12),
-        ({"ordering": "-pk"}, [2, 1, 0], 12),
-        ({"ordering": "name"}, [2, 1, 0], 12),
-        ({"ordering": "-name"}, [0, 1, 2], 12),
-        ({"ordering": "number_of_units"}, [0, 1, 2], 12),
-        ({"ordering": "-number_of_units"}, [2, 1, 0], 12),
-        ({"ordering": "owners__owner__first_name"}, [2, 1, 0], 12),
-        ({"ordering": "-owners__owner__first_name"}, [0, 1, 2], 12),
-        ({"property_type": True}, [2], 7),
-        ({"is_occupied": True}, [2], 6),
+        ({}, [2, 1, 0], 5),
+        ({"search": "John Property"}, [0], 5),
+        ({"search": "2370 Box 4044"}, [1], 5),
+        ({"search": "Villa"}, [2], 5),
+        ({"search": "prp-2"}, [1], 5),
+        ({"ordering": "pk"}, [0, 1, 2], 5),
+        ({"ordering": "-pk"}, [2, 1, 0], 5),
+        ({"ordering": "name"}, [2, 1, 0], 5),
+        ({"ordering": "-name"}, [0, 1, 2], 5),
+        ({"ordering": "number_of_units"}, [0, 1, 2], 5),
+        ({"ordering": "-number_of_units"}, [2, 1, 0], 5),
+        ({"ordering": "owners__owner__first_name"}, [2, 1, 0], 5),
+        ({"ordering": "-owners__owner__first_name"}, [0, 1, 2], 5),
+        ({"property_type": True}, [2], 6),
+        ({"is_occupied": True}, [2], 5),
     ),
 )
 @pytest.mark.django_db
@@ -105,6 +107,31 @@ def test_property_list(
     }
 
 
+@pytest.mark.django_db
+def test_property_list_queries(
+    api_rf, user_with_permissions, property_factory, property_owner_factory, assert_constant_queries
+):
+    """
+    Testing :py:meth:`property.views.PropertyViewSet.list` runs a fixed number of queries
+    """
+    user = user_with_permissions([("property", "property")])
+
+    def make_request():
+        url = reverse("property:property-list")
+        request = api_rf.get(url, format="json")
+        request.user = user
+        response = PropertyViewSet.as_view({"get": "list"})(request)
+        assert response.status_code == 200
+        assert all(len(prop["owner_peoples"]) == 1 for prop in response.data)
+
+    def add_rows():
+        for _ in range(3):
+            property_owner_factory(parent_property=property_factory(subscription=user.associated_subscription))
+
+    property_owner_factory(parent_property=property_factory(subscription=user.associated_subscription))
+    assert_constant_queries(make_request, add_rows)
+
+
 @pytest.mark.parametrize(
     "data, expected_response, status_code, num_queries, obj_count",
     (
@@ -166,7 +193,7 @@ def test_property_list(
             },
             None,
             201,
-            12,
+            9,
             1,
         ),
     ),
@@ -218,7 +245,7 @@ def test_property_retrieve(api_rf, property_factory, user_with_permissions):
     user = user_with_permissions([("property", "property")])
     prop = property_factory(subscription=user.associated_subscription)
 
-    with assertNumQueries(8):
+    with assertNumQueries(5):
         url = reverse("property:property-detail", kwargs={"pk": prop.id})
         request = api_rf.get(url, format="json")
         request.user = user
@@ -337,7 +364,7 @@ def test_property_update(api_rf, property_factory, user_with_permissions):
         "rental_application_template": prop.rental_application_template.id,
     }
 
-    with assertNumQueries(13):
+    with assertNumQueries(10):
         url = reverse("property:property-detail", kwargs={"pk": prop.id})
         request = api_rf.patch(url, data, format="json")
         request.user = user
@@ -358,7 +385,7 @@ def test_property_delete(api_rf, property_factory, user_with_permissions):
     user = user_with_permissions([("property", "property")])
     prop = property_factory(subscription=user.associated_subscription)
 
-    with assertNumQueries(20):
+    with assertNumQueries(21):
         url = reverse("property:property-detail", kwargs={"pk": prop.id})
         request = api_rf.delete(url, format="json")
         request.user = user
@@ -370,6 +397,88 @@ def test_property_delete(api_rf, property_factory, user_with_permissions):
     assert Property.objects.count() == 0
 
 
+@pytest.mark.django_db
+def test_property_import_portfolio(api_rf, property_type_factory, user_with_permissions):
+    """
+    Testing :py:meth:`property.views.PropertyViewSet.import_portfolio` method.
+    """
+
+    user = user_with_permissions([("property", "property")])
+    property_type = property_type_factory(subscription=user.associated_subscription)
+    data = {
+        "properties": [
+            {
+                "name": "Lakeside",
+                "address": "12 Lake Road",
+                "property_type": property_type.id,
+                "unit_types": [
+                    {"name": "Studio", "market_rent": "900.00", "units": [{"name": "A-1"}, {"name": "A-2"}]},
+                    {"name": "Loft", "units": [{"name": "B-1"}]},
+                ],
+            },
+            {"name": "Hillside", "address": "1 Hill Road", "property_type": property_type_factory().id},
+        ]
+    }
+
+    url = reverse("property:property-import-portfolio")
+    request = api_rf.post(url, {**data, "dry_run": True}, format="json")
+    request.user = user
+    view = PropertyViewSet.as_view({"post": "import_portfolio"})
+    response = view(request)
+
+    assert response.status_code == 200
+    assert (response.data["properties"], response.data["unit_types"], response.data["units"]) == (1, 2, 3)
+    assert Property.objects.count() == 0
+
+    request = api_rf.post(url, data, format="json")
+    request.user = user
+    response = view(request)
+
+    assert response.status_code == 201
+    assert (response.data["properties"], response.data["unit_types"], response.data["units"]) == (1, 2, 3)
+    assert response.data["errors"] == [
+        {"rows": [1], "name": "Hillside", "errors": {"property_type": ["Invalid property type."]}}
+    ]
+    prop = Property.objects.get()
+    assert prop.subscription == user.associated_subscription
+    assert prop.late_fee_policy.subscription == user.associated_subscription
+    assert sorted(prop.units.filter(market_rent=900).values_list("name", flat=True)) == ["A-1", "A-2"]
+    assert prop.units.filter(vacant_since__isnull=False).count() == 3
+    assert GeneralLedgerAccount.objects.filter(account_holder_object_id__in=prop.units.values("id")).count() == 42
+
+
+@pytest.mark.django_db
+def test_property_import_portfolio_csv(api_rf, property_type_factory, user_with_permissions):
+    """
+    Testing :py:meth:`property.views.PropertyViewSet.import_portfolio` method with a CSV file.
+    """
+
+    user = user_with_permissions([("property", "property")])
+    property_type = property_type_factory(subscription=user.associated_subscription)
+    file = SimpleUploadedFile(
+        "portfolio.csv",
+        (
+            "property_name,property_address,property_type,unit_type_name,unit_type_bed_rooms,unit_name\n"
+            f"Lakeside,12 Lake Road,{property_type.id},Studio,1,A-1\n"
+            f"Lakeside,12 Lake Road,{property_type.id},Studio,1,A-2\n"
+            f"Hillside,1 Hill Road,{property_type.id},Loft,many,B-1\n"
+        ).encode(),
+        content_type="text/csv",
+    )
+
+    url = reverse("property:property-import-portfolio")
+    request = api_rf.post(url, {"file": file}, format="multipart")
+    request.user = user
+    view = PropertyViewSet.as_view({"post": "import_portfolio"})
+    response = view(request)
+
+    assert response.status_code == 201
+    assert (response.data["properties"], response.data["unit_types"], response.data["units"]) == (1, 1, 2)
+    assert response.data["errors"][0]["rows"] == [4]
+    assert response.data["errors"][0]["name"] == "Hillside"
+    assert Property.objects.get().unit_types.get().units.count() == 2
+
+
 @pytest.mark.django_db
 def test_portfolio_property_list(api_rf, user_with_permissions, property_factory, unit_type_factory, unit_factory):
     """
@@ -387,7 +496,7 @@ def test_portfolio_property_list(api_rf, user_with_permissions, property_factory
     properties = [instance_1.id, instance_2.id]
     index_result = [0]
 
-    with assertNumQueries(6):
+    with assertNumQueries(5):
         url = reverse("property:property-list")
         request = api_rf.get(url, {}, format="json")
         request.user = user
@@ -9,8 +9,8 @@ from property.views import UnitTypeViewSet
 @pytest.mark.parametrize(
     "query_params, index_result, num_queries",
     (
-        ({}, [2, 1, 0], 19),
-        ({"parent_property": True}, [2], 10),
+        ({}, [2, 1, 0], 5),
+        ({"parent_property": True}, [2], 6),
     ),
 )
 @pytest.mark.django_db
@@ -46,6 +46,32 @@ def test_unit_list(
     assert response_ids == [unit_types[i] for i in index_result]
 
 
+@pytest.mark.django_db
+def test_unit_type_list_queries(
+    api_rf, user_with_permissions, unit_type_factory, unit_type_photo_factory, assert_constant_queries
+):
+    """
+    Testing :py:meth:`property.views.UnitTypeViewSet.list` runs a fixed number of queries
+    """
+    user = user_with_permissions([("property", "unittype")])
+
+    def make_request():
+        url = reverse("property:unit_type-list")
+        request = api_rf.get(url, format="json")
+        request.user = user
+        view = UnitTypeViewSet.as_view({"get": "list"})
+        response = view(request)
+        assert response.status_code == 200
+
+    def add_rows():
+        for _ in range(3):
+            unit_type = unit_type_factory(subscription=user.associated_subscription)
+            unit_type_photo_factory(unit_type=unit_type, is_cover=True)
+
+    unit_type_factory(subscription=user.associated_subscription)
+    assert_constant_queries(make_request, add_rows)
+
+
 @pytest.mark.parametrize(
     "data, expected_response, status_code, num_queries, obj_count",
     (
@@ -79,7 +105,7 @@ def test_unit_list(
             },
             None,
             201,
-            10,
+            7,
             1,
         ),
     ),
@@ -119,7 +145,7 @@ def test_unit_type_retrieve(api_rf, unit_type_factory, user_with_permissions):
     user = user_with_permissions([("property", "unittype")])
     unit_type = unit_type_factory(subscription=user.associated_subscription)
 
-    with assertNumQueries(9):
+    with assertNumQueries(5):
         url = reverse("property:unit_type-detail", kwargs={"pk": unit_type.id})
         request = api_rf.get(url, format="json")
         request.user = user
@@ -178,7 +204,7 @@ def test_unit_type_update(api_rf, unit_type_factory, user_with_permissions):
         "parent_property": unit_type.parent_property.id,
     }
 
-    with assertNumQueries(12):
+    with assertNumQueries(9):
         url = reverse("property:unit_type-detail", kwargs={"pk": unit_type.id})
         request = api_rf.patch(url, data, format="json")
         request.user = user
@@ -199,7 +225,7 @@ def test_unit_type_delete(api_rf, unit_type_factory, user_with_permissions):
     user = user_with_permissions([("property", "unittype")])
     unit_type = unit_type_factory(subscription=user.associated_subscription)
 
-    with assertNumQueries(8):
+    with assertNumQueries(9):
         url = reverse("property:unit_type-detail", kwargs={"pk": unit_type.id})
         request = api_rf.delete(url, format="json")
         request.user = user
@@ -9,13 +9,13 @@ from property.views import UnitViewSet
 @pytest.mark.parametrize(
     "query_params, index_result, num_queries",
     (
-        ({}, [2, 1, 0], 26),
-        ({"parent_property": True}, [2], 13),
-        ({"unit_type": True}, [2], 13),
-        ({"is_occupied": True}, [0], 12),
-        ({"search": "John Property"}, [0], 12),
-        ({"search": "2370 Box 4044"}, [1], 12),
-        ({"search": "unt-2"}, [1], 12),
+        ({}, [2, 1, 0], 4),
+        ({"parent_property": True}, [2], 5),
+        ({"unit_type": True}, [2], 5),
+        ({"is_occupied": True}, [0], 4),
+        ({"search": "John Property"}, [0], 4),
+        ({"search": "2370 Box 4044"}, [1], 4),
+        ({"search": "unt-2"}, [1], 4),
     ),
 )
 @pytest.mark.django_db
@@ -93,6 +93,31 @@ def test_unit_list(
     }
 
 
+@pytest.mark.django_db
+def test_unit_list_queries(api_rf, user_with_permissions, unit_factory, lease_factory, assert_constant_queries):
+    """
+    Testing :py:meth:`property.views.UnitViewSet.list` runs a fixed number of queries
+    """
+    user = user_with_permissions([("property", "unit")])
+
+    def make_request():
+        url = reverse("property:unit-list")
+        request = api_rf.get(url, format="json")
+        request.user = user
+        response = UnitViewSet.as_view({"get": "list"})(request)
+        assert response.status_code == 200
+        assert all(unit["lease_start_date"] for unit in response.data)
+
+    def add_rows():
+        for _ in range(3):
+            unit = unit_factory(subscription=user.associated_subscription)
+            lease_factory(unit=unit, status="ACTIVE", rental_application__applicant__unit=unit)
+
+    unit = unit_factory(subscription=user.associated_subscription)
+    lease_factory(unit=unit, status="ACTIVE", rental_application__applicant__unit=unit)
+    assert_constant_queries(make_request, add_rows)
+
+
 @pytest.mark.parametrize(
     "data, expected_response, status_code, num_queries, obj_count",
     (
@@ -131,7 +156,7 @@ def test_unit_list(
             },
             None,
             201,
-            15,
+            12,
             1,
         ),
     ),
@@ -181,7 +206,7 @@ def test_unit_retrieve(api_rf, unit_factory, user_with_permissions):
     user = user_with_permissions([("property", "unit")])
     unit = unit_factory(subscription=user.associated_subscription)
 
-    with assertNumQueries(10):
+    with assertNumQueries(5):
         url = reverse("property:unit-detail", kwargs={"pk": unit.id})
         request = api_rf.get(url, format="json")
         request.user = user
@@ -260,7 +285,7 @@ def test_unit_update(api_rf, unit_factory, user_with_permissions, tag_factory):
         "parent_property": unit.parent_property.id,
     }
 
-    with assertNumQueries(16):
+    with assertNumQueries(11):
         url = reverse("property:unit-detail", kwargs={"pk": unit.id})
         request = api_rf.patch(url, data, format="json")
         request.user = user
@@ -281,7 +306,7 @@ def test_unit_delete(api_rf, unit_factory, user_with_permissions):
     user = user_with_permissions([("property", "unit")])
     unit = unit_factory(subscription=user.associated_subscription)
 
-    with assertNumQueries(20):
+    with assertNumQueries(19):
         url = reverse("property:unit-detail", kwargs={"pk": unit.id})
         request = api_rf.delete(url, format="json")
         request.user = user
@@ -0,0 +1,152 @@
+import csv
+from collections import defaultdict
+from typing import IO, List
+
+from django.db import transaction
+from django.utils import timezone
+
+from accounting.utils import provision_general_ledger_accounts
+from core.utils import chunked
+from dashboard.views import invalidate_stats_snapshots
+from system_preferences.models import PropertyType
+
+from .models import Property, PropertyLateFeePolicy, Unit, UnitType
+from .serializers import PropertyImportSerializer
+
+# Unit fields inherited from the unit type, as done by ``property.models.set_unit_type_info_in_unit``.
+UNIT_TYPE_INFO_FIELDS = (
+    "market_rent",
+    "future_market_rent",
+    "effective_date",
+    "application_fee",
+    "estimate_turn_over_cost",
+)
+
+CSV_COLUMN_PREFIXES = ("unit_type_", "property_", "unit_")
+
+
+def parse_portfolio_csv(file: IO[str]) -> List[dict]:
+    """
+    Groups the rows of a portfolio CSV into properties with their unit types and units. Every row holds one unit,
+    columns are prefixed with ``property_``, ``unit_type_`` or ``unit_`` (the ``property_type`` column holds the id of
+    the property type) and rows with the same property name and
+    address share the property, rows of the property with the same unit type name share the unit type. Rows without
+    a unit name only declare their property and unit type. Empty cells are left out so that the defaults apply.
+    """
+    properties: dict = {}
+    for line_number, row in enumerate(csv.DictReader(file), start=2):
+        data: dict = {"property": {}, "unit_type": {}, "unit": {}}
+        for column, value in row.items():
+            if value in (None, ""):
+                continue
+            if column == "property_type":
+                data["property"]["property_type"] = value
+                continue
+            prefix = next((prefix for prefix in CSV_COLUMN_PREFIXES if column and column.startswith(prefix)), None)
+            if prefix is not None:
+                data[prefix[:-1]][column.removeprefix(prefix)] = value
+
+        property_key = (data["property"].get("name"), data["property"].get("address"))
+        property_data = properties.setdefault(property_key, {**data["property"], "unit_types": {}, "_rows": []})
+        property_data["_rows"].append(line_number)
+        if data["unit_type"]:
+            unit_type_data = property_data["unit_types"].setdefault(
+                data["unit_type"].get("name"), {**data["unit_type"], "units": []}
+            )
+            if data["unit"]:
+                unit_type_data["units"].append(data["unit"])
+
+    return [
+        {**property_data, "unit_types": list(property_data["unit_types"].values())}
+        for property_data in properties.values()
+    ]
+
+
+def create_portfolio_batch(properties_data: List[dict], subscription, user=None, dry_run: bool = False) -> dict:
+    """
+    Inserts validated properties with their late fee policies, unit types, units and the GL accounts of the units
+    with one ``bulk_create`` per model in a single transaction. Units inherit the pricing of their unit type.
+    With ``dry_run`` nothing is written.
+    """
+    today = timezone.now().date()
+    common_fields = {"subscription": subscription, "created_by": user, "modified_by": user}
+    properties = []
+    unit_types = []
+    units = []
+    for property_data in properties_data:
+        property_data = dict(property_data)
+        unit_types_data = property_data.pop("unit_types", [])
+        property_type_id = property_data.pop("property_type")
+        parent_property = Property(**property_data, property_type_id=property_type_id, **common_fields)
+        properties.append(parent_property)
+        for unit_type_data in unit_types_data:
+            unit_type_data = dict(unit_type_data)
+            units_data = unit_type_data.pop("units", [])
+            unit_type = UnitType(**unit_type_data, parent_property=parent_property, **common_fields)
+            unit_types.append(unit_type)
+            for unit_data in units_data:
+                units.append(
+                    Unit(
+                        **unit_data,
+                        **{field: getattr(unit_type, field) for field in UNIT_TYPE_INFO_FIELDS},
+                        unit_type=unit_type,
+                        parent_property=parent_property,
+                        vacant_since=today,
+                        **common_fields,
+                    )
+                )
+
+    if dry_run:
+        return {"properties": len(properties), "unit_types": len(unit_types), "units": len(units)}
+
+    with transaction.atomic():
+        Property.objects.bulk_create(properties)
+        PropertyLateFeePolicy.objects.bulk_create(
+            [
+                PropertyLateFeePolicy(parent_property=parent_property, subscription=subscription)
+                for parent_property in properties
+            ]
+        )
+        UnitType.objects.bulk_create(unit_types)
+        Unit.objects.bulk_create(units)
+        provision_general_ledger_accounts(units)
+
+    return {"properties": len(properties), "unit_types": len(unit_types), "units": len(units)}
+
+
+def import_portfolio(
+    properties_data: List[dict], subscription, user=None, batch_size: int = 100, dry_run: bool = False
+) -> dict:
+    """
+    Validates ``properties_data`` and imports the valid properties with their unit types and units in transactions of
+    ``batch_size`` properties. A property is imported with all its unit types and units or not at all, the errors of
+    the rejected properties are reported with the input rows they come from. With ``dry_run`` nothing is written.
+    """
+    context = {
+        "property_type_ids": set(PropertyType.objects.filter(subscription=subscription).values_list("pk", flat=True))
+    }
+    valid_properties = []
+    errors = []
+    for index, property_data in enumerate(properties_data):
+        rows = property_data.get("_rows", [index]) if isinstance(property_data, dict) else [index]
+        serializer = PropertyImportSerializer(data=property_data, context=context)
+        if serializer.is_valid():
+            valid_properties.append(serializer.validated_data)
+        else:
+            name = property_data.get("name") if isinstance(property_data, dict) else None
+            errors.append({"rows": rows, "name": name, "errors": serializer.errors})
+
+    report: dict = defaultdict(int)
+    for batch in chunked(valid_properties, batch_size):
+        for key, count in create_portfolio_batch(batch, subscription, user, dry_run=dry_run).items():
+            report[key] += count
+
+    if valid_properties and not dry_run:
+        invalidate_stats_snapshots(subscription.pk)
+
+    return {
+        "properties": report["properties"],
+        "unit_types": report["unit_types"],
+        "units": report["units"],
+        "errors": errors,
+    }
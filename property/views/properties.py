@@ -1,6 +1,8 @@
+import io
+
 from django.db.models import Count, F
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import filters, generics, mixins, status, viewsets
+from rest_framework import filters, generics, mixins, serializers, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
@@ -32,6 +34,7 @@ from property.serializers import (
     RentIncreaseSerializer,
 )
 from property.tasks import scheduled_rent_increase
+from property.utils import import_portfolio, parse_portfolio_csv
 
 
 class PropertyViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.ModelViewSet):
@@ -39,13 +42,20 @@ class PropertyViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.Mode
         Property.objects.select_related("property_type")
         .annotate_slug()  # type: ignore[attr-defined]
         .annotate_data()  # type: ignore[attr-defined]
+        .with_cover_photo()
         .order_by("-pk")
     )
     filter_backends = [filters.SearchFilter, filters.OrderingFilter, DjangoFilterBackend]
-    ordering_fields = ["pk", "name", "number_of_units", "owners__owner__first_name"]
+    ordering_fields = ["pk", "name", "number_of_units", "is_occupied", "owners__owner__first_name"]
     search_fields = ["name", "address", "slug", "property_type__name"]
     filterset_class = PropertyFilter
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == "list":
+            queryset = queryset.with_owners()
+        return queryset
+
     def get_serializer_class(self):
         if self.action == "list" or self.action == "vacant_properties":
             return PropertyListSerializer
@@ -90,6 +100,31 @@ class PropertyViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.Mode
 
         return Response(status=status.HTTP_200_OK)
 
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+    )
+    def import_portfolio(self, request, *args, **kwargs):
+        """
+        Bulk import of properties with their unit types and units from a CSV ``file`` or a JSON ``properties`` list
+        """
+        file = request.FILES.get("file")
+        if file is not None:
+            properties_data = parse_portfolio_csv(io.TextIOWrapper(file, encoding="utf-8-sig"))
+        else:
+            properties_data = request.data.get("properties")
+        if not isinstance(properties_data, list):
+            return Response(
+                {"properties": ["Expected a list of properties or a CSV file."]}, status=status.HTTP_400_BAD_REQUEST
+            )
+        dry_run = serializers.BooleanField().to_internal_value(request.data.get("dry_run", False))
+
+        report = import_portfolio(
+            properties_data, request.user.associated_subscription, user=request.user, dry_run=dry_run
+        )
+        return Response(report, status=status.HTTP_200_OK if dry_run else status.HTTP_201_CREATED)
+
 
 class PropertyUpcomingActivityViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.ModelViewSet):
     queryset = PropertyUpcomingActivity.objects.select_related("label", "assign_to", "parent_property").order_by("-pk")
@@ -156,6 +191,7 @@ class PortfolioPropertiesListAPIView(FilterQuerysetByAssociatedSubscriptionMixin
     queryset = (
         Property.objects.annotate_slug()  # type: ignore[attr-defined]
         .annotate_portfolio_data()  # type: ignore[attr-defined]
+        .with_cover_photo()
         .filter(occupied_units_count__lt=Count("units"))
         .distinct()
     )
@@ -14,15 +14,16 @@ from property.serializers import (
 
 class UnitViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.ModelViewSet):
     queryset = (
-        Unit.objects.select_related("unit_type")
-        .prefetch_related("leases", "photos")
+        Unit.objects.select_related("unit_type", "parent_property", "current_lease")
         .annotate_slug()  # type: ignore[attr-defined]
         .annotate_data()  # type: ignore[attr-defined]
+        .with_cover_photo()
         .order_by("-pk")
     )
-    filter_backends = [filters.SearchFilter, DjangoFilterBackend]
+    filter_backends = [filters.SearchFilter, filters.OrderingFilter, DjangoFilterBackend]
     filterset_class = UnitFilter
     search_fields = ["name", "address", "slug"]
+    ordering_fields = ["pk", "name", "occupied_since", "vacant_since"]
 
     def get_serializer_class(self):
         if self.action == "list":
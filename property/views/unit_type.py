@@ -7,7 +7,7 @@ from property.serializers import UnitTypePhotoSerializer, UnitTypeSerializer
 
 
 class UnitTypeViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.ModelViewSet):
-    queryset = UnitType.objects.all().prefetch_related("photos").order_by("-pk")
+    queryset = UnitType.objects.prefetch_related("tags").with_cover_photo().order_by("-pk")
     serializer_class = UnitTypeSerializer
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ["parent_property"]
@@ -42,9 +42,11 @@ INSTALLED_APPS = [
     "communication",
     "system_preferences",
     "subscription",
+    "tenant",
 ]
 
 MIDDLEWARE = [
+    "core.middleware.QueryBudgetMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -55,10 +57,15 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# Maximum number of queries a request may run before a warning is logged, by URL name.
+QUERY_BUDGET_DEFAULT = config("QUERY_BUDGET_DEFAULT", 50, cast=int)
+QUERY_BUDGETS: dict[str, int] = {}
+
 CSRF_TRUSTED_ORIGINS = config("CSRF_TRUSTED_ORIGINS", "").split(",")
 
 CORS_ALLOW_ALL_ORIGINS = config("CORS_ALLOW_ALL_ORIGINS", False, cast=bool)
 CORS_ALLOW_METHODS = ["GET", "POST", "PUT", "PATCH", "DELETE"]
+CORS_EXPOSE_HEADERS = ["X-DB-Query-Count", "X-DB-Time"]
 
 ROOT_URLCONF = "property_management.urls"
 AUTH_USER_MODEL = "authentication.User"
@@ -92,6 +99,8 @@ DATABASES = {
     }
 }
 
+AUTHENTICATION_BACKENDS = ["authentication.backends.CachedModelBackend"]
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -117,6 +126,12 @@ USE_TZ = True
 
 TENANT_GROUP_NAME = "TENANT"
 
+# Seconds the subscription, role flags and current tenant of a user are cached for, see authentication.context.
+USER_CONTEXT_CACHE_TIMEOUT = config("USER_CONTEXT_CACHE_TIMEOUT", 60, cast=int)
+
+# Seconds the home payload of a tenant is cached for, see tenant.views.TenantHomeAPIView.
+TENANT_HOME_CACHE_TIMEOUT = config("TENANT_HOME_CACHE_TIMEOUT", 300, cast=int)
+
 STATIC_URL = "static/"
 STATICFILES_DIRS = [BASE_DIR / "static_in_env"]
 STATIC_ROOT = BASE_DIR / "staticfiles"
@@ -130,11 +145,12 @@ EMAIL_HOST = config("EMAIL_HOST", "")
 EMAIL_HOST_USER = config("EMAIL_HOST_USER", "")
 EMAIL_HOST_PASSWORD = config("EMAIL_HOST_PASSWORD", "")
 EMAIL_PORT = config("EMAIL_PORT", "")
+EMAIL_RECIPIENTS_BATCH_SIZE = config("EMAIL_RECIPIENTS_BATCH_SIZE", 50, cast=int)
 DEFAULT_FROM_EMAIL = "Admin from Property Management System <admin@meganoslabs.com>"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "authentication.backends.CachedJWTAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": [
@@ -148,6 +164,9 @@ SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(days=2),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
 }
+# Number of users kept in memory per process by authentication.backends.CachedJWTAuthentication, and for how long.
+JWT_USER_CACHE_SIZE = config("JWT_USER_CACHE_SIZE", 1000, cast=int)
+JWT_USER_CACHE_TIMEOUT = config("JWT_USER_CACHE_TIMEOUT", 60, cast=int)
 
 DJOSER = {
     "SERIALIZERS": {
@@ -10,4 +10,5 @@ cur_dir="$( cd "$( dirname "${BASH_SOURCE[0]}" )" && pwd )"
 # python /app/manage.py compilemessages
 python ./manage.py migrate
 env DJANGO_DISABLE_SIGNALS=True python ./manage.py loaddata fixtures/groups-and-permissions.json fixtures/dev-environment-and-tests.json
+python ./manage.py reconcile_general_ledger_accounts
 python ./manage.py runserver 0.0.0.0:8000
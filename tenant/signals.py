@@ -0,0 +1,48 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from communication.models import Announcement
+
+from .utils import invalidate_tenant_homes
+
+
+@receiver(post_save, sender="lease.Lease")
+@receiver(post_delete, sender="lease.Lease")
+@receiver(post_save, sender="accounting.Invoice")
+@receiver(post_delete, sender="accounting.Invoice")
+@receiver(post_save, sender="accounting.Charge")
+@receiver(post_delete, sender="accounting.Charge")
+@receiver(post_save, sender="maintenance.ServiceRequest")
+@receiver(post_delete, sender="maintenance.ServiceRequest")
+def invalidate_unit_tenant_homes(sender, instance, **kwargs):
+    invalidate_tenant_homes([instance.unit_id])
+
+
+@receiver(post_save, sender="maintenance.WorkOrder")
+@receiver(post_delete, sender="maintenance.WorkOrder")
+def invalidate_work_order_tenant_homes(sender, instance, **kwargs):
+    # The status of a service request is derived from its work orders.
+    if instance.service_request_id:
+        from maintenance.models import ServiceRequest
+
+        invalidate_tenant_homes(
+            ServiceRequest.objects.filter(pk=instance.service_request_id).values_list("unit_id", flat=True)
+        )
+
+
+@receiver(post_save, sender=Announcement)
+@receiver(pre_delete, sender=Announcement)
+def invalidate_announcement_tenant_homes(sender, instance, created=False, **kwargs):
+    # The units of a new announcement are set afterwards and invalidate the homes themselves.
+    if not created:
+        invalidate_tenant_homes(instance.units.values_list("pk", flat=True))
+
+
+@receiver(m2m_changed, sender=Announcement.units.through)
+def invalidate_announcement_units_tenant_homes(sender, instance, action, pk_set, **kwargs):
+    if not isinstance(instance, Announcement):
+        invalidate_tenant_homes([instance.pk])
+    elif action == "pre_clear":
+        invalidate_tenant_homes(instance.units.values_list("pk", flat=True))
+    elif action in ("post_add", "post_remove"):
+        invalidate_tenant_homes(pk_set)
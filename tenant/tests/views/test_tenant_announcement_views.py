@@ -7,7 +7,7 @@ from tenant.views import AnnouncementViewSet
 
 @pytest.mark.parametrize(
     "query_params, index_result, num_queries",
-    (({}, [2, 1, 0], 16),),
+    (({}, [2, 1, 0], 7),),
 )
 @pytest.mark.django_db
 def test_announcement_list(
@@ -47,7 +47,7 @@ def test_announcement_retrieve(api_rf, announcement_factory, tenant_user_with_pe
     user, lease = tenant_user_with_permissions([("communication", "announcement")])
     announcement = announcement_factory(subscription=user.associated_subscription, units=(lease.unit,))
 
-    with assertNumQueries(16):
+    with assertNumQueries(7):
         url = reverse("tenant:announcement-detail", kwargs={"pk": announcement.id})
         request = api_rf.get(url, format="json")
         request.user = user
@@ -8,21 +8,21 @@ from tenant.views import ChargeViewSet
 @pytest.mark.parametrize(
     "query_params, index_result, num_queries",
     (
-        ({}, [2, 1, 0], 10),
-        ({"ordering": "created_at"}, [0, 1, 2], 10),
-        ({"ordering": "-created_at"}, [2, 1, 0], 10),
-        ({"ordering": "title"}, [1, 2, 0], 10),
-        ({"ordering": "-title"}, [0, 2, 1], 10),
-        ({"ordering": "amount"}, [2, 0, 1], 10),
-        ({"ordering": "-amount"}, [1, 0, 2], 10),
-        ({"ordering": "status"}, [2, 0, 1], 10),
-        ({"ordering": "-status"}, [1, 0, 2], 10),
-        ({"status": "VERIFIED"}, [1], 10),
-        ({"invoice": 0}, [0], 11),
-        ({"parent_property": 0}, [2, 1, 0], 11),
-        ({"unit": 0}, [2, 1, 0], 11),
-        ({"created_at__gte": "2023-01-02"}, [2, 1], 10),
-        ({"created_at__lte": "2023-01-04"}, [1, 0], 10),
+        ({}, [2, 1, 0], 5),
+        ({"ordering": "created_at"}, [0, 1, 2], 5),
+        ({"ordering": "-created_at"}, [2, 1, 0], 5),
+        ({"ordering": "title"}, [1, 2, 0], 5),
+        ({"ordering": "-title"}, [0, 2, 1], 5),
+        ({"ordering": "amount"}, [2, 0, 1], 5),
+        ({"ordering": "-amount"}, [1, 0, 2], 5),
+        ({"ordering": "status"}, [2, 0, 1], 5),
+        ({"ordering": "-status"}, [1, 0, 2], 5),
+        ({"status": "VERIFIED"}, [1], 5),
+        ({"invoice": 0}, [0], 6),
+        ({"parent_property": 0}, [2, 1, 0], 6),
+        ({"unit": 0}, [2, 1, 0], 6),
+        ({"created_at__gte": "2023-01-02"}, [2, 1], 5),
+        ({"created_at__lte": "2023-01-04"}, [1, 0], 5),
     ),
 )
 @pytest.mark.django_db
@@ -109,7 +109,7 @@ def test_charge_retrieve(api_rf, charge_factory, tenant_user_with_permissions):
     user, lease = tenant_user_with_permissions([("accounting", "charge")])
     charge = charge_factory(subscription=user.associated_subscription, tenant=lease.primary_tenant)
 
-    with assertNumQueries(10):
+    with assertNumQueries(5):
         url = reverse("tenant:charge-detail", kwargs={"pk": charge.id})
         request = api_rf.get(url, format="json")
         request.user = user
@@ -8,10 +8,10 @@ from tenant.views import ContactViewSet
 @pytest.mark.parametrize(
     "query_params, index_result, num_queries",
     (
-        ({}, [2, 1, 0], 9),
-        ({"search": "john"}, [0], 7),
-        ({"search": "paul"}, [1], 7),
-        ({"search": "5995"}, [2], 7),
+        ({}, [2, 1, 0], 8),
+        ({"search": "john"}, [0], 6),
+        ({"search": "paul"}, [1], 6),
+        ({"search": "5995"}, [2], 6),
     ),
 )
 @pytest.mark.django_db
@@ -68,7 +68,7 @@ def test_contact_retrieve(api_rf, contact_factory, tenant_user_with_permissions)
     user, _ = tenant_user_with_permissions([("communication", "contact")])
     contact = contact_factory(subscription=user.associated_subscription, display_to_tenants=True)
 
-    with assertNumQueries(7):
+    with assertNumQueries(6):
         url = reverse("tenant:contact-detail", kwargs={"pk": contact.id})
         request = api_rf.get(url, format="json")
         request.user = user
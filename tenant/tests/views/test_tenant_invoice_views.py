@@ -1,25 +1,27 @@
 from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
 
 import pytest
 from django.urls import reverse
 from pytest_django.asserts import assertNumQueries
 
-from accounting.models import Invoice
-from tenant.views import InvoiceViewSet
+from accounting.models import Invoice, InvoicePaymentEvent
+from tenant.views import InvoiceViewSet, invoice_payment_succeeded
 
 
 @pytest.mark.parametrize(
     "query_params, index_result, num_queries",
     (
-        ({}, [2, 1, 0], 20),
-        ({"ordering": "due_date"}, [0, 2, 1], 20),
-        ({"ordering": "-due_date"}, [1, 2, 0], 20),
-        ({"ordering": "rent_amount"}, [2, 0, 1], 20),
-        ({"ordering": "-rent_amount"}, [1, 0, 2], 20),
-        ({"due_date": "2021-01-03"}, [1], 16),
-        ({"arrear_of": 1}, [1], 17),
-        ({"created_at__gte": "2023-01-02"}, [2, 1], 18),
-        ({"created_at__lte": "2023-01-04"}, [1, 0], 18),
+        ({}, [2, 1, 0], 11),
+        ({"ordering": "due_date"}, [0, 2, 1], 11),
+        ({"ordering": "-due_date"}, [1, 2, 0], 11),
+        ({"ordering": "rent_amount"}, [2, 0, 1], 11),
+        ({"ordering": "-rent_amount"}, [1, 0, 2], 11),
+        ({"due_date": "2021-01-03"}, [1], 7),
+        ({"arrear_of": 1}, [1], 8),
+        ({"created_at__gte": "2023-01-02"}, [2, 1], 9),
+        ({"created_at__lte": "2023-01-04"}, [1, 0], 9),
     ),
 )
 @pytest.mark.django_db
@@ -85,7 +87,7 @@ def test_invoice_retrieve(api_rf, invoice_factory, tenant_user_with_permissions)
     user, lease = tenant_user_with_permissions([("accounting", "invoice")])
     invoice = invoice_factory(lease=lease, subscription=user.associated_subscription, unit=lease.unit)
 
-    with assertNumQueries(16):
+    with assertNumQueries(7):
         url = reverse("tenant:invoice-detail", kwargs={"pk": invoice.id})
         request = api_rf.get(url, format="json")
         request.user = user
@@ -140,7 +142,7 @@ def test_invoice_mark_as_paid(api_rf, invoice_factory, tenant_user_with_permissi
     lease.unit.parent_property.late_fee_policy.save()
     invoice = invoice_factory(lease=lease, subscription=user.associated_subscription, unit=lease.unit)
 
-    with assertNumQueries(16):
+    with assertNumQueries(8):
         url = reverse("tenant:invoice-mark-as-paid", kwargs={"pk": invoice.id})
         request = api_rf.get(url, format="json")
         request.user = user
@@ -149,3 +151,26 @@ def test_invoice_mark_as_paid(api_rf, invoice_factory, tenant_user_with_permissi
 
     assert response.status_code == 200
     assert Invoice.objects.get().status == "NOT_VERIFIED"
+
+
+@pytest.mark.django_db
+def test_invoice_payment_succeeded(invoice_factory, django_capture_on_commit_callbacks):
+    """
+    Testing :py:func:`tenant.views.invoice_payment_succeeded` webhook handler.
+    """
+
+    invoice = invoice_factory()
+    event = SimpleNamespace(
+        data={"object": {"id": "pi_1", "amount_received": 12050, "metadata": {"invoice_id": str(invoice.id)}}}
+    )
+
+    with django_capture_on_commit_callbacks() as callbacks, assertNumQueries(2):
+        invoice_payment_succeeded(event=event)
+        invoice_payment_succeeded(event=event)
+
+    assert len(callbacks) == 2
+    payment_event = InvoicePaymentEvent.objects.get()
+    assert payment_event.idempotency_key == f"{invoice.id}:pi_1"
+    assert payment_event.amount == Decimal("120.50")
+    assert payment_event.status == "PENDING"
+    assert Invoice.objects.get().status == "UNPAID"
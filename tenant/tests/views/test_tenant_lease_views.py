@@ -7,7 +7,7 @@ from tenant.views import LeaseViewSet
 
 @pytest.mark.parametrize(
     "query_params, index_result, num_queries",
-    (({}, [0], 16),),
+    (({}, [0], 10),),
 )
 @pytest.mark.django_db
 def test_lease_list(api_rf, tenant_user_with_permissions, query_params, index_result, num_queries):
@@ -39,7 +39,7 @@ def test_lease_retrieve(api_rf, tenant_user_with_permissions):
 
     user, lease = tenant_user_with_permissions([("lease", "lease")])
 
-    with assertNumQueries(16):
+    with assertNumQueries(10):
         url = reverse("tenant:lease-detail", kwargs={"pk": lease.id})
         request = api_rf.get(url, format="json")
         request.user = user
@@ -9,18 +9,18 @@ from tenant.views import PaymentViewSet
 @pytest.mark.parametrize(
     "query_params, index_result, num_queries",
     (
-        ({}, [2, 1, 0], 11),
-        ({"payment_date__lte": "2021-07-01"}, [1, 0], 11),
-        ({"payment_date__gte": "2021-05-01"}, [2, 1], 11),
-        ({"invoice__status": "VERIFIED"}, [2], 11),
-        ({"search": "John"}, [2, 0], 11),
-        ({"search": "300"}, [2], 11),
-        ({"ordering": "payment_date"}, [0, 1, 2], 11),
-        ({"ordering": "-payment_date"}, [2, 1, 0], 11),
-        ({"ordering": "amount"}, [0, 1, 2], 11),
-        ({"ordering": "-amount"}, [2, 1, 0], 11),
-        ({"ordering": "invoice__status"}, [0, 1, 2], 11),
-        ({"ordering": "-invoice__status"}, [2, 1, 0], 11),
+        ({}, [2, 1, 0], 7),
+        ({"payment_date__lte": "2021-07-01"}, [1, 0], 7),
+        ({"payment_date__gte": "2021-05-01"}, [2, 1], 7),
+        ({"invoice__status": "VERIFIED"}, [2], 7),
+        ({"search": "John"}, [2, 0], 7),
+        ({"search": "300"}, [2], 7),
+        ({"ordering": "payment_date"}, [0, 1, 2], 7),
+        ({"ordering": "-payment_date"}, [2, 1, 0], 7),
+        ({"ordering": "amount"}, [0, 1, 2], 7),
+        ({"ordering": "-amount"}, [2, 1, 0], 7),
+        ({"ordering": "invoice__status"}, [0, 1, 2], 7),
+        ({"ordering": "-invoice__status"}, [2, 1, 0], 7),
     ),
 )
 @pytest.mark.django_db
@@ -99,7 +99,7 @@ def test_payment_list(
                 "payment_date": ["This field is required."],
             },
             400,
-            5,
+            4,
             0,
         ),
         (
@@ -113,7 +113,7 @@ def test_payment_list(
             },
             None,
             201,
-            9,
+            8,
             1,
         ),
     ),
@@ -164,7 +164,7 @@ def test_payment_retrieve(api_rf, payment_factory, tenant_user_with_permissions)
     user, lease = tenant_user_with_permissions([("accounting", "payment")])
     payment = payment_factory(subscription=user.associated_subscription, invoice__lease=lease)
 
-    with assertNumQueries(11):
+    with assertNumQueries(7):
         url = reverse("tenant:payment-detail", kwargs={"pk": payment.id})
         request = api_rf.get(url, format="json")
         request.user = user
@@ -207,7 +207,7 @@ def test_payment_update(api_rf, payment_factory, tenant_factory, unit_factory, t
         "account": payment.account.id,
     }
 
-    with assertNumQueries(15):
+    with assertNumQueries(11):
         url = reverse("tenant:payment-detail", kwargs={"pk": payment.id})
         request = api_rf.patch(url, data, format="json")
         request.user = user
@@ -9,18 +9,18 @@ from tenant.views import ServiceRequestViewSet
 @pytest.mark.parametrize(
     "query_params, index_result, num_queries",
     (
-        ({}, [2, 1, 0], 17),
-        ({"search": "srq-1"}, [0], 15),
-        ({"search": "success thus yourself treatment"}, [1], 15),
-        ({"search": "newspaper matter score wide"}, [0], 15),
-        ({"ordering": "description"}, [0, 1, 2], 17),
-        ({"ordering": "-description"}, [2, 1, 0], 17),
-        ({"ordering": "subject"}, [0, 2, 1], 17),
-        ({"ordering": "-subject"}, [1, 2, 0], 17),
-        ({"priority": "URGENT"}, [1], 15),
-        ({"order_type": "RESIDENT"}, [2], 15),
-        ({"work_order_status": "OPEN"}, [2], 15),
-        ({"status": "COMPLETED"}, [1], 15),
+        ({}, [2, 1, 0], 6),
+        ({"search": "srq-1"}, [0], 6),
+        ({"search": "success thus yourself treatment"}, [1], 6),
+        ({"search": "newspaper matter score wide"}, [0], 6),
+        ({"ordering": "description"}, [0, 1, 2], 6),
+        ({"ordering": "-description"}, [2, 1, 0], 6),
+        ({"ordering": "subject"}, [0, 2, 1], 6),
+        ({"ordering": "-subject"}, [1, 2, 0], 6),
+        ({"priority": "URGENT"}, [1], 6),
+        ({"order_type": "RESIDENT"}, [2], 6),
+        ({"work_order_status": "OPEN"}, [2], 6),
+        ({"status": "COMPLETED"}, [1], 6),
     ),
 )
 @pytest.mark.django_db
@@ -96,7 +96,7 @@ def test_service_request_list(
                 "description": ["This field is required."],
             },
             400,
-            9,
+            4,
             0,
         ),
         (
@@ -110,7 +110,7 @@ def test_service_request_list(
             },
             None,
             201,
-            12,
+            8,
             1,
         ),
     ),
@@ -149,7 +149,7 @@ def test_service_request_retrieve(api_rf, service_request_factory, tenant_user_w
     user, lease = tenant_user_with_permissions([("maintenance", "servicerequest")])
     service_request = service_request_factory(subscription=user.associated_subscription, unit=lease.unit)
 
-    with assertNumQueries(15):
+    with assertNumQueries(6):
         url = reverse("tenant:service_requests-detail", kwargs={"pk": service_request.id})
         request = api_rf.get(url, format="json")
         request.user = user
@@ -198,7 +198,7 @@ def test_service_request_update(api_rf, tenant_user_with_permissions, service_re
         "description": "Read line shake short term.",
     }
 
-    with assertNumQueries(17):
+    with assertNumQueries(10):
         url = reverse("tenant:service_requests-detail", kwargs={"pk": service_request.id})
         request = api_rf.patch(url, data, format="json")
         request.user = user
@@ -219,7 +219,7 @@ def test_service_request_delete(api_rf, service_request_factory, tenant_user_wit
     user, lease = tenant_user_with_permissions([("maintenance", "servicerequest")])
     service_request = service_request_factory(subscription=user.associated_subscription, unit=lease.unit)
 
-    with assertNumQueries(17):
+    with assertNumQueries(9):
         url = reverse("tenant:service_requests-detail", kwargs={"pk": service_request.id})
         request = api_rf.delete(url, format="json")
         request.user = user
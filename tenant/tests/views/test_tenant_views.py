@@ -1,8 +1,12 @@
+from datetime import timedelta
+
 import pytest
+from django.core.cache import cache
 from django.urls import reverse
+from django.utils import timezone
 from pytest_django.asserts import assertNumQueries
 
-from tenant.views import TenantRetrieveAPIView
+from tenant.views import TenantHomeAPIView, TenantRetrieveAPIView
 
 
 @pytest.mark.django_db
@@ -13,7 +17,7 @@ def test_tenant_retrieve(api_rf, tenant_user_with_permissions):
 
     user, _ = tenant_user_with_permissions([("people", "tenant")])
 
-    with assertNumQueries(9):
+    with assertNumQueries(6):
         url = reverse("tenant:tenant-retrieve")
         request = api_rf.get(url, format="json")
         request.user = user
@@ -37,3 +41,67 @@ def test_tenant_retrieve(api_rf, tenant_user_with_permissions):
         "unit_id",
         "rental_application_id",
     }
+
+
+@pytest.mark.django_db
+def test_tenant_home(
+    api_rf,
+    tenant_user_with_permissions,
+    invoice_factory,
+    charge_factory,
+    service_request_factory,
+    announcement_factory,
+):
+    """
+    Testing :py:meth:`tenant.views.TenantHomeAPIView.get` method.
+    """
+
+    cache.clear()
+    user, lease = tenant_user_with_permissions([])
+    today = timezone.now().date()
+    invoice = invoice_factory(lease=lease, unit=lease.unit, subscription=user.associated_subscription)
+    invoice_factory(lease=lease, unit=lease.unit, subscription=user.associated_subscription, status="VERIFIED")
+    charge_factory(tenant=lease.primary_tenant, unit=lease.unit, charge_type="ONE_TIME", status="UNPAID")
+    charge_factory(tenant=lease.primary_tenant, unit=lease.unit, charge_type="ONE_TIME", status="VERIFIED")
+    service_request_factory(unit=lease.unit, subscription=user.associated_subscription)
+    announcement_factory(
+        units=[lease.unit],
+        display_on_tenant_portal=True,
+        display_date=today,
+        expiry_date=today + timedelta(days=1),
+    )
+    announcement_factory(units=[lease.unit], display_on_tenant_portal=False)
+
+    def get_home(query_params=None):
+        url = reverse("tenant:tenant-home")
+        request = api_rf.get(url, query_params, format="json")
+        request.user = user
+        return TenantHomeAPIView.as_view()(request)
+
+    with assertNumQueries(17):
+        response = get_home()
+
+    assert response.status_code == 200
+    assert response.data.keys() == {
+        "lease",
+        "open_invoice",
+        "unpaid_charges",
+        "open_service_requests",
+        "announcements",
+    }
+    assert response.data["lease"]["id"] == lease.id
+    assert response.data["open_invoice"]["id"] == invoice.id
+    assert len(response.data["unpaid_charges"]) == 1
+    assert len(response.data["open_service_requests"]) == 1
+    assert len(response.data["announcements"]) == 1
+
+    with assertNumQueries(0):
+        response = get_home({"fields": "open_invoice,unpaid_charges"})
+
+    assert response.data.keys() == {"open_invoice", "unpaid_charges"}
+
+    invoice.status = "VERIFIED"
+    invoice.save()
+    response = get_home({"fields": "open_invoice"})
+
+    assert response.data == {"open_invoice": None}
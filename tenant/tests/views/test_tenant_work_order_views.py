@@ -7,7 +7,7 @@ from tenant.views import WorkOrderViewSet
 
 @pytest.mark.parametrize(
     "query_params, index_result, num_queries",
-    (({}, [2, 1, 0], 20),),
+    (({}, [2, 1, 0], 11),),
 )
 @pytest.mark.django_db
 def test_work_order_list(
@@ -64,7 +64,7 @@ def test_work_order_retrieve(api_rf, work_order_factory, service_request_factory
     service_request = service_request_factory(unit=lease.unit)
     work_order = work_order_factory(service_request=service_request, subscription=user.associated_subscription)
 
-    with assertNumQueries(16):
+    with assertNumQueries(7):
         url = reverse("tenant:work_orders-detail", kwargs={"pk": work_order.id})
         request = api_rf.get(url, format="json")
         request.user = user
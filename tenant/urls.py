@@ -11,6 +11,7 @@ from .views import (
     PaymentIntentForInvoiceCreateAPIView,
     PaymentViewSet,
     ServiceRequestViewSet,
+    TenantHomeAPIView,
     TenantRetrieveAPIView,
     WorkOrderViewSet,
 )
@@ -41,6 +42,11 @@ urlpatterns += [
         TenantRetrieveAPIView.as_view(),
         name="tenant-retrieve",
     ),
+    path(
+        "home/",
+        TenantHomeAPIView.as_view(),
+        name="tenant-home",
+    ),
 ]
 
 if settings.DEBUG:
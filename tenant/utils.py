@@ -0,0 +1,8 @@
+from django.core.cache import cache
+
+# Home payloads of the tenants of a unit, by tenant id and section, see ``tenant.views.TenantHomeAPIView``.
+TENANT_HOME_CACHE_KEY = "tenant-home:{unit_id}"
+
+
+def invalidate_tenant_homes(unit_ids):
+    cache.delete_many([TENANT_HOME_CACHE_KEY.format(unit_id=unit_id) for unit_id in set(unit_ids) if unit_id])
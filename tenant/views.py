@@ -1,4 +1,9 @@
+from decimal import Decimal
+
 import stripe
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models import Prefetch
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
@@ -6,12 +11,15 @@ from djstripe.event_handlers import djstripe_receiver  # type: ignore[import-unt
 from djstripe.models import PaymentIntent  # type: ignore[import-untyped]
 from rest_framework import filters, generics, permissions, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 from rest_framework.settings import api_settings
 
 from accounting.filters import ChargeFilter, InvoiceFilter
-from accounting.models import Charge, Invoice, Payment, PaymentStatusChoices
+from accounting.models import Charge, Invoice, InvoicePaymentEvent, Payment, PaymentStatusChoices
 from accounting.serializers import ChargeSerializer, InvoiceSerializer, PaymentSerializer
+from accounting.tasks import settle_invoice_payments_task
+from authentication.context import get_user_context
 from communication.models import Announcement, Contact
 from communication.serializers import AnnouncementSerializer, ContactSerializer
 from core.mixins import FilterQuerysetByAssociatedSubscriptionMixin
@@ -22,9 +30,12 @@ from maintenance.models import ServiceRequest, WorkOrder
 from maintenance.serializers import ServiceRequestSerializer, WorkOrderSerializer
 from people.models import Tenant
 from people.serializers import TenantSerializer
+from property.managers import cover_photo_prefetch
+from property.models import UnitPhoto
 
 from .permissions import IsTenantAndActivePermission
 from .serializers import PaymentIntentForInvoiceSerializer
+from .utils import TENANT_HOME_CACHE_KEY
 
 tenant_permissions = [*api_settings.DEFAULT_PERMISSION_CLASSES, IsTenantAndActivePermission]
 
@@ -41,18 +52,19 @@ class WorkOrderViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.Rea
 
     def get_queryset(self):
         qs = super().get_queryset()
-        if self.request.user.tenants.exists():
-            tenant = self.request.user.tenants.latest("created_at")
-            return qs.filter(
-                service_request_id__in=tenant.lease.unit.service_requests.values_list("id", flat=True)
-            ).order_by("-pk")
+        user_context = get_user_context(self.request)
+        if user_context.tenant_id is not None:
+            return qs.filter(service_request__unit_id=user_context.unit_id).order_by("-pk")
         else:
             return qs.none()
 
 
 class ServiceRequestViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.ModelViewSet):
     queryset = (
-        ServiceRequest.objects.annotate_slug().annotate_data().select_related("unit")  # type: ignore[attr-defined]
+        ServiceRequest.objects.annotate_slug()  # type: ignore[attr-defined]
+        .annotate_data()
+        .select_related("unit__parent_property")
+        .prefetch_related(cover_photo_prefetch("unit__photos", UnitPhoto))
     )
     serializer_class = ServiceRequestSerializer
     permission_classes = tenant_permissions  # type: ignore[assignment]
@@ -63,23 +75,25 @@ class ServiceRequestViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewset
 
     def get_queryset(self):
         qs = super().get_queryset()
-        if self.request.user.tenants.exists():
-            tenant = self.request.user.tenants.latest("created_at")
-            return qs.filter(unit=tenant.lease.unit).order_by("-pk")
+        user_context = get_user_context(self.request)
+        if user_context.tenant_id is not None:
+            return qs.filter(unit_id=user_context.unit_id).order_by("-pk")
         else:
             return qs.none()
 
 
 class LeaseViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.ReadOnlyModelViewSet):
-    queryset = Lease.objects.prefetch_related("primary_tenant", "rental_application", "unit")
+    queryset = Lease.objects.annotate_owner_names().prefetch_related(
+        "primary_tenant", "rental_application__applicant", "unit__parent_property"
+    )
     serializer_class = LeaseSerializer
     permission_classes = tenant_permissions  # type: ignore[assignment]
 
     def get_queryset(self):
         qs = super().get_queryset()
-        if self.request.user.tenants.exists():
-            tenant = self.request.user.tenants.latest("created_at")
-            return qs.filter(primary_tenant=tenant, status="ACTIVE").order_by("-pk")
+        user_context = get_user_context(self.request)
+        if user_context.tenant_id is not None:
+            return qs.filter(primary_tenant=user_context.tenant_id, status="ACTIVE").order_by("-pk")
         else:
             return qs.none()
 
@@ -91,9 +105,9 @@ class AnnouncementViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.
 
     def get_queryset(self):
         qs = super().get_queryset()
-        if self.request.user.tenants.exists():
-            tenant = self.request.user.tenants.latest("created_at")
-            return qs.filter(units=tenant.lease.unit).order_by("-pk")
+        user_context = get_user_context(self.request)
+        if user_context.tenant_id is not None:
+            return qs.filter(units=user_context.unit_id).order_by("-pk")
         else:
             return qs.none()
 
@@ -112,9 +126,9 @@ class ChargeViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.ReadOn
 
     def get_queryset(self):
         qs = super().get_queryset()
-        if self.request.user.tenants.exists():
-            tenant = self.request.user.tenants.latest("created_at")
-            return qs.filter(tenant=tenant).order_by("-pk")
+        user_context = get_user_context(self.request)
+        if user_context.tenant_id is not None:
+            return qs.filter(tenant_id=user_context.tenant_id).order_by("-pk")
         else:
             return qs.none()
 
@@ -134,9 +148,9 @@ class InvoiceViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.ReadO
 
     def get_queryset(self):
         qs = super().get_queryset()
-        if self.request.user.tenants.exists():
-            tenant = self.request.user.tenants.latest("created_at")
-            return qs.filter(unit=tenant.lease.unit, lease=tenant.lease).order_by("-pk")
+        user_context = get_user_context(self.request)
+        if user_context.tenant_id is not None:
+            return qs.filter(unit_id=user_context.unit_id, lease_id=user_context.lease_id).order_by("-pk")
         else:
             return qs.none()
 
@@ -178,9 +192,9 @@ class PaymentViewSet(FilterQuerysetByAssociatedSubscriptionMixin, viewsets.Model
 
     def get_queryset(self):
         qs = super().get_queryset()
-        if self.request.user.tenants.exists():
-            tenant = self.request.user.tenants.latest("created_at")
-            return qs.filter(invoice__lease=tenant.lease).order_by("-pk")
+        user_context = get_user_context(self.request)
+        if user_context.tenant_id is not None:
+            return qs.filter(invoice__lease_id=user_context.lease_id).order_by("-pk")
         else:
             return qs.none()
 
@@ -193,7 +207,6 @@ class PaymentIntentForInvoiceCreateAPIView(FilterQuerysetByAssociatedSubscriptio
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         invoice = serializer.validated_data["invoice"]
-        invoice = Invoice.objects.annotate_data().get(pk=invoice.pk)
         customer_id = request.user.stripe_customer.id if request.user.stripe_customer else None
         intent = stripe.PaymentIntent.create(
             customer=customer_id,
@@ -216,9 +229,9 @@ class TenantRetrieveAPIView(generics.RetrieveAPIView):
 
     def get_queryset(self):
         qs = super().get_queryset()
-        if self.request.user.tenants.exists():
-            tenant = self.request.user.tenants.latest("created_at")
-            return qs.get(pk=tenant.pk)
+        user_context = get_user_context(self.request)
+        if user_context.tenant_id is not None:
+            return qs.get(pk=user_context.tenant_id)
         else:
             return qs.none()
 
@@ -226,19 +239,90 @@ class TenantRetrieveAPIView(generics.RetrieveAPIView):
         return self.get_queryset() or None
 
 
+class TenantHomeAPIView(generics.GenericAPIView):
+    """
+    Home of the tenant app in a single request: the current lease, the open invoice, the unpaid charges, the open
+    service requests and the active announcements of the tenant, each section in a fixed number of queries.
+    ``?fields=lease,open_invoice`` limits the payload to some sections. The sections are cached per tenant for
+    ``TENANT_HOME_CACHE_TIMEOUT`` seconds and invalidated by ``tenant.signals``.
+    """
+
+    permission_classes = [IsTenantAndActivePermission, permissions.IsAuthenticated]
+    sections = ("lease", "open_invoice", "unpaid_charges", "open_service_requests", "announcements")
+
+    def get_lease(self, user_context):
+        lease = LeaseViewSet.queryset.filter(pk=user_context.lease_id).first()
+        return LeaseSerializer(lease, context=self.get_serializer_context()).data if lease else None
+
+    def get_open_invoice(self, user_context):
+        invoice = (
+            InvoiceViewSet.queryset.filter(
+                lease_id=user_context.lease_id,
+                unit_id=user_context.unit_id,
+                status__in=[PaymentStatusChoices.UNPAID, PaymentStatusChoices.REJECTED],
+            )
+            .order_by("-pk")
+            .first()
+        )
+        return InvoiceSerializer(invoice, context=self.get_serializer_context()).data if invoice else None
+
+    def get_unpaid_charges(self, user_context):
+        charges = ChargeViewSet.queryset.filter(
+            tenant_id=user_context.tenant_id, status__in=[PaymentStatusChoices.UNPAID, PaymentStatusChoices.REJECTED]
+        )
+        return ChargeSerializer(charges, many=True, context=self.get_serializer_context()).data
+
+    def get_open_service_requests(self, user_context):
+        service_requests = (
+            ServiceRequestViewSet.queryset.filter(unit_id=user_context.unit_id)
+            .exclude(status=WorkOrder.StatusChoices.COMPLETED)
+            .order_by("-pk")
+        )
+        return ServiceRequestSerializer(service_requests, many=True, context=self.get_serializer_context()).data
+
+    def get_announcements(self, user_context):
+        today = timezone.now().date()
+        announcements = AnnouncementViewSet.queryset.filter(
+            units=user_context.unit_id, display_on_tenant_portal=True, display_date__lte=today, expiry_date__gte=today
+        ).order_by("-pk")
+        return AnnouncementSerializer(announcements, many=True, context=self.get_serializer_context()).data
+
+    def get(self, request, *args, **kwargs):
+        user_context = get_user_context(request)
+        if user_context.tenant_id is None:
+            raise NotFound()
+        fields = request.query_params.get("fields")
+        sections = [section for section in fields.split(",") if section in self.sections] if fields else self.sections
+
+        cache_key = TENANT_HOME_CACHE_KEY.format(unit_id=user_context.unit_id)
+        unit_homes = cache.get(cache_key) or {}
+        home = unit_homes.get(user_context.tenant_id, {})
+        missing_sections = [section for section in sections if section not in home]
+        if missing_sections:
+            home = {**home, **{section: getattr(self, f"get_{section}")(user_context) for section in missing_sections}}
+            unit_homes[user_context.tenant_id] = home
+            cache.set(cache_key, unit_homes, settings.TENANT_HOME_CACHE_TIMEOUT)
+
+        return Response({section: home[section] for section in sections})
+
+
 @djstripe_receiver("payment_intent.succeeded")
 def invoice_payment_succeeded(event, **kwargs):
-    metadata = event.data["object"]["metadata"]
-    invoice = Invoice.objects.annotate_data().get(pk=metadata["invoice_id"])
-    invoice.status = PaymentStatusChoices.PAID_VERIFIED
-    invoice.payed_at = timezone.now().date()
-    if invoice.payable_late_fee > 0:
-        invoice.payed_late_fee = invoice.payable_late_fee
-    else:
-        invoice.payed_late_fee = 0
-    invoice.payed_late_fee = invoice.payable_late_fee
-    invoice.total_paid_amount = invoice.payable_amount
-    invoice.save()
-    invoice.charges.update(status=PaymentStatusChoices.PAID_VERIFIED)
-
-    return Response(status=200)
+    """
+    Stores the payment of the invoice and acknowledges the webhook right away, the invoice is settled by
+    :py:func:`accounting.tasks.settle_invoice_payments_task`.
+    """
+    payment_intent = event.data["object"]
+    invoice_id = payment_intent["metadata"]["invoice_id"]
+    InvoicePaymentEvent.objects.bulk_create(
+        [
+            InvoicePaymentEvent(
+                idempotency_key=f"{invoice_id}:{payment_intent['id']}",
+                invoice_id=invoice_id,
+                payment_intent_id=payment_intent["id"],
+                amount=Decimal(payment_intent.get("amount_received") or 0) / 100,
+            )
+        ],
+        ignore_conflicts=True,
+    )
+    transaction.on_commit(settle_invoice_payments_task.delay)